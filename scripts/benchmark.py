@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Benchmark the conversion and validation hot paths on synthetic bundles.
+
+For each bundle size, a reproducible bundle is generated with
+``synth_bundle.generate_bundle`` (cached under ``--work-dir`` and reused while
+its parameters are unchanged), then these phases are timed:
+
+- ``read``      -- ``Path.read_text`` of every concept;
+- ``parse``     -- ``mif_convert.parse_markdown`` (YAML frontmatter + body split);
+- ``project``   -- ``md_to_jsonld`` plus JSON serialization of the projection;
+- ``roundtrip`` -- ``mif_convert.roundtrip_concept`` on the parsed concept;
+- ``validate``  -- a full ``okf_validate.validate_bundle`` run (``--jobs``).
+
+Per-concept phases are timed around the call only, so each phase's number is
+independent of the others. Results are written as JSON (with the git commit,
+Python version, YAML backend and core count) so runs can be compared across
+commits with ``--compare``.
+
+Usage::
+
+    python benchmark.py [--sizes 1000 10000 100000] [--seed 0] [--jobs N]
+        [--work-dir .bench] [--out bench.json]
+    python benchmark.py --compare before.json after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import mif_convert  # local module (same scripts/ directory)
+import okf_validate  # local module (same scripts/ directory)
+import synth_bundle  # local module (same scripts/ directory)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = [1000, 10000, 100000]
+PHASES = ["read", "parse", "project", "roundtrip", "validate"]
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def prepare_bundle(work_dir: Path, size: int, params: dict) -> Path:
+    """Return a bundle of ``size`` concepts for ``params``, generating it if needed."""
+    bundle = work_dir / f"bundle-{size}"
+    marker = bundle / ".synth-params.json"
+    wanted = json.dumps({"concepts": size, **params}, sort_keys=True)
+    if marker.exists() and marker.read_text() == wanted:
+        return bundle
+    if bundle.exists():
+        shutil.rmtree(bundle)
+    synth_bundle.generate_bundle(bundle, size, **params)
+    marker.write_text(wanted)
+    return bundle
+
+
+def time_phases(bundle: Path, jobs: int) -> dict[str, float]:
+    """Seconds spent in each phase over every concept of ``bundle``."""
+    totals = dict.fromkeys(PHASES, 0.0)
+    clock = time.perf_counter
+    for md_path in mif_convert.iter_concepts(bundle):
+        start = clock()
+        text = md_path.read_text()
+        totals["read"] += clock() - start
+
+        start = clock()
+        frontmatter, body = mif_convert.parse_markdown(text)
+        totals["parse"] += clock() - start
+
+        start = clock()
+        json.dumps(mif_convert.md_to_jsonld(frontmatter, body), indent=2, ensure_ascii=False)
+        totals["project"] += clock() - start
+
+        start = clock()
+        mif_convert.roundtrip_concept(frontmatter, body, md_path)
+        totals["roundtrip"] += clock() - start
+
+    start = clock()
+    okf_validate.validate_bundle(bundle, jobs=jobs)
+    totals["validate"] = clock() - start
+    return totals
+
+
+def run(sizes: list[int], work_dir: Path, jobs: int, params: dict) -> dict:
+    results = []
+    for size in sizes:
+        bundle = prepare_bundle(work_dir, size, params)
+        totals = time_phases(bundle, jobs)
+        for phase in PHASES:
+            seconds = totals[phase]
+            results.append(
+                {
+                    "size": size,
+                    "phase": phase,
+                    "seconds": round(seconds, 6),
+                    "perConceptUs": round(seconds / size * 1e6, 3),
+                }
+            )
+            print(f"  {size:>7}  {phase:<10} {seconds:10.3f}s  {seconds / size * 1e6:10.1f} us/concept")
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "python": platform.python_version(),
+            "yamlBackend": mif_convert.yaml_backend(),
+            "cpuCount": os.cpu_count(),
+            "jobs": jobs,
+            "bundle": params,
+        },
+        "results": results,
+    }
+
+
+def compare(before_path: Path, after_path: Path) -> int:
+    """Print per-(size, phase) timings of two result files and their ratio."""
+    before = json.loads(before_path.read_text())
+    after = json.loads(after_path.read_text())
+    old = {(r["size"], r["phase"]): r["seconds"] for r in before["results"]}
+    print(f"before: {before['meta'].get('commit')}  after: {after['meta'].get('commit')}")
+    print(f"  {'size':>7}  {'phase':<10} {'before':>10} {'after':>10} {'ratio':>7}")
+    for r in after["results"]:
+        key = (r["size"], r["phase"])
+        if key not in old:
+            continue
+        ratio = r["seconds"] / old[key] if old[key] else float("inf")
+        print(f"  {key[0]:>7}  {key[1]:<10} {old[key]:10.3f} {r['seconds']:10.3f} {ratio:7.2f}x")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MIF conversion and validation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fanout", type=int, default=3)
+    parser.add_argument("--derivation-ratio", type=float, default=0.3)
+    parser.add_argument("--body-median", type=int, default=1500)
+    parser.add_argument("--work-dir", type=Path, default=REPO_ROOT / ".bench")
+    parser.add_argument("--out", type=Path, default=None, help="write JSON results here")
+    parser.add_argument(
+        "--compare", nargs=2, type=Path, metavar=("BEFORE", "AFTER"), help="compare two results"
+    )
+    mif_convert.add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare))
+
+    params = {
+        "seed": args.seed,
+        "fanout": args.fanout,
+        "derivation_ratio": args.derivation_ratio,
+        "body_median": args.body_median,
+    }
+    print(f"Benchmarking sizes {args.sizes} (jobs={args.jobs}, yaml={mif_convert.yaml_backend()})")
+    report = run(args.sizes, args.work_dir, args.jobs, params)
+    text = json.dumps(report, indent=2) + "\n"
+    if args.out:
+        args.out.write_text(text)
+        print(f"Wrote {args.out}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
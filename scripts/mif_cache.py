@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Persistent per-concept validation cache for ``okf_validate.py``.
+
+An SQLite database (default ``.mif-cache/validate.db``) holds one row per
+concept path. A row is reused only when all of these still match:
+
+- the sha256 of the concept file's bytes;
+- the validator fingerprint (sha256 of the validator and converter sources,
+  so any change to a check invalidates every row);
+- the options fingerprint (settings that change per-concept results, e.g. the
+  active YAML backend).
+
+What is cached is the option-independent, *single-file* part of validation:
+the findings of checks (1), (3) and (5), the concept's frontmatter and its raw
+body link targets. The cross-file checks -- (4) broken links and (6) temporal
+consistency -- are always re-derived from those cached facts against the
+current bundle, so a row can never go stale because a *target* changed, was
+added or was deleted, and ``--strict-temporal`` can be toggled freely.
+
+Records are pickled, not JSON-encoded: YAML frontmatter may hold integer keys,
+dates or bytes, and a cached run must see exactly the values a fresh parse
+would. The database is local state written by this tool, like any build cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import sqlite3
+from pathlib import Path
+
+DEFAULT_PATH = Path(".mif-cache") / "validate.db"
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# Sources whose behaviour determines a cached record; editing any invalidates all rows.
+FINGERPRINT_SOURCES = ["okf_validate.py", "mif_convert.py", "mif_links.py", "mif_cache.py"]
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def validator_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for name in FINGERPRINT_SOURCES:
+        digest.update((SCRIPTS_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """Content-hash keyed store of per-concept validation records."""
+
+    def __init__(self, db_path: Path = DEFAULT_PATH, options: dict | None = None) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.validator = validator_fingerprint()
+        self.options = json.dumps(options or {}, sort_keys=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS concepts ("
+            " path TEXT PRIMARY KEY, sha256 TEXT NOT NULL, validator TEXT NOT NULL,"
+            " options TEXT NOT NULL, record BLOB NOT NULL)"
+        )
+        self._pending: list[tuple[str, str, str, str, bytes]] = []
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, sha256: str) -> dict | None:
+        """The cached record for ``path`` at content ``sha256``, or None."""
+        row = self._conn.execute(
+            "SELECT record FROM concepts"
+            " WHERE path = ? AND sha256 = ? AND validator = ? AND options = ?",
+            (str(path), sha256, self.validator, self.options),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, path: Path, sha256: str, record: dict) -> None:
+        """Queue ``record`` for ``path``; written on ``flush``."""
+        self._pending.append(
+            (str(path), sha256, self.validator, self.options, pickle.dumps(record))
+        )
+
+    def flush(self) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO concepts VALUES (?, ?, ?, ?, ?)", self._pending
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
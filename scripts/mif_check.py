@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Single-pass MIF bundle check: OKF conformance, round-trip, emission, schema.
+
+Replaces running ``okf_validate.py``, ``mif_convert.py roundtrip``,
+``mif_convert.py emit-jsonld`` and a per-file schema validator back to back.
+Each concept file is read and parsed exactly once, and in that one pass:
+
+- the OKF single-file checks run, including the lossless
+  ``markdown -> json-ld -> markdown`` round-trip (``okf_validate.check_concept``);
+- ``--yaml-parity`` compares the YAML backends on the file, as
+  ``mif_convert.py roundtrip --yaml-parity`` does;
+- the JSON-LD projection is built once, validated in memory against
+  the MIF schemas (``mif_schema.py``) and, with ``--out-dir``,
+  written to ``<out-dir>/<bundle-name>/...jsonld`` exactly as ``emit-jsonld``
+  would.
+
+The cross-file OKF checks (broken links, temporal consistency) then run over
+the bundle model (``okf_validate.bundle_findings``), so conformance findings
+are the same as ``okf_validate.py``'s. Per-concept work fans out over
+``--jobs`` processes; the report is identical to a ``--jobs 1`` run.
+
+Schema validation needs the optional ``jsonschema`` package with its format
+checkers (``jsonschema[format]``) and fails closed without them: a missing
+validator, or one that would pass any ``uri`` / ``date-time``, is an error,
+never a silent pass (``mif_schema.unusable_reason``). ``--no-schema`` skips the
+stage explicitly.
+
+Exit code 0 means every stage passed for every concept. ``--report <file>``
+also writes the combined report as JSON.
+
+Usage::
+
+    python mif_check.py <bundle-dir> [bundle-dir ...] [--strict-temporal]
+        [--yaml-parity] [--out-dir dist/jsonld] [--no-schema] [--jobs N]
+        [--report report.json] [--profile trace.json]
+    python mif_check.py            # defaults to examples/ + profiles/*/examples/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple
+
+import mif_convert  # local module (same scripts/ directory)
+import mif_profile  # local module (same scripts/ directory)
+import mif_schema  # local module (same scripts/ directory)
+import okf_validate  # local module (same scripts/ directory)
+from mif_profile import span
+
+STAGES = ["conformance", "yaml-parity", "schema"]
+
+
+class ConceptCheck(NamedTuple):
+    """Everything one pass over a concept produced (what a worker ships back)."""
+
+    okf: okf_validate.ConceptResult
+    parity: str | None
+    schema: list[str]
+    emitted: bool
+
+
+def check_concept(
+    md_path: Path, dest: Path | None, yaml_parity: bool = False, schema: bool = True
+) -> ConceptCheck:
+    """Parse ``md_path`` once and run every per-concept stage on it."""
+    concept = mif_convert.load_concept(md_path)
+    okf = okf_validate.check_concept(concept)
+    parity = None
+    if yaml_parity:
+        with span("yaml-parity", concept=md_path):
+            parity = mif_convert.yaml_parity_file(md_path)
+    if concept.error:
+        return ConceptCheck(okf, parity, [], False)
+
+    with span("project", concept=md_path):
+        jsonld = mif_convert.md_to_jsonld(concept.frontmatter, concept.body)
+    schema_findings: list[str] = []
+    if schema:
+        with span("schema", concept=md_path):
+            schema_findings = mif_schema.projection_errors(
+                jsonld, okf_validate.concept_label(md_path)
+            )
+    if dest is not None:
+        with span("write", concept=md_path):
+            data = json.dumps(jsonld, indent=2, ensure_ascii=False) + "\n"
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(data.encode("utf-8"))
+    return ConceptCheck(okf, parity, schema_findings, dest is not None)
+
+
+def _check_chunk(
+    items: list[tuple[Path, Path | None]], yaml_parity: bool = False, schema: bool = True
+) -> list[ConceptCheck]:
+    return [check_concept(md_path, dest, yaml_parity, schema) for md_path, dest in items]
+
+
+def check_bundle(
+    bundle: Path,
+    out_dir: Path | None = None,
+    strict_temporal: bool = False,
+    yaml_parity: bool = False,
+    schema: bool = True,
+    jobs: int = 1,
+) -> dict:
+    """Run every stage over one bundle. Returns its section of the combined report."""
+    items: list[tuple[Path, Path | None]] = []
+    for md_path in mif_convert.iter_concepts(bundle):
+        dest = None
+        if out_dir is not None:
+            dest = out_dir / bundle.name / md_path.relative_to(bundle).with_suffix(".jsonld")
+        items.append((md_path, dest))
+    worker = partial(_check_chunk, yaml_parity=yaml_parity, schema=schema)
+    checks = [check for chunk in mif_convert.map_chunks(worker, items, jobs) for check in chunk]
+    errors, warnings = okf_validate.bundle_findings(
+        [check.okf for check in checks], bundle, strict_temporal
+    )
+    return {
+        "bundle": str(okf_validate.concept_label(bundle)),
+        "concepts": len(checks),
+        "emitted": sum(check.emitted for check in checks),
+        "errors": {
+            "conformance": errors,
+            "yaml-parity": [check.parity for check in checks if check.parity],
+            "schema": [finding for check in checks for finding in check.schema],
+        },
+        "warnings": warnings,
+    }
+
+
+def _missing_bundle_section(bundle: Path) -> dict:
+    errors: dict[str, list[str]] = {stage: [] for stage in STAGES}
+    errors["conformance"].append(f"{bundle}: bundle directory not found")
+    return {"bundle": str(bundle), "concepts": 0, "emitted": 0, "errors": errors, "warnings": []}
+
+
+def format_report(sections: list[dict], schema: bool, yaml_parity: bool) -> str:
+    """Human-readable combined report (stage summary, then every finding)."""
+    total = sum(section["concepts"] for section in sections)
+    lines = [f"  {section['bundle']}: {section['concepts']} concept(s)" for section in sections]
+    for section in sections:
+        lines.extend(f"WARN  {warning}" for warning in section["warnings"])
+    lines.append(f"\nMIF check: {total} concept(s) in {len(sections)} bundle(s), parsed once each")
+    skipped = {"yaml-parity": not yaml_parity, "schema": not schema}
+    for stage in STAGES:
+        failures = [e for section in sections for e in section["errors"][stage]]
+        status = "skipped" if skipped.get(stage) else f"{len(failures)} error(s)" if failures else "PASS"
+        lines.append(f"  {stage:<12} {status}")
+    emitted = sum(section["emitted"] for section in sections)
+    if emitted:
+        lines.append(f"  {'emit':<12} {emitted} JSON-LD projection(s)")
+    for stage in STAGES:
+        for section in sections:
+            lines.extend(f"  ERROR [{stage}] {e}" for e in section["errors"][stage])
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Single-pass OKF conformance, round-trip, JSON-LD emission and schema check"
+    )
+    parser.add_argument(
+        "bundles", nargs="*", help="bundle directories (default: examples/ + profiles/*/examples/)"
+    )
+    parser.add_argument(
+        "--strict-temporal",
+        "--temporal-strict",
+        dest="strict_temporal",
+        action="store_true",
+        help="promote temporal-inconsistency findings from warnings to errors",
+    )
+    parser.add_argument(
+        "--yaml-parity", action="store_true", help="also compare the libyaml and Python YAML backends"
+    )
+    parser.add_argument("--out-dir", type=Path, help="also write JSON-LD projections here")
+    parser.add_argument(
+        "--no-schema", action="store_true", help="skip JSON Schema validation of the projections"
+    )
+    parser.add_argument("--report", type=Path, help="also write the combined report as JSON")
+    mif_convert.add_jobs_argument(parser)
+    mif_convert.add_profile_argument(parser)
+    args = parser.parse_args()
+
+    schema = not args.no_schema
+    reason = mif_schema.unusable_reason() if schema else None
+    if reason is not None:
+        # Fail closed: a missing validator must never read as a passing schema stage.
+        print(f"Error: schema stage: {reason}, or pass --no-schema", file=sys.stderr)
+        sys.exit(1)
+    if args.profile:
+        mif_profile.enable()
+    bundles = [Path(a) for a in args.bundles] if args.bundles else okf_validate.default_bundles()
+    if not bundles:
+        print("No bundles found to check.", file=sys.stderr)
+        sys.exit(1)
+
+    sections = []
+    for bundle in bundles:
+        bundle = bundle.resolve()
+        if not bundle.exists():
+            sections.append(_missing_bundle_section(bundle))
+            continue
+        sections.append(
+            check_bundle(
+                bundle,
+                out_dir=args.out_dir,
+                strict_temporal=args.strict_temporal,
+                yaml_parity=args.yaml_parity,
+                schema=schema,
+                jobs=args.jobs,
+            )
+        )
+
+    if args.profile:
+        mif_profile.finish(args.profile)
+    print(format_report(sections, schema, args.yaml_parity))
+    failed = any(section["errors"][stage] for section in sections for stage in STAGES)
+    if args.report:
+        args.report.write_text(
+            json.dumps({"passed": not failed, "bundles": sections}, indent=2) + "\n"
+        )
+    print("MIF check: FAILED" if failed else "MIF check: PASS (all stages)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
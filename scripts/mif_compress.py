@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Compression (spec section 5.6) over whole bundles, with a content-addressed archive.
+
+``compress`` streams a bundle and selects the concepts that meet the section
+5.6.2 criteria -- content longer than ``MIN_LINES`` lines AND either older than
+``MIN_AGE`` (from ``created``) or weaker than ``MAX_STRENGTH`` (decay strength,
+evaluated by ``mif_temporal.py``) -- and are not compressed yet. Each one:
+
+- has its original body written, compressed, to
+  ``<archive>/<sha256[:2]>/<sha256>.<codec>`` -- keyed by the body's sha256, so
+  identical bodies share one blob and a blob is never rewritten;
+- keeps its frontmatter ``summary`` as the new body, followed by its
+  ``## Relationships`` section so the body links still mirror the frontmatter
+  (Invariant 3);
+- is stamped ``compressedAt`` and records the blob as
+  ``extensions.original_content: {sha256, codec}`` (section 5.6.3).
+
+The summary is not generated here: a candidate without a ``summary``, or with
+one over ``SUMMARY_MAX`` characters (section 5.6.4), is reported and left alone.
+Blobs are zstd (``.zst``) when the optional ``zstandard`` package is installed,
+gzip (``.gz``) otherwise; ``--codec`` picks one explicitly.
+
+``restore`` reverses it for every compressed concept (or the given ones): the
+body is read back from the archive, checked against its sha256, and the
+``compressedAt`` / ``extensions.original_content`` markers are dropped. The
+``summary`` stays. The archive defaults to ``<bundle>/.mif-archive``, which
+holds no ``.md`` files and so is never mistaken for concepts.
+
+Usage::
+
+    python mif_compress.py compress <bundle-dir> [--archive DIR] [--as-of ISO]
+        [--codec gzip|zstd] [--dry-run] [--json] [--jobs N]
+    python mif_compress.py restore <bundle-dir> [CONCEPT.md ...] [--archive DIR]
+        [--json] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import zlib
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency; see available()
+    zstandard = None
+
+import mif_convert  # local module (same scripts/ directory)
+import mif_temporal  # local module (same scripts/ directory)
+from mif_profile import span
+
+ARCHIVE_NAME = ".mif-archive"
+MIN_LINES = 100
+MIN_AGE = 30 * 86400
+MAX_STRENGTH = 0.3
+SUMMARY_MAX = 500
+ORIGINAL_KEY = "original_content"
+CODECS = ("zstd", "gzip")
+SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+
+class Outcome(NamedTuple):
+    """What happened to one concept: ``status`` is the action or the skip reason."""
+
+    path: Path
+    status: str
+    sha256: str | None = None
+
+    def to_dict(self) -> dict:
+        return {"path": str(self.path), "status": self.status, "sha256": self.sha256}
+
+
+def available() -> bool:
+    """True when ``zstandard`` is importable (zstd blobs)."""
+    return zstandard is not None
+
+
+def default_codec() -> str:
+    return "zstd" if available() else "gzip"
+
+
+def blob_path(archive: Path, sha256: str, codec: str) -> Path:
+    return archive / sha256[:2] / (sha256 + SUFFIXES[codec])
+
+
+def _encode(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=19).compress(data)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _decode(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd blob but zstandard is not installed (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def store(archive: Path, content: str, codec: str) -> str:
+    """Archive ``content`` under its sha256 (written once, atomically). Returns the hash."""
+    data = content.encode("utf-8")
+    sha256 = hashlib.sha256(data).hexdigest()
+    path = blob_path(archive, sha256, codec)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(_encode(data, codec))
+        os.replace(tmp, path)
+    return sha256
+
+
+def fetch(archive: Path, sha256: str, codec: str) -> str:
+    """The archived content with this hash; ValueError if missing or corrupt."""
+    path = blob_path(archive, sha256, codec)
+    try:
+        data = _decode(path.read_bytes(), codec)
+    except (OSError, EOFError, zlib.error) as exc:
+        raise ValueError(f"cannot read archived content {path}: {exc}") from exc
+    if hashlib.sha256(data).hexdigest() != sha256:
+        raise ValueError(f"archived content {path} does not match its sha256")
+    return data.decode("utf-8")
+
+
+def _content_lines(body: str) -> int:
+    return len(body.strip().splitlines())
+
+
+def is_candidate(frontmatter: dict, body: str, strength: float, as_of: float) -> bool:
+    """Section 5.6.2: long content, and old or weak. Already-compressed concepts never are."""
+    if frontmatter.get("compressedAt") is not None or _content_lines(body) <= MIN_LINES:
+        return False
+    created = mif_temporal.parse_instant(frontmatter.get("created"))
+    return (created is not None and as_of - created > MIN_AGE) or strength < MAX_STRENGTH
+
+
+def _relationships_block(body: str) -> str:
+    """The body's ``## Relationships`` section (heading included), or ''."""
+    lines, keep = [], False
+    for line in body.splitlines():
+        if line.strip().startswith("## "):
+            keep = line.strip()[3:].strip().lower() == "relationships"
+        if keep:
+            lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def compressed_body(summary: str, body: str) -> str:
+    return "\n\n".join(filter(None, [summary.strip(), _relationships_block(body)])) + "\n"
+
+
+def _compress_chunk(
+    md_paths: list[Path], archive: Path, as_of: float, codec: str, dry_run: bool
+) -> list[Outcome]:
+    """Worker: select and compress the candidates of a chunk."""
+    concepts = [c for c in map(mif_convert.load_concept, md_paths) if not c.error]
+    strengths = mif_temporal.FreshnessTable.from_concepts(concepts).strengths(as_of)
+    outcomes = []
+    for concept, strength in zip(concepts, strengths):
+        frontmatter, body = concept.frontmatter, concept.body
+        if not is_candidate(frontmatter, body, float(strength), as_of):
+            continue
+        summary = frontmatter.get("summary")
+        if not isinstance(summary, str) or not summary.strip():
+            outcomes.append(Outcome(concept.path, "no-summary"))
+            continue
+        if len(summary) > SUMMARY_MAX:
+            outcomes.append(Outcome(concept.path, "summary-too-long"))
+            continue
+        if dry_run:
+            outcomes.append(Outcome(concept.path, "candidate"))
+            continue
+        with span("compress", concept=concept.path):
+            sha256 = store(archive, body, codec)
+            extensions = frontmatter.get("extensions")
+            if not isinstance(extensions, dict):
+                extensions = frontmatter["extensions"] = {}
+            extensions[ORIGINAL_KEY] = {"sha256": sha256, "codec": codec}
+            frontmatter["compressedAt"] = (
+                datetime.fromtimestamp(as_of, timezone.utc).isoformat().replace("+00:00", "Z")
+            )
+            concept.path.write_text(
+                mif_convert.serialize_markdown(frontmatter, compressed_body(summary, body))
+            )
+        outcomes.append(Outcome(concept.path, "compressed", sha256))
+    return outcomes
+
+
+def compress(
+    bundle: Path,
+    archive: Path | None = None,
+    as_of: datetime | float | None = None,
+    codec: str | None = None,
+    dry_run: bool = False,
+    jobs: int = 1,
+) -> list[Outcome]:
+    """Compress every candidate concept of ``bundle``; outcomes in path order."""
+    if as_of is None:
+        as_of = datetime.now(timezone.utc)
+    if not isinstance(as_of, (int, float)):
+        as_of = mif_temporal.parse_instant(as_of)
+    worker = partial(
+        _compress_chunk,
+        archive=archive or bundle / ARCHIVE_NAME,
+        as_of=as_of,
+        codec=codec or default_codec(),
+        dry_run=dry_run,
+    )
+    md_paths = list(mif_convert.iter_concepts(bundle))
+    return [o for chunk in mif_convert.map_chunks(worker, md_paths, jobs) for o in chunk]
+
+
+def _restore_chunk(md_paths: list[Path], archive: Path) -> list[Outcome]:
+    """Worker: put archived bodies back into the compressed concepts of a chunk."""
+    outcomes = []
+    for md_path in md_paths:
+        concept = mif_convert.load_concept(md_path)
+        extensions = concept.frontmatter.get("extensions")
+        pointer = extensions.get(ORIGINAL_KEY) if isinstance(extensions, dict) else None
+        if concept.error or not isinstance(pointer, dict):
+            continue
+        with span("restore", concept=md_path):
+            try:
+                body = fetch(archive, str(pointer.get("sha256")), str(pointer.get("codec", "gzip")))
+            except (KeyError, ValueError) as exc:
+                outcomes.append(Outcome(md_path, f"error: {exc}"))
+                continue
+            frontmatter = concept.frontmatter
+            del extensions[ORIGINAL_KEY]
+            if not extensions:
+                del frontmatter["extensions"]
+            frontmatter.pop("compressedAt", None)
+            md_path.write_text(mif_convert.serialize_markdown(frontmatter, body))
+        outcomes.append(Outcome(md_path, "restored", pointer.get("sha256")))
+    return outcomes
+
+
+def restore(
+    bundle: Path, archive: Path | None = None, paths: list[Path] | None = None, jobs: int = 1
+) -> list[Outcome]:
+    """Restore compressed concepts of ``bundle`` (all, or ``paths``); outcomes in order."""
+    md_paths = sorted(paths) if paths else list(mif_convert.iter_concepts(bundle))
+    worker = partial(_restore_chunk, archive=archive or bundle / ARCHIVE_NAME)
+    return [o for chunk in mif_convert.map_chunks(worker, md_paths, jobs) for o in chunk]
+
+
+def _as_of_argument(value: str) -> datetime:
+    instant = mif_temporal.parse_instant(value)
+    if instant is None:
+        raise argparse.ArgumentTypeError(f"not an ISO-8601 date/datetime: {value!r}")
+    return datetime.fromtimestamp(instant, timezone.utc)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compress / restore MIF concepts (spec 5.6)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("compress", help="replace long, old or weak bodies by their summary")
+    p.add_argument("bundle", type=Path, help="bundle directory")
+    p.add_argument(
+        "--as-of", type=_as_of_argument, help="evaluate age / strength at this instant (default: now)"
+    )
+    p.add_argument("--codec", choices=CODECS, help="blob compression (default: zstd if installed)")
+    p.add_argument("--dry-run", action="store_true", help="only list what would be compressed")
+
+    r = sub.add_parser("restore", help="put archived bodies back")
+    r.add_argument("bundle", type=Path, help="bundle directory")
+    r.add_argument("concepts", type=Path, nargs="*", help="only these concept files")
+    for q in (p, r):
+        q.add_argument("--archive", type=Path, help=f"archive directory (default: <bundle>/{ARCHIVE_NAME})")
+        q.add_argument("--json", action="store_true", help="print the outcomes as JSON")
+        mif_convert.add_jobs_argument(q)
+    args = parser.parse_args()
+
+    if not args.bundle.is_dir():
+        print(f"Error: {args.bundle} is not a directory", file=sys.stderr)
+        sys.exit(1)
+    if args.command == "compress":
+        if args.codec == "zstd" and not available():
+            print("Error: zstandard not installed (install: pip install zstandard)", file=sys.stderr)
+            sys.exit(1)
+        outcomes = compress(
+            args.bundle, args.archive, args.as_of, args.codec, dry_run=args.dry_run, jobs=args.jobs
+        )
+    else:
+        outcomes = restore(args.bundle, args.archive, args.concepts, jobs=args.jobs)
+
+    if args.json:
+        print(json.dumps([o.to_dict() for o in outcomes], indent=2))
+    else:
+        for outcome in outcomes:
+            print(f"{outcome.status:<16}  {outcome.path}")
+    done = sum(o.status in ("compressed", "restored", "candidate") for o in outcomes)
+    failed = sum(o.status.startswith("error") for o in outcomes)
+    if args.command == "compress":
+        verb = "would be compressed" if args.dry_run else "compressed"
+        summary = f"{verb}, {len(outcomes) - done} skipped (no usable summary)"
+    else:
+        summary = f"restored, {failed} failed"
+    print(f"{args.command.capitalize()}: {done} concept(s) {summary}", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
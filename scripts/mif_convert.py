@@ -18,19 +18,57 @@ Usage::
 
     python mif_convert.py to-jsonld <concept.md> [out.jsonld]
     python mif_convert.py to-markdown <concept.jsonld> [out.md]
-    python mif_convert.py roundtrip <bundle-dir> [bundle-dir ...]
-    python mif_convert.py emit-jsonld <bundle-dir> --out-dir jsonld
+    python mif_convert.py roundtrip <bundle-dir> [bundle-dir ...] [--jobs N] [--yaml-parity]
+    python mif_convert.py emit-jsonld <bundle-dir> --out-dir jsonld [--jobs N] [--incremental]
+    python mif_convert.py export <bundle-dir> [bundle-dir ...] [-o out.ndjson] [--graph]
+    python mif_convert.py import <in.ndjson | -> --out-dir <bundle-dir>
+
+``roundtrip`` and ``emit-jsonld`` fan per-concept work out to a process pool
+(``--jobs``, default: one worker per core); results are merged back in path
+order, so output is byte-identical to a serial (``--jobs 1``) run.
+
+``emit-jsonld --incremental`` keeps a manifest (``.mif-manifest.json``) in the
+output directory recording, per bundle and projection, its source path, the
+sha256 of the source ``.md``, the sha256 of this converter script and the
+sha256 of the output. Only new or changed concepts (or all of them, after any
+edit to the converter) are re-projected. A projection is deleted only when its
+bundle is part of the run and its source disappeared from it; entries of other
+bundles emitted into the same directory are left alone.
+
+YAML is parsed and dumped with libyaml's ``CSafeLoader``/``CSafeDumper`` when
+PyYAML was built with it, else with the pure-Python safe loader/dumper
+(``MIF_YAML_BACKEND=python`` forces the latter; an unknown or unavailable value
+warns and keeps the default). ``roundtrip --yaml-parity`` additionally asserts
+both backends produce byte-identical canonical markdown for every concept, so
+Invariant 4 holds whichever backend is active.
+
+``--profile <file>`` on the bundle commands records a span per conversion
+phase (read, parse, project, write, round-trip) per concept and writes them as
+Chrome trace-event JSON, plus a per-phase summary table on stderr (see
+``mif_profile.py``).
+
+``export`` streams every projection as one line of newline-delimited JSON to a
+single file (or stdout), each carrying its bundle-relative ``path``; with
+``--graph`` the same lines are wrapped in one JSON-LD ``@graph`` document (one
+node per line). ``import`` streams either form back through ``jsonld_to_md`` /
+``serialize_markdown`` into a bundle tree. Both hold at most a bounded window of
+concepts in memory, regardless of bundle size.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, Iterator, NamedTuple
 
 try:
     import yaml
@@ -38,7 +76,23 @@ except ImportError:  # pragma: no cover - environment guard
     print("Error: PyYAML required. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+import mif_profile  # local module (same scripts/ directory)
+from mif_profile import span
+
 CONTEXT_URL = "https://mif-spec.dev/schema/context.jsonld"
+MANIFEST_NAME = ".mif-manifest.json"
+# Upper bound on concepts per worker chunk; with the bounded in-flight window in
+# map_chunks this caps how many concepts are held in memory at once.
+CHUNK_MAX = 64
+# Bundle-relative source path carried on each exported projection (not a
+# JSON-LD term; ignored by jsonld_to_md and by JSON-LD processors).
+EXPORT_PATH_KEY = "path"
+GRAPH_HEAD = '{"@context": "%s", "@graph": [' % CONTEXT_URL
+GRAPH_TAIL = "]}"
+# name -> (Loader, Dumper). Both are safe; libyaml's are several times faster.
+YAML_BACKENDS: dict[str, tuple[type, type]] = {"python": (yaml.SafeLoader, yaml.SafeDumper)}
+if getattr(yaml, "__with_libyaml__", False):
+    YAML_BACKENDS["libyaml"] = (yaml.CSafeLoader, yaml.CSafeDumper)
 FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n?(.*)$", re.DOTALL)
 RESERVED_FILENAMES = {"index.md", "log.md"}
 
@@ -82,15 +136,95 @@ def stringify_datetimes(obj: Any) -> Any:
     return obj
 
 
+def set_yaml_backend(name: str) -> str:
+    """Select the YAML backend (``libyaml`` or ``python``); return the previous one."""
+    global _yaml_backend
+    if name not in YAML_BACKENDS:
+        raise ValueError(
+            f"YAML backend {name!r} unavailable (have: {', '.join(sorted(YAML_BACKENDS))})"
+        )
+    previous, _yaml_backend = _yaml_backend, name
+    return previous
+
+
+def yaml_backend() -> str:
+    """Name of the active YAML backend."""
+    return _yaml_backend
+
+
+_yaml_backend = "libyaml" if "libyaml" in YAML_BACKENDS else "python"
+if os.environ.get("MIF_YAML_BACKEND"):
+    # An unknown/unavailable backend must not kill every importing script.
+    try:
+        set_yaml_backend(os.environ["MIF_YAML_BACKEND"])
+    except ValueError as exc:
+        print(f"Warning: MIF_YAML_BACKEND: {exc}; using {_yaml_backend}", file=sys.stderr)
+
+
+def _load_frontmatter_yaml(yaml_text: str) -> Any:
+    frontmatter = yaml.load(yaml_text, Loader=YAML_BACKENDS[_yaml_backend][0]) or {}
+    return stringify_datetimes(frontmatter)
+
+
 def parse_markdown(md_text: str) -> tuple[dict, str]:
     """Split a concept file into (frontmatter dict, body str)."""
     match = FRONTMATTER_RE.match(md_text)
     if not match:
         raise ValueError("No YAML frontmatter found")
-    frontmatter = yaml.safe_load(match.group(1)) or {}
-    frontmatter = stringify_datetimes(frontmatter)
-    body = match.group(2)
-    return frontmatter, body
+    return _load_frontmatter_yaml(match.group(1)), match.group(2)
+
+
+class LazyBody:
+    """Handle to a concept body that is read from disk only on ``read()``.
+
+    ``head`` is any text that shared the closing ``---`` line; the rest of the
+    body starts at ``offset`` (a text-mode ``tell()`` position).
+    """
+
+    __slots__ = ("path", "offset", "head")
+
+    def __init__(self, path: Path, offset: int, head: str = "") -> None:
+        self.path = path
+        self.offset = offset
+        self.head = head
+
+    def read(self) -> str:
+        with open(self.path) as f:
+            f.seek(self.offset)
+            return self.head + f.read()
+
+    def __repr__(self) -> str:
+        return f"LazyBody({str(self.path)!r}, offset={self.offset})"
+
+
+def read_frontmatter(md_path: Path) -> tuple[str, LazyBody]:
+    """Read a concept file only up to its closing ``---``.
+
+    Returns (frontmatter YAML text, lazy body handle) with exactly the split
+    ``FRONTMATTER_RE`` makes on the whole file, but without reading (or
+    copying) the body. Raises ``ValueError`` when there is no frontmatter.
+    """
+    with open(md_path) as f:
+        if f.readline() != "---\n":
+            raise ValueError("No YAML frontmatter found")
+        lines: list[str] = []
+        while True:
+            line = f.readline()
+            if not line:
+                raise ValueError("No YAML frontmatter found")
+            # The opening line's newline is consumed, so the earliest possible
+            # close ("\n---") is the second line after it.
+            if lines and line.startswith("---"):
+                break
+            lines.append(line)
+        head = line[3:]
+        return "".join(lines)[:-1], LazyBody(md_path, f.tell(), head[1:] if head[:1] == "\n" else head)
+
+
+def load_frontmatter(md_path: Path) -> tuple[dict, LazyBody]:
+    """``parse_markdown`` for callers that never touch the body: (frontmatter, lazy body)."""
+    yaml_text, body = read_frontmatter(md_path)
+    return _load_frontmatter_yaml(yaml_text), body
 
 
 def _ordered_frontmatter(frontmatter: dict) -> dict:
@@ -108,8 +242,12 @@ def _ordered_frontmatter(frontmatter: dict) -> dict:
 def serialize_markdown(frontmatter: dict, body: str) -> str:
     """Serialize frontmatter + body back into a concept file (canonical form)."""
     fm = _ordered_frontmatter(stringify_datetimes(frontmatter))
-    yaml_text = yaml.safe_dump(
-        fm, sort_keys=False, allow_unicode=True, default_flow_style=False
+    yaml_text = yaml.dump(
+        fm,
+        Dumper=YAML_BACKENDS[_yaml_backend][1],
+        sort_keys=False,
+        allow_unicode=True,
+        default_flow_style=False,
     ).strip()
     body = body.lstrip("\n").rstrip() + "\n"
     return f"---\n{yaml_text}\n---\n\n{body}"
@@ -209,8 +347,16 @@ def normalize(md_text: str) -> str:
 
 def roundtrip_file(md_path: Path) -> str | None:
     """Return an error string if md -> jsonld -> md is not lossless, else None."""
-    original = md_path.read_text()
-    frontmatter, body = parse_markdown(original)
+    with span("read", concept=md_path):
+        text = md_path.read_text()
+    with span("parse", concept=md_path):
+        frontmatter, body = parse_markdown(text)
+    with span("round-trip", concept=md_path):
+        return roundtrip_concept(frontmatter, body, md_path)
+
+
+def roundtrip_concept(frontmatter: dict, body: str, md_path: Path) -> str | None:
+    """``roundtrip_file`` for an already-parsed concept (no re-read, no re-parse)."""
     jsonld = md_to_jsonld(frontmatter, body)
     # Serialize and re-parse the JSON-LD to mimic a real on-disk projection.
     jsonld = json.loads(json.dumps(jsonld))
@@ -230,16 +376,157 @@ def iter_concepts(bundle: Path):
         yield md_path
 
 
-def cmd_roundtrip(bundles: list[Path]) -> int:
-    total = 0
+class Concept(NamedTuple):
+    """One concept file, parsed once: the unit every bundle-level check reads.
+
+    ``error`` is set (with empty ``frontmatter``/``body``) when the file has no
+    parseable frontmatter, so a bundle model still accounts for every path.
+    """
+
+    path: Path
+    frontmatter: dict
+    body: str
+    created: Any = None
+    error: str | None = None
+
+
+def load_concept(md_path: Path, with_body: bool = True) -> Concept:
+    """Read and parse one concept file into a :class:`Concept`.
+
+    ``with_body=False`` reads only the frontmatter (``body`` is left empty), for
+    lookups that need nothing past the closing ``---``.
+    """
+    try:
+        if with_body:
+            with span("read", concept=md_path):
+                text = md_path.read_text()
+            with span("parse", concept=md_path):
+                frontmatter, body = parse_markdown(text)
+        else:
+            with span("parse-frontmatter", concept=md_path):
+                frontmatter, body = load_frontmatter(md_path)[0], ""
+    except (ValueError, yaml.YAMLError) as exc:
+        return Concept(md_path, {}, "", error=str(exc))
+    if not isinstance(frontmatter, dict):
+        return Concept(md_path, {}, "", error="YAML frontmatter is not a mapping")
+    return Concept(md_path, frontmatter, body, frontmatter.get("created"))
+
+
+def load_bundle(bundle: Path) -> dict[Path, Concept]:
+    """Parse every concept in ``bundle`` exactly once.
+
+    Keys are resolved paths (so link/derivation targets can be looked up after
+    ``_resolve``); iteration order is ``iter_concepts`` order.
+    """
+    return {md_path.resolve(): load_concept(md_path) for md_path in iter_concepts(bundle)}
+
+
+def default_jobs() -> int:
+    """Default worker count for ``--jobs``: one per available core."""
+    return os.cpu_count() or 1
+
+
+def map_chunks(func: Callable[[list], Any], items: list, jobs: int) -> Iterator[Any]:
+    """Apply ``func`` to successive chunks of ``items``; yield results in input order.
+
+    With ``jobs > 1`` the chunks run in a process pool (``func`` must be picklable,
+    i.e. a module-level function or a ``functools.partial`` of one). Several
+    chunks per worker keep the pool busy when per-concept cost is uneven. At most
+    ``2 * jobs`` chunks of at most ``CHUNK_MAX`` items are in flight, so a
+    streaming consumer holds a bounded number of results. ``jobs <= 1`` runs
+    the same chunks in-process.
+    """
+    size = min(CHUNK_MAX, max(1, -(-len(items) // (max(jobs, 1) * 4))))
+    chunks = (items[i : i + size] for i in range(0, len(items), size))
+    if jobs <= 1 or len(items) <= size:
+        yield from map(func, chunks)
+        return
+    traced = mif_profile.enabled()
+    task = partial(mif_profile.call_traced, func) if traced else func
+
+    def collect(future: Any) -> Any:
+        if not traced:
+            return future.result()
+        result, events = future.result()
+        mif_profile.absorb(events)
+        return result
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(task, chunk))
+            if len(pending) >= 2 * jobs:
+                yield collect(pending.popleft())
+        while pending:
+            yield collect(pending.popleft())
+
+
+def yaml_parity_file(md_path: Path) -> str | None:
+    """Return an error string if the YAML backends disagree on ``md_path``, else None.
+
+    Every available backend must parse the file to the same frontmatter and
+    serialize it to byte-identical canonical markdown.
+    """
+    text = md_path.read_text()
+    outputs: dict[str, tuple[dict, str]] = {}
+    previous = _yaml_backend
+    try:
+        for name in YAML_BACKENDS:
+            set_yaml_backend(name)
+            frontmatter, body = parse_markdown(text)
+            outputs[name] = (frontmatter, serialize_markdown(frontmatter, body))
+    finally:
+        set_yaml_backend(previous)
+    if len({json.dumps(fm, sort_keys=True, default=str) for fm, _ in outputs.values()}) > 1:
+        return f"YAML backend parity: frontmatter differs in {md_path}"
+    if len({md for _, md in outputs.values()}) > 1:
+        return f"YAML backend parity: canonical markdown differs in {md_path}"
+    return None
+
+
+def _roundtrip_chunk(md_paths: list[Path], yaml_parity: bool = False) -> list[str]:
+    """Worker: round-trip (and optional YAML-parity) errors for a chunk of files."""
+    errors = [err for err in map(roundtrip_file, md_paths) if err]
+    if yaml_parity:
+        errors.extend(err for err in map(yaml_parity_file, md_paths) if err)
+    return errors
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _emit_chunk(pairs: list[tuple[Path, Path]]) -> list[str]:
+    """Worker: write the JSON-LD projection for each (source, dest) pair.
+
+    Returns the sha256 of each written projection, in ``pairs`` order.
+    """
+    digests = []
+    for md_path, dest in pairs:
+        with span("read", concept=md_path):
+            text = md_path.read_text()
+        with span("parse", concept=md_path):
+            frontmatter, body = parse_markdown(text)
+        with span("project", concept=md_path):
+            jsonld = md_to_jsonld(frontmatter, body)
+            data = (json.dumps(jsonld, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+        with span("write", concept=md_path):
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(data)
+        digests.append(_sha256(data))
+    return digests
+
+
+def cmd_roundtrip(bundles: list[Path], jobs: int = 1, yaml_parity: bool = False) -> int:
+    md_paths = [md_path for bundle in bundles for md_path in iter_concepts(bundle)]
+    total = len(md_paths)
     errors: list[str] = []
-    for bundle in bundles:
-        for md_path in iter_concepts(bundle):
-            total += 1
-            err = roundtrip_file(md_path)
-            if err:
-                errors.append(err)
+    worker = partial(_roundtrip_chunk, yaml_parity=yaml_parity)
+    for chunk_errors in map_chunks(worker, md_paths, jobs):
+        errors.extend(chunk_errors)
     print(f"Round-trip: tested {total} concept(s) across {len(bundles)} bundle(s)")
+    if yaml_parity:
+        print(f"YAML backend parity: compared {', '.join(YAML_BACKENDS)}")
     if errors:
         print("ROUND-TRIP FAILED:")
         for err in errors:
@@ -273,21 +560,268 @@ def cmd_to_markdown(src: Path, out: Path | None) -> int:
     return 0
 
 
-def cmd_emit_jsonld(bundles: list[Path], out_dir: Path) -> int:
-    count = 0
-    for bundle in bundles:
-        for md_path in iter_concepts(bundle):
-            frontmatter, body = parse_markdown(md_path.read_text())
+@lru_cache(maxsize=None)
+def converter_sha256() -> str:
+    """Hash of this script; projections made by any other converter are stale."""
+    return _sha256(Path(__file__).read_bytes())
+
+
+def load_manifest(out_dir: Path) -> dict[str, dict[str, dict]]:
+    """Read the incremental-emit manifest: {bundle: {projection path: entry}}.
+
+    Missing/corrupt (or pre-bundle-keyed) manifests read as {}."""
+    try:
+        data = json.loads((out_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    bundles = data.get("bundles") if isinstance(data, dict) else None
+    if not isinstance(bundles, dict):
+        return {}
+    return {name: entries for name, entries in bundles.items() if isinstance(entries, dict)}
+
+
+def write_manifest(out_dir: Path, bundles: dict[str, dict[str, dict]]) -> None:
+    """Atomically replace the incremental-emit manifest."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = out_dir / f"{MANIFEST_NAME}.tmp"
+    data = {name: dict(sorted(entries.items())) for name, entries in sorted(bundles.items())}
+    tmp.write_text(json.dumps({"bundles": data}, indent=2) + "\n")
+    os.replace(tmp, out_dir / MANIFEST_NAME)
+
+
+def _is_current(entry: dict | None, md_path: Path, source_sha: str, dest: Path) -> bool:
+    """True when a manifest entry still describes ``dest`` for this source + converter."""
+    if not entry or entry.get("converterSha256") != converter_sha256():
+        return False
+    if entry.get("source") != md_path.as_posix() or entry.get("sourceSha256") != source_sha:
+        return False
+    try:
+        return _sha256(dest.read_bytes()) == entry.get("outputSha256")
+    except OSError:
+        return False
+
+
+def _projection_path(out_dir: Path, bundle: Path, md_path: Path) -> Path:
+    return out_dir / bundle.name / md_path.relative_to(bundle).with_suffix(".jsonld")
+
+
+def cmd_emit_jsonld(
+    bundles: list[Path], out_dir: Path, jobs: int = 1, incremental: bool = False
+) -> int:
+    pairs = [
+        (bundle, md_path, _projection_path(out_dir, bundle, md_path))
+        for bundle in bundles
+        for md_path in iter_concepts(bundle)
+    ]
+    if not incremental:
+        dests = [(md_path, dest) for _, md_path, dest in pairs]
+        count = sum(len(digests) for digests in map_chunks(_emit_chunk, dests, jobs))
+        print(f"Emitted {count} JSON-LD projection(s) to {out_dir}")
+        return 0
+
+    # Keyed by bundle: bundles emitted into out_dir by other runs keep their
+    # entries (and projections) untouched.
+    manifest = load_manifest(out_dir)
+    previous = {bundle.as_posix(): manifest.pop(bundle.as_posix(), {}) for bundle in bundles}
+    stale: list[tuple[Path, Path]] = []
+    stale_keys: list[tuple[str, str, str]] = []
+    # Bundles sharing a name write the same projection paths; those are always
+    # re-emitted in order so the last one wins, as in a full emit.
+    shared = {dest for dest, count in Counter(dest for _, _, dest in pairs).items() if count > 1}
+    for bundle, md_path, dest in pairs:
+        bundle_key, key = bundle.as_posix(), dest.relative_to(out_dir).as_posix()
+        entries = manifest.setdefault(bundle_key, {})
+        with span("hash", concept=md_path):
+            source_sha = _sha256(md_path.read_bytes())
+            current = dest not in shared and _is_current(
+                previous[bundle_key].get(key), md_path, source_sha, dest
+            )
+        if current:
+            entries[key] = previous[bundle_key][key]
+        else:
+            stale.append((md_path, dest))
+            stale_keys.append((bundle_key, key, source_sha))
+
+    digests = [d for chunk in map_chunks(_emit_chunk, stale, jobs) for d in chunk]
+    for (md_path, _), (bundle_key, key, source_sha), output_sha in zip(stale, stale_keys, digests):
+        manifest[bundle_key][key] = {
+            "source": md_path.as_posix(),
+            "sourceSha256": source_sha,
+            "converterSha256": converter_sha256(),
+            "outputSha256": output_sha,
+        }
+
+    # Only projections of this run's bundles whose source is gone are deleted,
+    # and never one another bundle still maps to.
+    live = {key for entries in manifest.values() for key in entries}
+    removed = 0
+    for entries in previous.values():
+        for key in sorted(set(entries) - live):
+            try:
+                (out_dir / key).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+    write_manifest(out_dir, manifest)
+    print(
+        f"Emitted {len(stale)} JSON-LD projection(s) to {out_dir} "
+        f"({len(pairs) - len(stale)} unchanged, {removed} removed)"
+    )
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    jobs = int(value)
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return jobs
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``-j/--jobs N`` option (default: one worker per core)."""
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=default_jobs(),
+        help="worker processes for per-concept work (default: number of cores)",
+    )
+
+
+def _export_chunk(items: list[tuple[Path, str]], graph: bool = False) -> list[str]:
+    """Worker: one compact JSON line per (source, bundle-relative path) pair."""
+    lines = []
+    for md_path, rel in items:
+        with span("read", concept=md_path):
+            text = md_path.read_text()
+        with span("parse", concept=md_path):
+            frontmatter, body = parse_markdown(text)
+        with span("project", concept=md_path):
             jsonld = md_to_jsonld(frontmatter, body)
-            rel = md_path.relative_to(bundle).with_suffix(".jsonld")
-            dest = out_dir / bundle.name / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(json.dumps(jsonld, indent=2, ensure_ascii=False) + "\n")
+            if graph:
+                del jsonld["@context"]  # carried once by the @graph envelope
+            jsonld[EXPORT_PATH_KEY] = rel
+            lines.append(json.dumps(jsonld, ensure_ascii=False))
+    return lines
+
+
+def export_bundles(
+    bundles: list[Path], out: IO[str], jobs: int = 1, graph: bool = False
+) -> int:
+    """Stream every concept's projection to ``out``; return the concept count.
+
+    NDJSON by default (one projection per line); ``graph`` wraps the same lines,
+    comma-separated, in a single JSON-LD ``@graph`` document.
+    """
+    items = [
+        (md_path, f"{bundle.name}/{md_path.relative_to(bundle).as_posix()}")
+        for bundle in bundles
+        for md_path in iter_concepts(bundle)
+    ]
+    if graph:
+        out.write(GRAPH_HEAD + "\n")
+    count = 0
+    for lines in map_chunks(partial(_export_chunk, graph=graph), items, jobs):
+        for line in lines:
+            if graph and count:
+                out.write(",\n")
+            out.write(line if graph else line + "\n")
             count += 1
-    print(f"Emitted {count} JSON-LD projection(s) to {out_dir}")
+    if graph:
+        out.write(("\n" if count else "") + GRAPH_TAIL + "\n")
+    return count
+
+
+def iter_projections(stream: IO[str]) -> Iterator[dict]:
+    """Yield projections from an NDJSON stream or an exported ``@graph`` document.
+
+    A ``@graph`` document in the one-node-per-line layout written by ``export``
+    is streamed line by line; any other ``@graph`` document is loaded whole.
+    """
+    first = stream.readline()
+    while first and not first.strip():
+        first = stream.readline()
+    if not first:
+        return
+    if first.strip() == GRAPH_HEAD:
+        for line in stream:
+            line = line.strip().removesuffix(",")
+            if line == GRAPH_TAIL:
+                return
+            if line:
+                yield json.loads(line)
+        raise ValueError("truncated @graph document (missing closing ']}')")
+    try:
+        record = json.loads(first)
+    except ValueError:
+        # Not line-delimited: a pretty-printed / foreign JSON-LD document.
+        document = json.loads(first + stream.read())
+        yield from document.get("@graph", [document])
+        return
+    yield record
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _import_dest(record: dict, out_dir: Path, index: int) -> Path:
+    """Destination for an imported projection, confined to ``out_dir``."""
+    rel = record.get(EXPORT_PATH_KEY)
+    if not rel:
+        ident = str(record.get("@id", "")).removeprefix("urn:mif:") or f"concept-{index}"
+        rel = f"{ident}.md"
+    rel_path = Path(rel)
+    if rel_path.is_absolute() or ".." in rel_path.parts or rel_path.suffix != ".md":
+        raise ValueError(f"refusing to import to unsafe path {rel!r}")
+    return out_dir / rel_path
+
+
+def import_projections(stream: IO[str], out_dir: Path) -> int:
+    """Write each streamed projection back to canonical markdown under ``out_dir``."""
+    count = 0
+    for count, record in enumerate(iter_projections(stream), start=1):
+        dest = _import_dest(record, out_dir, count)
+        fm, body = jsonld_to_md(record)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(serialize_markdown(fm, body))
+    return count
+
+
+def cmd_export(bundles: list[Path], output: str, jobs: int = 1, graph: bool = False) -> int:
+    if output == "-":
+        count = export_bundles(bundles, sys.stdout, jobs, graph)
+    else:
+        with open(output, "w", encoding="utf-8") as out:
+            count = export_bundles(bundles, out, jobs, graph)
+    print(f"Exported {count} concept(s) to {output if output != '-' else 'stdout'}", file=sys.stderr)
+    return 0
+
+
+def cmd_import(source: str, out_dir: Path) -> int:
+    try:
+        if source == "-":
+            count = import_projections(sys.stdin, out_dir)
+        else:
+            with open(source, encoding="utf-8") as stream:
+                count = import_projections(stream, out_dir)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    print(f"Imported {count} concept(s) into {out_dir}", file=sys.stderr)
     return 0
 
 
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--profile <file>`` option (Chrome trace-event JSON output)."""
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="record per-phase spans; write a Chrome trace to FILE and a summary to stderr",
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="MIF v1.0 markdown <-> JSON-LD")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -302,21 +836,57 @@ def main() -> None:
 
     p_r = sub.add_parser("roundtrip", help="Assert lossless round-trip over bundles")
     p_r.add_argument("bundles", nargs="+")
+    p_r.add_argument(
+        "--yaml-parity",
+        action="store_true",
+        help="also assert libyaml and pure-Python YAML give byte-identical output",
+    )
+    add_jobs_argument(p_r)
 
     p_e = sub.add_parser("emit-jsonld", help="Emit derived JSON-LD projections")
     p_e.add_argument("bundles", nargs="+")
     p_e.add_argument("--out-dir", default="jsonld")
+    p_e.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"re-project only new/changed concepts, tracked in <out-dir>/{MANIFEST_NAME}",
+    )
+    add_jobs_argument(p_e)
+
+    p_x = sub.add_parser("export", help="Stream projections as NDJSON (or one @graph)")
+    p_x.add_argument("bundles", nargs="+")
+    p_x.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    p_x.add_argument("--graph", action="store_true", help="wrap nodes in a JSON-LD @graph")
+    add_jobs_argument(p_x)
+
+    p_i = sub.add_parser("import", help="Stream NDJSON/@graph projections into a bundle")
+    p_i.add_argument("input", help="exported file, or - for stdin")
+    p_i.add_argument("--out-dir", required=True)
+
+    for bundle_parser in (p_r, p_e, p_x):
+        add_profile_argument(bundle_parser)
 
     args = parser.parse_args()
+    if getattr(args, "profile", None):
+        mif_profile.enable()
 
     if args.command == "to-jsonld":
-        sys.exit(cmd_to_jsonld(Path(args.input), Path(args.output) if args.output else None))
-    if args.command == "to-markdown":
-        sys.exit(cmd_to_markdown(Path(args.input), Path(args.output) if args.output else None))
-    if args.command == "roundtrip":
-        sys.exit(cmd_roundtrip([Path(b) for b in args.bundles]))
-    if args.command == "emit-jsonld":
-        sys.exit(cmd_emit_jsonld([Path(b) for b in args.bundles], Path(args.out_dir)))
+        code = cmd_to_jsonld(Path(args.input), Path(args.output) if args.output else None)
+    elif args.command == "to-markdown":
+        code = cmd_to_markdown(Path(args.input), Path(args.output) if args.output else None)
+    elif args.command == "roundtrip":
+        code = cmd_roundtrip([Path(b) for b in args.bundles], args.jobs, args.yaml_parity)
+    elif args.command == "emit-jsonld":
+        code = cmd_emit_jsonld(
+            [Path(b) for b in args.bundles], Path(args.out_dir), args.jobs, args.incremental
+        )
+    elif args.command == "export":
+        code = cmd_export([Path(b) for b in args.bundles], args.output, args.jobs, args.graph)
+    else:
+        code = cmd_import(args.input, Path(args.out_dir))
+    if getattr(args, "profile", None):
+        mif_profile.finish(args.profile)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
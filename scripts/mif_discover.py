@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""Apply ontology discovery patterns to whole MIF bundles.
+
+Ontologies declare ``discovery`` rules (spec section 10.8.4): ``content_pattern``
+regexes matched against concept content and ``file_pattern`` globs matched
+against concept paths, each suggesting an entity type and/or a namespace. The
+separate ``content_patterns`` / ``file_patterns`` arrays of the ontology schema
+are accepted too (their ``pattern`` is a regex in both cases).
+
+Every enabled pattern of every loaded ontology is compiled once:
+
+- all distinct content regexes are joined into ONE alternation used as a
+  prefilter: a concept body it does not match (most of them) costs a single
+  scan whatever the pattern count; a body it does match is then scanned by
+  each content regex on its own, so overlapping or identical patterns (say two
+  ontologies both declaring ``\bdatabase\b``) all count their hits exactly as
+  if matched separately; identical regexes are scanned once and credited to
+  every pattern declaring them;
+- all path patterns become a list of compiled regexes (globs are translated
+  once: ``**`` spans directories, ``*`` does not).
+
+A pattern that would change meaning inside the alternation -- one with named
+groups, backreferences or a global inline flag -- stays out of the prefilter
+and is always scanned on its own.
+
+Confidence: the ontology schema gives patterns no confidence of their own, so
+each piece of evidence is weighted from the ontology's ``confidence_threshold``
+``t`` (default 0.8): a content hit counts ``t`` -- one hit of a declared
+pattern is exactly enough for a suggestion -- and a path match, a more specific
+signal, ``1 - (1 - t) / 2`` (it halves the remaining doubt). Evidence for the
+same (ontology, entity, namespace) suggestion is combined as
+``1 - prod(1 - w)``, so repeated hits and path matches raise confidence toward
+1. Suggestions below ``t`` are dropped. ``--content-weight`` /
+``--file-weight`` replace the derived weights for every ontology.
+Ontologies with ``discovery.enabled`` false (the default) contribute nothing.
+
+Usage::
+
+    python mif_discover.py <bundle-dir> [...] --ontology <file-or-dir> [...]
+        [--content-weight W] [--file-weight W] [--json] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - environment guard
+    print("Error: PyYAML required. Install with: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+
+import mif_convert  # local module (same scripts/ directory)
+from mif_profile import span
+
+DEFAULT_THRESHOLD = 0.8
+# ``\1``..``\99`` or ``(?P=name)`` in a pattern: it must be compiled on its own.
+BACKREFERENCE_RE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=")
+
+
+class Pattern(NamedTuple):
+    """One discovery rule, flattened out of its ontology."""
+
+    ontology: str
+    kind: str  # "content" or "file"
+    regex: str
+    entity: str | None
+    namespaces: tuple[str, ...]
+    threshold: float
+    weight: float  # evidence per hit (content) or per match (file)
+
+
+class Suggestion(NamedTuple):
+    path: str
+    ontology: str
+    entity: str | None
+    namespace: str | None
+    confidence: float
+    content_hits: int
+    file_match: bool
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "ontology": self.ontology,
+            "suggestEntity": self.entity,
+            "suggestNamespace": self.namespace,
+            "confidence": self.confidence,
+            "contentHits": self.content_hits,
+            "fileMatch": self.file_match,
+        }
+
+
+def glob_to_regex(glob: str) -> str:
+    """Translate a path glob: ``**/`` = any directories, ``*`` / ``?`` stay in one segment."""
+    out = []
+    i = 0
+    while i < len(glob):
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif glob[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif glob[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(glob[i]))
+            i += 1
+    return "(?:" + "".join(out) + r")\Z"
+
+
+def _namespaces(rule: dict, *keys: str) -> tuple[str, ...]:
+    found: list[str] = []
+    for key in keys:
+        value = rule.get(key)
+        if isinstance(value, str):
+            found.append(value)
+        elif isinstance(value, list):
+            found.extend(v for v in value if isinstance(v, str))
+    return tuple(found)
+
+
+def evidence_weights(
+    threshold: float, content_weight: float | None = None, file_weight: float | None = None
+) -> dict[str, float]:
+    """Per-kind evidence weights: explicit ones, else derived from ``threshold``."""
+    return {
+        "content": threshold if content_weight is None else content_weight,
+        "file": 1 - (1 - threshold) / 2 if file_weight is None else file_weight,
+    }
+
+
+def ontology_patterns(
+    data: dict,
+    default_id: str,
+    content_weight: float | None = None,
+    file_weight: float | None = None,
+) -> list[Pattern]:
+    """Every pattern of one parsed ontology, in declaration order ([] if disabled)."""
+    discovery = data.get("discovery") if isinstance(data, dict) else None
+    if not isinstance(discovery, dict) or not discovery.get("enabled", False):
+        return []
+    header = data.get("ontology")
+    oid = header.get("id") if isinstance(header, dict) else None
+    oid = oid if isinstance(oid, str) and oid else default_id
+    threshold = float(discovery.get("confidence_threshold", DEFAULT_THRESHOLD))
+    weights = evidence_weights(threshold, content_weight, file_weight)
+
+    def pattern(kind: str, regex: str, entity: str | None, namespaces: tuple[str, ...]) -> Pattern:
+        return Pattern(oid, kind, regex, entity, namespaces, threshold, weights[kind])
+
+    patterns: list[Pattern] = []
+    for rule in discovery.get("patterns") or []:
+        if not isinstance(rule, dict):
+            continue
+        entity = rule.get("suggest_entity")
+        namespaces = _namespaces(rule, "suggest_namespace")
+        if isinstance(rule.get("content_pattern"), str):
+            patterns.append(pattern("content", rule["content_pattern"], entity, namespaces))
+        if isinstance(rule.get("file_pattern"), str):
+            regex = glob_to_regex(rule["file_pattern"])
+            patterns.append(pattern("file", regex, entity, namespaces))
+    for key, kind in (("content_patterns", "content"), ("file_patterns", "file")):
+        for rule in discovery.get(key) or []:
+            if isinstance(rule, dict) and isinstance(rule.get("pattern"), str):
+                namespaces = _namespaces(rule, "namespace", "namespaces")
+                patterns.append(
+                    pattern(kind, rule["pattern"], rule.get("suggest_entity"), namespaces)
+                )
+    return patterns
+
+
+def _joinable(regex: str, compiled: re.Pattern) -> bool:
+    """Whether ``regex`` keeps its meaning inside an alternation with others.
+
+    Named groups may clash across patterns and numbered backreferences would
+    point at the wrong group once other patterns' groups precede them; a global
+    inline flag (``(?i)`` not at the very start) is rejected by ``re``.
+    """
+    if compiled.groupindex or BACKREFERENCE_RE.search(regex):
+        return False
+    try:
+        re.compile(f"(?:{regex})|x")
+    except re.error:
+        return False
+    return True
+
+
+def load_patterns(
+    sources: list[Path], content_weight: float | None = None, file_weight: float | None = None
+) -> list[Pattern]:
+    """Patterns of every ontology file (or ``*.ontology.yaml`` under each directory)."""
+    files: list[Path] = []
+    for source in sources:
+        files.extend(sorted(source.rglob("*.ontology.yaml")) if source.is_dir() else [source])
+    patterns: list[Pattern] = []
+    for path in files:
+        data = yaml.safe_load(path.read_text())
+        patterns.extend(
+            ontology_patterns(data, path.name.split(".")[0], content_weight, file_weight)
+        )
+    return patterns
+
+
+class DiscoveryEngine:
+    """All discovery patterns compiled once; ``scan`` prefilters a concept in one pass."""
+
+    def __init__(self, patterns: list[Pattern]) -> None:
+        self.patterns = patterns
+        # Distinct content regex -> (compiled, indexes of the patterns declaring it).
+        self.content: dict[str, tuple[re.Pattern, list[int]]] = {}
+        self.separate: list[str] = []
+        self.paths: list[tuple[int, re.Pattern]] = []
+        for i, pattern in enumerate(patterns):
+            try:
+                compiled = re.compile(pattern.regex)
+            except re.error as exc:
+                raise ValueError(
+                    f"{pattern.ontology}: invalid {pattern.kind} pattern {pattern.regex!r}: {exc}"
+                ) from exc
+            if pattern.kind == "file":
+                self.paths.append((i, compiled))
+                continue
+            if pattern.regex in self.content:
+                self.content[pattern.regex][1].append(i)
+                continue
+            self.content[pattern.regex] = (compiled, [i])
+            if not _joinable(pattern.regex, compiled):
+                self.separate.append(pattern.regex)
+        joined = [regex for regex in self.content if regex not in self.separate]
+        try:
+            self.prefilter = re.compile("|".join(f"(?:{r})" for r in joined)) if joined else None
+        except re.error:  # pragma: no cover - _joinable already screens these out
+            self.prefilter, self.separate = None, list(self.content)
+
+    def _content_hits(self, text: str) -> dict[int, int]:
+        """Matches per content pattern, exactly as if each were scanned on its own."""
+        regexes = list(self.separate)
+        if self.prefilter is not None and self.prefilter.search(text):
+            regexes.extend(regex for regex in self.content if regex not in self.separate)
+        hits: dict[int, int] = {}
+        for regex in regexes:
+            compiled, indexes = self.content[regex]
+            count = sum(1 for _ in compiled.finditer(text))
+            if count:
+                hits.update(dict.fromkeys(indexes, count))
+        return hits
+
+    def scan(self, rel_path: str, text: str) -> list[Suggestion]:
+        """Suggestions for one concept (bundle-relative ``rel_path``), above threshold."""
+        evidence: dict[tuple, list] = {}
+        file_hits = {index for index, compiled in self.paths if compiled.match(rel_path)}
+        content_hits = self._content_hits(text)
+        for index in sorted(file_hits | set(content_hits)):
+            pattern = self.patterns[index]
+            for namespace in pattern.namespaces or (None,):
+                key = (pattern.ontology, pattern.entity, namespace)
+                entry = evidence.setdefault(key, [1.0, 0, False, pattern.threshold])
+                if index in file_hits:
+                    entry[0] *= 1 - pattern.weight
+                    entry[2] = True
+                hits = content_hits.get(index, 0)
+                entry[0] *= (1 - pattern.weight) ** hits
+                entry[1] += hits
+        suggestions = []
+        for (ontology, entity, namespace), (miss, hits, file_match, threshold) in evidence.items():
+            confidence = round(1 - miss, 4)
+            if confidence >= threshold:
+                suggestions.append(
+                    Suggestion(rel_path, ontology, entity, namespace, confidence, hits, file_match)
+                )
+        return suggestions
+
+
+def _scan_chunk(items: list[tuple[Path, str]], engine: DiscoveryEngine) -> list[list[Suggestion]]:
+    """Worker: scan a chunk of (concept path, bundle-relative path) pairs."""
+    results = []
+    for md_path, rel_path in items:
+        concept = mif_convert.load_concept(md_path)
+        with span("discover", concept=rel_path):
+            results.append([] if concept.error else engine.scan(rel_path, concept.body))
+    return results
+
+
+def discover(bundles: list[Path], engine: DiscoveryEngine, jobs: int = 1) -> list[Suggestion]:
+    """Suggestions for every concept of every bundle, in path order."""
+    items = [
+        (md_path, md_path.relative_to(bundle).as_posix())
+        for bundle in bundles
+        for md_path in mif_convert.iter_concepts(bundle)
+    ]
+    worker = partial(_scan_chunk, engine=engine)
+    return [s for chunk in mif_convert.map_chunks(worker, items, jobs) for found in chunk for s in found]
+
+
+def _weight(value: str) -> float:
+    weight = float(value)
+    if not 0 <= weight <= 1:
+        raise argparse.ArgumentTypeError(f"weight must be between 0 and 1: {value}")
+    return weight
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply ontology discovery patterns to bundles")
+    parser.add_argument("bundles", type=Path, nargs="+", help="bundle directories")
+    parser.add_argument(
+        "--ontology",
+        type=Path,
+        action="append",
+        required=True,
+        help="ontology YAML file, or a directory of *.ontology.yaml (repeatable)",
+    )
+    parser.add_argument(
+        "--content-weight",
+        type=_weight,
+        help="evidence per content hit (default: the ontology's confidence_threshold)",
+    )
+    parser.add_argument(
+        "--file-weight",
+        type=_weight,
+        help="evidence per path match (default: halfway from the threshold to 1)",
+    )
+    parser.add_argument("--json", action="store_true", help="print suggestions as JSON")
+    mif_convert.add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    try:
+        engine = DiscoveryEngine(
+            load_patterns(args.ontology, args.content_weight, args.file_weight)
+        )
+    except (OSError, ValueError, re.error, yaml.YAMLError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    suggestions = discover(args.bundles, engine, jobs=args.jobs)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in suggestions], indent=2))
+    else:
+        for s in suggestions:
+            target = " ".join(filter(None, [s.entity, s.namespace and f"({s.namespace})"]))
+            print(f"{s.path}: {target} confidence {s.confidence:.2f} [{s.ontology}]")
+        print(
+            f"\nDiscovery: {len(suggestions)} suggestion(s) from "
+            f"{len(engine.patterns)} pattern(s)",
+            file=sys.stderr,
+        )
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""Bundle id / alias / backlink index: O(1) resolution of concept references.
+
+Maps every concept's ``id``, its ``urn:mif:<id>`` form and each of its
+``aliases`` to the concept's bundle-relative path, and records each concept's
+outgoing references (frontmatter ``relationships`` and body links, see
+``mif_links.py``) so ``backlinks`` answers "who points at this path" as
+target -> [(source, type)], body links having type ``link``. Entries also keep
+the raw ``temporal`` time fields (``TEMPORAL_FIELDS``) that ``mif_temporal.py``
+builds its time indexes from without re-reading files. Built from the
+bundle model the validator already parsed (``from_concepts``), or persisted as
+JSON and kept current with ``update``, which re-reads only the files whose size
+or mtime changed and drops deleted ones.
+
+Collisions are found while the key table is built. Ids are claimed before
+aliases, each in path order, and the first concept to claim a key keeps it:
+
+- ``duplicate_ids`` -- two concepts declaring the same ``id`` (the spec makes
+  ``id`` globally unique, so the validator reports these as errors). A tree
+  with no ``.md`` file at its root is a container of sibling bundles (e.g.
+  ``test/temporal/{good,bad}``), each meant to be validated on its own;
+  ``duplicate_id_findings`` demotes ids shared across its top-level
+  directories to warnings;
+- ``alias_collisions`` -- an alias already claimed by another concept's id,
+  urn or alias (reported as warnings: aliases are free-form names).
+
+Usage::
+
+    python mif_index.py build <bundle-dir> [--index FILE]
+    python mif_index.py resolve <bundle-dir> <id | urn:mif:id | alias> [--index FILE]
+    python mif_index.py backlinks <bundle-dir> <path | id | alias> [--index FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import posixpath
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Iterable
+
+import mif_convert  # local module (same scripts/ directory)
+import mif_links  # local module (same scripts/ directory)
+
+INDEX_NAME = ".mif-index.json"
+INDEX_VERSION = 4
+URN_PREFIX = "urn:mif:"
+EXTERNAL_SCHEMES = ("http://", "https://", "urn:", "mailto:")
+# ``temporal`` fields kept per entry (raw strings) for time-based indexes, plus
+# ``decay.lastReinforced`` and the ``properties.expiredAt`` mark of a TTL sweep.
+TEMPORAL_FIELDS = ("validFrom", "validUntil", "recordedAt", "ttl")
+
+
+def _keys_of(entry: dict) -> Iterable[tuple[str, str]]:
+    """(kind, key) pairs a file entry claims: its id, urn and aliases."""
+    if entry.get("id") is not None:
+        yield "id", entry["id"]
+        yield "urn", URN_PREFIX + entry["id"]
+    for alias in entry.get("aliases", []):
+        yield "alias", alias
+
+
+def _temporal_fields(frontmatter: dict) -> dict:
+    """The entry's time fields as strings; ``recordedAt`` falls back to ``created``.
+
+    Unquoted YAML timestamps arrive as ``date`` / ``datetime`` objects and are
+    stored in ISO form.
+    """
+    temporal = frontmatter.get("temporal")
+    temporal = temporal if isinstance(temporal, dict) else {}
+    decay = temporal.get("decay")
+    properties = frontmatter.get("properties")
+    fields = {name: temporal.get(name) for name in TEMPORAL_FIELDS}
+    if fields["recordedAt"] is None:
+        fields["recordedAt"] = frontmatter.get("created")
+    fields["lastReinforced"] = decay.get("lastReinforced") if isinstance(decay, dict) else None
+    fields["expiredAt"] = properties.get("expiredAt") if isinstance(properties, dict) else None
+    return {
+        name: value.isoformat() if isinstance(value, date) else value
+        for name, value in fields.items()
+        if isinstance(value, (str, date))
+    }
+
+
+def _entry(frontmatter: dict, links: list[str], stat: os.stat_result | None = None) -> dict:
+    concept_id = frontmatter.get("id")
+    aliases = frontmatter.get("aliases") or []
+    entry = {
+        "id": None if concept_id is None else str(concept_id),
+        "aliases": [str(a) for a in aliases] if isinstance(aliases, list) else [],
+        "refs": [list(ref) for ref in mif_links.references(frontmatter, links)],
+        "temporal": _temporal_fields(frontmatter),
+    }
+    if stat is not None:
+        entry["mtime"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+    return entry
+
+
+def bundle_paths(bundle: Path) -> set[str]:
+    """Bundle-relative paths of every ``.md`` file, from one walk of the tree.
+
+    Reserved files (``index.md`` / ``log.md``) are included: they are valid link
+    targets even though they are not concepts.
+    """
+    paths: set[str] = set()
+    for root, _, names in os.walk(bundle):
+        rel_root = os.path.relpath(root, bundle).replace(os.sep, "/")
+        prefix = "" if rel_root == "." else rel_root + "/"
+        paths.update(prefix + name for name in names if name.endswith(".md"))
+    return paths
+
+
+def is_container(paths: set[str]) -> bool:
+    """True when no ``.md`` file (not even ``index.md``) sits at the tree's root."""
+    return bool(paths) and all("/" in path for path in paths)
+
+
+class BundleIndex:
+    """Key (id / urn:mif:id / alias) -> bundle-relative concept path."""
+
+    def __init__(self, files: dict[str, dict] | None = None) -> None:
+        self.files: dict[str, dict] = files or {}
+        self.keys: dict[str, str] = {}
+        self.duplicate_ids: list[str] = []
+        self.alias_collisions: list[str] = []
+        self._duplicates: list[tuple[str, str, str]] = []
+        self._backlinks: dict[str, list[tuple[str, str]]] | None = None
+        self._rebuild_keys()
+
+    @classmethod
+    def from_concepts(
+        cls, bundle: Path, concepts: Iterable[tuple[mif_convert.Concept, list[str]]]
+    ) -> "BundleIndex":
+        """Index already-parsed (concept, body link targets) pairs (no file access)."""
+        files = {
+            concept.path.relative_to(bundle).as_posix(): _entry(concept.frontmatter, links)
+            for concept, links in concepts
+            if not concept.error
+        }
+        return cls(files)
+
+    def _rebuild_keys(self) -> None:
+        self._backlinks = None
+        self.keys.clear()
+        self.duplicate_ids.clear()
+        self.alias_collisions.clear()
+        self._duplicates.clear()
+        owner_kind: dict[str, str] = {}
+        # Ids (and their urns) are claimed before any alias, so an alias can never
+        # shadow a concept's own id.
+        for kinds in (("id", "urn"), ("alias",)):
+            for rel_path in sorted(self.files):
+                for kind, key in _keys_of(self.files[rel_path]):
+                    if kind not in kinds:
+                        continue
+                    holder = self.keys.get(key)
+                    if holder is None:
+                        self.keys[key] = rel_path
+                        owner_kind[key] = kind
+                    elif holder == rel_path:
+                        continue
+                    elif kind == "id":
+                        self.duplicate_ids.append(f"duplicate id {key!r}: {holder}, {rel_path}")
+                        self._duplicates.append((key, holder, rel_path))
+                    elif kind == "alias":
+                        self.alias_collisions.append(
+                            f"alias {key!r} of {rel_path} collides with the "
+                            f"{owner_kind[key]} of {holder}"
+                        )
+
+    def duplicate_id_findings(self, paths: set[str]) -> tuple[list[str], list[str]]:
+        """``duplicate_ids`` split into (errors, warnings) for the tree listed by ``paths``.
+
+        In a container of sibling bundles (``is_container``), an id shared by two
+        different top-level directories is only a warning."""
+        container = is_container(paths)
+        errors: list[str] = []
+        warnings: list[str] = []
+        for message, (key, holder, rel_path) in zip(self.duplicate_ids, self._duplicates):
+            if container and holder.split("/", 1)[0] != rel_path.split("/", 1)[0]:
+                warnings.append(
+                    f"duplicate id {key!r} across sibling bundles: {holder}, {rel_path}"
+                )
+            else:
+                errors.append(message)
+        return errors, warnings
+
+    def resolve(self, key: str) -> str | None:
+        """Bundle-relative path of the concept with this id, urn:mif: id or alias."""
+        return self.keys.get(key)
+
+    def resolve_target(self, target: str, source: str) -> str | None:
+        """Bundle-relative path a reference from ``source`` points at.
+
+        ``urn:mif:`` ids, bare ids and aliases go through the key table; other
+        targets are bundle-relative (leading ``/``) or ``source``-relative paths,
+        normalized. External URLs and paths escaping the bundle give None.
+        """
+        target = target.split("#", 1)[0]
+        if not target:
+            return None
+        if not target.endswith(".md"):
+            rel_path = self.keys.get(target)
+            if rel_path is not None:
+                return rel_path
+        if target.startswith(EXTERNAL_SCHEMES):
+            return None
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.join(posixpath.dirname(source), target)
+        path = posixpath.normpath(path)
+        return None if path == ".." or path.startswith("../") else path
+
+    def backlinks(self) -> dict[str, list[tuple[str, str]]]:
+        """Target path -> [(source path, reference type)], sources in path order."""
+        if self._backlinks is None:
+            table: dict[str, dict[tuple[str, str], None]] = {}
+            for source in sorted(self.files):
+                for ref_type, target in self.files[source].get("refs", []):
+                    rel_path = self.resolve_target(target, source)
+                    if rel_path is not None and rel_path != source:
+                        table.setdefault(rel_path, {})[(source, ref_type)] = None
+            self._backlinks = {target: list(refs) for target, refs in table.items()}
+        return self._backlinks
+
+    def dependents(self, rel_paths: Iterable[str]) -> set[str]:
+        """Concepts that reference any of ``rel_paths`` (existing or not)."""
+        table = self.backlinks()
+        return {source for rel_path in rel_paths for source, _ in table.get(rel_path, [])}
+
+    def update(self, bundle: Path) -> tuple[list[str], list[str]]:
+        """Re-index files that changed since the last update. Returns (changed, removed)."""
+        seen: set[str] = set()
+        changed: list[str] = []
+        for md_path in mif_convert.iter_concepts(bundle):
+            rel_path = md_path.relative_to(bundle).as_posix()
+            seen.add(rel_path)
+            stat = md_path.stat()
+            old = self.files.get(rel_path)
+            if old and old.get("mtime") == stat.st_mtime_ns and old.get("size") == stat.st_size:
+                continue
+            concept = mif_convert.load_concept(md_path)
+            links = mif_links.body_links(concept.body)
+            self.files[rel_path] = _entry(concept.frontmatter, links, stat)
+            changed.append(rel_path)
+        removed = [rel_path for rel_path in self.files if rel_path not in seen]
+        for rel_path in removed:
+            del self.files[rel_path]
+        if changed or removed:
+            self._rebuild_keys()
+        return changed, removed
+
+    @classmethod
+    def load(cls, path: Path) -> "BundleIndex":
+        """The index persisted at ``path`` (empty if missing, unreadable or stale format)."""
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(data.get("files", {}))
+
+    def save(self, path: Path) -> None:
+        """Persist atomically (temp file + rename)."""
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": self.files}, sort_keys=True) + "\n")
+        os.replace(tmp, path)
+
+
+def open_index(bundle: Path, index_path: Path | None = None) -> BundleIndex:
+    """Load the bundle's persisted index, bring it up to date and save it."""
+    index_path = index_path or bundle / INDEX_NAME
+    index = BundleIndex.load(index_path)
+    index.update(bundle)
+    index.save(index_path)
+    return index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build and query a MIF bundle id/alias index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="create or incrementally update the index")
+    p_build.add_argument("bundle", type=Path)
+    p_build.add_argument("--index", type=Path, help=f"index file (default: <bundle>/{INDEX_NAME})")
+    p_resolve = sub.add_parser("resolve", help="print the path of an id, urn:mif: id or alias")
+    p_resolve.add_argument("bundle", type=Path)
+    p_resolve.add_argument("key")
+    p_resolve.add_argument("--index", type=Path, help=f"index file (default: <bundle>/{INDEX_NAME})")
+    p_back = sub.add_parser("backlinks", help="print the concepts referencing a path, id or alias")
+    p_back.add_argument("bundle", type=Path)
+    p_back.add_argument("key")
+    p_back.add_argument("--index", type=Path, help=f"index file (default: <bundle>/{INDEX_NAME})")
+    args = parser.parse_args()
+
+    if not args.bundle.is_dir():
+        print(f"Error: {args.bundle} is not a directory", file=sys.stderr)
+        sys.exit(1)
+    index = open_index(args.bundle, args.index)
+    if args.command == "resolve":
+        rel_path = index.resolve(args.key)
+        if rel_path is None:
+            print(f"Not found: {args.key}", file=sys.stderr)
+            sys.exit(1)
+        print(rel_path)
+        sys.exit(0)
+    if args.command == "backlinks":
+        target = index.resolve(args.key) or args.key.lstrip("/")
+        for source, ref_type in index.backlinks().get(target, []):
+            print(f"{source}\t{ref_type}")
+        sys.exit(0)
+
+    print(f"Indexed {len(index.files)} concept(s), {len(index.keys)} key(s)")
+    errors, warnings = index.duplicate_id_findings(bundle_paths(args.bundle))
+    for message in index.alias_collisions + warnings:
+        print(f"WARN  {message}")
+    for message in errors:
+        print(f"ERROR {message}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Relationship and link extraction shared by the validator and the bundle index.
+
+A concept references other concepts in two places: typed frontmatter
+``relationships`` entries (authoritative) and markdown links in its body, of
+which the ``## Relationships`` section mirrors the frontmatter (Invariant 3).
+``okf_validate.py`` compares the two; ``mif_index.py`` records both as a
+concept's outgoing references so it can answer backlink queries.
+"""
+
+from __future__ import annotations
+
+import re
+
+# A body relationship line: "- <kebab-type> [Text](/path/to/target.md)".
+REL_LINE_RE = re.compile(r"^-\s+([a-z0-9][a-z0-9-]*)\s+\[[^\]]+\]\(([^)]+)\)\s*$")
+# Any markdown link, for broken-link scanning.
+MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
+# Reference type recorded for a plain body link (not a typed relationship).
+LINK = "link"
+
+
+def kebab(value: str) -> str:
+    """Normalize a relationship type token to kebab-case for comparison."""
+    value = re.sub(r"(?<!^)(?=[A-Z])", "-", value)
+    value = re.sub(r"[\s_]+", "-", value)
+    return value.lower()
+
+
+def relationships_section(body: str) -> list[tuple[str, str]]:
+    """Extract (kebab-type, target) pairs from the body ## Relationships section."""
+    pairs: list[tuple[str, str]] = []
+    in_section = False
+    for line in body.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("## "):
+            in_section = stripped[3:].strip().lower() == "relationships"
+            continue
+        if in_section:
+            match = REL_LINE_RE.match(stripped)
+            if match:
+                pairs.append((kebab(match.group(1)), match.group(2)))
+    return pairs
+
+
+def frontmatter_relationships(frontmatter: dict) -> list[tuple[str, str]]:
+    """Extract (kebab-type, target) pairs from frontmatter relationships array."""
+    pairs: list[tuple[str, str]] = []
+    for rel in frontmatter.get("relationships", []) or []:
+        if not isinstance(rel, dict):
+            continue
+        rel_type = rel.get("type") or rel.get("relationshipType") or ""
+        target = rel.get("target", "")
+        if isinstance(target, dict):  # tolerate {"@id": ...}/{"path": ...}
+            target = target.get("path") or target.get("@id", "")
+        pairs.append((kebab(str(rel_type)), str(target)))
+    return pairs
+
+
+def body_links(body: str) -> list[str]:
+    """Raw targets of every markdown link in ``body``, in order."""
+    return [match.group(1) for match in MD_LINK_RE.finditer(body)]
+
+
+def references(frontmatter: dict, links: list[str]) -> list[tuple[str, str]]:
+    """Every outgoing (type, target) reference: relationships, then body links."""
+    return frontmatter_relationships(frontmatter) + [(LINK, target) for target in links]
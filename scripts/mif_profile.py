@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Per-phase span profiler for the MIF converter and validator.
+
+``span(name, **args)`` times a block and records it as a Chrome trace "complete"
+event (``ph: X``); load the file written by ``write_trace`` in
+``chrome://tracing`` or https://ui.perfetto.dev. Profiling is off until
+``enable()`` is called, and a disabled ``span`` is a shared no-op, so the
+instrumented hot paths cost next to nothing in normal runs.
+
+Spans recorded inside ``mif_convert.map_chunks`` workers are shipped back with
+each chunk's result (``call_traced``) and merged into the parent's event list;
+timestamps come from the system-wide monotonic clock, so one trace shows every
+worker process on a common timeline.
+
+``summary``/``format_summary`` aggregate the events per span name (calls, total,
+mean, max, share of the summed span time).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_enabled = False
+_events: list[dict] = []
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: dict) -> None:
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        end = time.perf_counter_ns()
+        _events.append(
+            {
+                "name": self.name,
+                "cat": self.cat,
+                "ph": "X",
+                "ts": self.start / 1000,
+                "dur": (end - self.start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": self.args,
+            }
+        )
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable() -> None:
+    """Start recording spans in this process."""
+    global _enabled
+    _enabled = True
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def span(name: str, cat: str = "mif", **args: Any) -> _Span | _NullSpan:
+    """Context manager timing one phase; a no-op unless profiling is enabled."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, {k: str(v) for k, v in args.items()})
+
+
+def drain() -> list[dict]:
+    """Return and clear the events recorded so far in this process."""
+    events = _events[:]
+    _events.clear()
+    return events
+
+
+def absorb(events: list[dict]) -> None:
+    """Merge events recorded in another process (a worker) into this one."""
+    _events.extend(events)
+
+
+def call_traced(func: Callable[[Any], Any], chunk: Any) -> tuple[Any, list[dict]]:
+    """Worker wrapper: run ``func(chunk)`` with profiling on; return (result, events)."""
+    enable()
+    drain()  # a forked worker inherits the parent's buffer; ship only its own spans
+    result = func(chunk)
+    return result, drain()
+
+
+def summary(events: list[dict]) -> list[dict]:
+    """Aggregate events per span name, ordered by total time (descending)."""
+    rows: dict[str, dict] = {}
+    for event in events:
+        row = rows.setdefault(
+            event["name"], {"name": event["name"], "calls": 0, "totalUs": 0.0, "maxUs": 0.0}
+        )
+        row["calls"] += 1
+        row["totalUs"] += event["dur"]
+        row["maxUs"] = max(row["maxUs"], event["dur"])
+    grand = sum(row["totalUs"] for row in rows.values()) or 1.0
+    for row in rows.values():
+        row["meanUs"] = row["totalUs"] / row["calls"]
+        row["share"] = row["totalUs"] / grand
+    return sorted(rows.values(), key=lambda row: row["totalUs"], reverse=True)
+
+
+def format_summary(rows: list[dict]) -> str:
+    lines = [f"{'phase':<24} {'calls':>8} {'total ms':>10} {'mean us':>10} {'max ms':>9} {'share':>6}"]
+    for row in rows:
+        lines.append(
+            f"{row['name']:<24} {row['calls']:>8} {row['totalUs'] / 1000:>10.1f} "
+            f"{row['meanUs']:>10.1f} {row['maxUs'] / 1000:>9.2f} {row['share']:>6.1%}"
+        )
+    return "\n".join(lines)
+
+
+def write_trace(path: Path, events: list[dict]) -> None:
+    """Write ``events`` as a Chrome trace-event JSON document."""
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}) + "\n")
+
+
+def finish(path: Path) -> None:
+    """Write the trace to ``path`` and print the per-phase summary (to stderr)."""
+    events = drain()
+    write_trace(path, events)
+    print(f"\nProfile: {len(events)} span(s) -> {path}", file=sys.stderr)
+    print(format_summary(summary(events)), file=sys.stderr)
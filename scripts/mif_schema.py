@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""In-process JSON Schema validation of MIF JSON-LD projections.
+
+The MIF schemas are compiled once per process against an offline ``$ref``
+registry holding every ``*.schema.json`` under ``schema/`` (keyed by its
+``$id``), so ``./definitions/entity-reference.schema.json`` and friends resolve
+from the local tree and nothing is ever fetched over the network:
+
+- ``mif.schema.json`` validates the whole projection;
+- ``citation.schema.json`` validates each ``citations`` entry;
+- ``definitions/entity-reference.schema.json`` validates each ``entities`` entry.
+
+``validate`` takes bundle directories and/or emitted ``.jsonld`` files: concept
+``.md`` files are projected with ``mif_convert.md_to_jsonld`` and validated in
+memory (nothing is written), ``.jsonld`` files are validated as they are. Work
+fans out over ``--jobs`` processes, each compiling the schemas once, so cost
+grows with the number of concepts rather than with validator launches.
+
+Needs the optional ``jsonschema`` package with its format checkers
+(``pip install 'jsonschema[format]'``): without the extras jsonschema passes
+any ``uri`` or ``date-time`` value, which ajv-formats would reject.
+``unusable_reason()`` says what is missing; the CLI then fails closed (exit 1)
+and ``projection_errors`` reports it for every source, so a weaker check never
+reads as a pass.
+
+Usage::
+
+    python mif_schema.py validate <bundle-dir | file.jsonld> [...] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+try:
+    import jsonschema
+    from referencing import Registry, Resource
+except ImportError:  # optional dependency; see available()
+    jsonschema = None
+
+import mif_convert  # local module (same scripts/ directory)
+from mif_profile import span
+
+SCHEMA_DIR = Path(__file__).resolve().parent.parent / "schema"
+MIF_SCHEMA = SCHEMA_DIR / "mif.schema.json"
+CITATION_SCHEMA = SCHEMA_DIR / "citation.schema.json"
+ENTITY_REFERENCE_SCHEMA = SCHEMA_DIR / "definitions" / "entity-reference.schema.json"
+# Projection keys whose entries are also checked against a standalone schema.
+EMBEDDED_SCHEMAS = {"citations": CITATION_SCHEMA, "entities": ENTITY_REFERENCE_SCHEMA}
+PROJECTION_SCHEMAS = (MIF_SCHEMA, *EMBEDDED_SCHEMAS.values())
+INSTALL_HINT = "jsonschema not installed (install: pip install 'jsonschema[format]')"
+
+
+def available() -> bool:
+    return jsonschema is not None
+
+
+@lru_cache(maxsize=None)
+def _registry() -> "Registry":
+    resources = []
+    for path in sorted(SCHEMA_DIR.rglob("*.schema.json")):
+        contents = json.loads(path.read_text())
+        resources.append((contents["$id"], Resource.from_contents(contents)))
+    return Registry().with_resources(resources)
+
+
+@lru_cache(maxsize=None)
+def validator(schema_path: Path = MIF_SCHEMA) -> Any:
+    """The compiled validator for ``schema_path`` (built once per process)."""
+    schema = json.loads(schema_path.read_text())
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema, registry=_registry(), format_checker=cls.FORMAT_CHECKER)
+
+
+def _formats(node: Any) -> set[str]:
+    """Every ``format`` keyword value in a schema document."""
+    if isinstance(node, list):
+        return set().union(*map(_formats, node)) if node else set()
+    if not isinstance(node, dict):
+        return set()
+    found = {node["format"]} if isinstance(node.get("format"), str) else set()
+    return found.union(*(_formats(value) for value in node.values()))
+
+
+@lru_cache(maxsize=None)
+def unchecked_formats(schema_path: Path = MIF_SCHEMA) -> frozenset[str]:
+    """Formats used in ``schema_path`` (the file itself) that jsonschema's installed
+    checkers would skip.
+
+    jsonschema checks ``uri``, ``date-time`` and others only when their optional
+    packages are installed (``pip install 'jsonschema[format]'``), passing
+    anything otherwise.
+    """
+    schema = json.loads(schema_path.read_text())
+    checker = jsonschema.validators.validator_for(schema).FORMAT_CHECKER
+    return frozenset(_formats(schema) - set(checker.checkers))
+
+
+def unusable_reason(schema_paths: tuple[Path, ...] = PROJECTION_SCHEMAS) -> str | None:
+    """Why in-process validation cannot fully enforce ``schema_paths``, or None."""
+    if not available():
+        return INSTALL_HINT
+    unchecked = set().union(*(unchecked_formats(path) for path in schema_paths))
+    if unchecked:
+        return (
+            f"jsonschema cannot check format(s) {', '.join(sorted(unchecked))} "
+            "(install: pip install 'jsonschema[format]')"
+        )
+    return None
+
+
+def schema_errors(instance: Any, label: object, schema_path: Path = MIF_SCHEMA) -> list[str]:
+    """Findings for ``instance`` against ``schema_path``, ordered by location."""
+    errors = sorted(validator(schema_path).iter_errors(instance), key=lambda e: e.json_path)
+    return [f"{label}: schema: {error.message} (at {error.json_path})" for error in errors]
+
+
+def projection_errors(jsonld: Any, label: object) -> list[str]:
+    """Findings for a JSON-LD projection: the MIF schema, then embedded objects.
+
+    Fails closed: one finding naming what is missing when ``unusable_reason()``."""
+    reason = unusable_reason()
+    if reason is not None:
+        return [f"{label}: schema: {reason}"]
+    errors = schema_errors(jsonld, label)
+    if not isinstance(jsonld, dict):
+        return errors
+    for key, schema_path in EMBEDDED_SCHEMAS.items():
+        entries = jsonld.get(key)
+        if not isinstance(entries, list):
+            continue
+        for index, entry in enumerate(entries):
+            errors.extend(schema_errors(entry, f"{label} {key}[{index}]", schema_path))
+    return errors
+
+
+def _label(path: Path) -> object:
+    try:
+        return path.resolve().relative_to(SCHEMA_DIR.parent)
+    except ValueError:
+        return path
+
+
+def _validate_chunk(paths: list[Path]) -> list[list[str]]:
+    """Worker: findings per source (a concept ``.md`` or a ``.jsonld`` projection)."""
+    results = []
+    for path in paths:
+        label = _label(path)
+        try:
+            if path.suffix == ".md":
+                concept = mif_convert.load_concept(path)
+                if concept.error:
+                    results.append([f"{label}: {concept.error}"])
+                    continue
+                with span("project", concept=label):
+                    jsonld = mif_convert.md_to_jsonld(concept.frontmatter, concept.body)
+            else:
+                jsonld = json.loads(path.read_text())
+        except (OSError, ValueError) as exc:
+            results.append([f"{label}: {exc}"])
+            continue
+        with span("schema", concept=label):
+            results.append(projection_errors(jsonld, label))
+    return results
+
+
+def iter_sources(paths: list[Path]) -> list[Path]:
+    """Concept ``.md`` files of each bundle directory plus ``.jsonld`` files, in order."""
+    sources: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            sources.extend(mif_convert.iter_concepts(path))
+            sources.extend(sorted(path.rglob("*.jsonld")))
+        else:
+            sources.append(path)
+    return sources
+
+
+def validate_paths(paths: list[Path], jobs: int = 1) -> tuple[int, list[str]]:
+    """Validate every source under ``paths``. Returns (count, findings)."""
+    sources = iter_sources(paths)
+    errors = [
+        finding
+        for chunk in mif_convert.map_chunks(_validate_chunk, sources, jobs)
+        for findings in chunk
+        for finding in findings
+    ]
+    return len(sources), errors
+
+
+def cmd_validate(paths: list[Path], jobs: int = 1) -> int:
+    reason = unusable_reason()
+    if reason is not None:
+        # Fail closed: a missing validator (or format checker) must never read as a pass.
+        print(f"Error: {reason}", file=sys.stderr)
+        return 1
+    missing = [path for path in paths if not path.exists()]
+    if missing:
+        for path in missing:
+            print(f"Error: {path} not found", file=sys.stderr)
+        return 1
+    count, errors = validate_paths(paths, jobs)
+    print(f"Schema: validated {count} projection(s) against {MIF_SCHEMA.name}")
+    if errors:
+        print(f"SCHEMA VALIDATION FAILED with {len(errors)} error(s):")
+        for error in errors:
+            print(f"  - {error}")
+        return 1
+    print("Schema validation: PASS")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate MIF JSON-LD projections in-process")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("validate", help="validate bundles and/or .jsonld projections")
+    p.add_argument("paths", type=Path, nargs="+", help="bundle directories or .jsonld files")
+    mif_convert.add_jobs_argument(p)
+
+    args = parser.parse_args()
+    if args.command == "validate":
+        sys.exit(cmd_validate(args.paths, jobs=args.jobs))
+
+
+if __name__ == "__main__":
+    main()
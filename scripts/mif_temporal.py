@@ -0,0 +1,798 @@
+#!/usr/bin/env python3
+"""Temporal model (spec section 9) over whole bundles: decay, as-of, expiry.
+
+Every concept's ``temporal`` block is parsed once -- ISO-8601 timestamps to
+epoch seconds, ISO-8601 durations to seconds -- into a columnar
+:class:`FreshnessTable`. ``strengths(as_of)`` then evaluates the section 9.2
+decay models for every concept at any instant in one vectorized call:
+
+- ``none``: ``1``;
+- ``linear``: ``max(0, 1 - t / ttl)``;
+- ``exponential``: ``e^(-t / halfLife)``;
+- ``step``: ``1`` while ``t < ttl``, then ``0``.
+
+``t`` runs from ``decay.lastReinforced``, else ``temporal.recordedAt``, else
+``created`` (never negative). Outside the ``validFrom`` / ``validUntil`` window
+the strength is ``0``. A concept without a ``decay`` block is permanent
+(``none``); one whose model or required parameter is missing or unparseable
+has no strength (NaN: ranked last, never written back). Durations use 365-day
+years and 30-day months.
+
+Arrays are NumPy arrays when the optional ``numpy`` package is installed (one
+vectorized evaluation per call); without it the same columns are plain lists
+evaluated element by element, with identical results.
+
+``freshness`` ranks or filters concepts by strength. ``--write`` stores the
+refreshed value (rounded to ``STRENGTH_DIGITS``) back into
+``temporal.decay.currentStrength`` (or its ``strength`` alias, whichever the
+file uses) through ``mif_convert.serialize_markdown`` -- only for concepts with
+a ``decay`` block whose stored value actually changes.
+
+:class:`BitemporalIndex` answers "what was valid at T, as known at T'" without
+parsing the bundle: valid time (``validFrom`` / ``validUntil``) goes into an
+:class:`IntervalTree`, transaction time (``recordedAt``, else ``created``) into
+a sorted array, both built from the fields ``mif_index.py`` persists and
+patched from its ``update`` result. Point and range queries are
+O(log n + k). ``as-of`` exposes them on the command line.
+
+:class:`ExpiryQueue` is a min-heap of hard-expiry instants (the earlier of
+``validUntil`` and ``ttl`` after the ``step`` anchor), built from the same
+index. ``sweep`` pops only what is due -- O(expired * log n) -- and lists it,
+stamps ``properties.expiredAt`` (``--mark``) or also moves it to an archive
+tree (``--archive``); marked concepts leave the queue. ``expirations`` shows
+the next N to expire.
+
+Usage::
+
+    python mif_temporal.py freshness <bundle-dir> [...] [--as-of ISO] [--below X]
+        [--above X] [--top N] [--stalest] [--json] [--write] [--jobs N]
+    python mif_temporal.py as-of <bundle-dir> [--valid-at ISO] [--valid-until ISO]
+        [--known-at ISO] [--json] [--index FILE]
+    python mif_temporal.py sweep <bundle-dir> [--as-of ISO] [--mark | --archive DIR]
+        [--json] [--index FILE]
+    python mif_temporal.py expirations <bundle-dir> [--top N] [--after ISO] [--json]
+        [--index FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import heapq
+import json
+import math
+import re
+import shutil
+import sys
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency; see available()
+    np = None
+
+import mif_convert  # local module (same scripts/ directory)
+import mif_index  # local module (same scripts/ directory)
+from mif_profile import span
+
+MODELS = ["none", "linear", "exponential", "step"]
+NONE, LINEAR, EXPONENTIAL, STEP = range(len(MODELS))
+UNKNOWN = -1
+STRENGTH_KEYS = ("currentStrength", "strength")
+STRENGTH_DIGITS = 3
+
+_DURATION_UNITS = {
+    "Y": 365 * 86400,
+    "M": 30 * 86400,
+    "W": 7 * 86400,
+    "D": 86400,
+    "H": 3600,
+    "TM": 60,
+    "S": 1,
+}
+_NUMBER = r"(\d+(?:[.,]\d+)?)"
+DURATION_RE = re.compile(
+    rf"^P(?:{_NUMBER}Y)?(?:{_NUMBER}M)?(?:{_NUMBER}W)?(?:{_NUMBER}D)?"
+    rf"(?:T(?:{_NUMBER}H)?(?:{_NUMBER}M)?(?:{_NUMBER}S)?)?$"
+)
+
+
+def available() -> bool:
+    """True when NumPy is importable (vectorized evaluation)."""
+    return np is not None
+
+
+def parse_duration(value: object) -> float | None:
+    """ISO-8601 duration (``P90D``, ``PT36H``, ``P1Y2M``) in seconds, or None."""
+    if not isinstance(value, str):
+        return None
+    match = DURATION_RE.match(value.strip())
+    if not match or not any(match.groups()) or value.strip().endswith("T"):
+        return None
+    seconds = 0.0
+    for unit, amount in zip(_DURATION_UNITS, match.groups()):
+        if amount:
+            seconds += float(amount.replace(",", ".")) * _DURATION_UNITS[unit]
+    return seconds
+
+
+def parse_instant(value: object) -> float | None:
+    """ISO-8601 date or datetime as epoch seconds (UTC if naive), or None."""
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, date):
+        dt = datetime(value.year, value.month, value.day)
+    elif isinstance(value, str) and value:
+        try:
+            dt = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _positive(seconds: float | None) -> float:
+    return seconds if seconds is not None and seconds > 0 else math.nan
+
+
+def _row(frontmatter: dict) -> tuple:
+    """One concept's freshness columns, parsed from its frontmatter."""
+    temporal = frontmatter.get("temporal")
+    temporal = temporal if isinstance(temporal, dict) else {}
+    decay = temporal.get("decay")
+    if isinstance(decay, dict):
+        name = decay.get("model", "none")
+        model = MODELS.index(name) if name in MODELS else UNKNOWN
+        key = next((k for k in STRENGTH_KEYS if k in decay), STRENGTH_KEYS[0])
+        stored = decay.get(key)
+        stored = float(stored) if isinstance(stored, (int, float)) else math.nan
+        reinforced = decay.get("lastReinforced")
+        half_life = _positive(parse_duration(decay.get("halfLife")))
+    else:
+        model, key, stored, reinforced, half_life = NONE, None, math.nan, None, math.nan
+    anchor = next(
+        (
+            instant
+            for instant in map(
+                parse_instant, (reinforced, temporal.get("recordedAt"), frontmatter.get("created"))
+            )
+            if instant is not None
+        ),
+        math.nan,
+    )
+    valid_from = parse_instant(temporal.get("validFrom"))
+    valid_until = parse_instant(temporal.get("validUntil"))
+    return (
+        model,
+        anchor,
+        half_life,
+        _positive(parse_duration(temporal.get("ttl"))),
+        -math.inf if valid_from is None else valid_from,
+        math.inf if valid_until is None else valid_until,
+        stored,
+        key,
+    )
+
+
+def _strength(model, anchor, half_life, ttl, valid_from, valid_until, as_of) -> float:
+    """Scalar form of :meth:`FreshnessTable.strengths` (the no-NumPy path)."""
+    t = max(as_of - anchor, 0.0) if not math.isnan(anchor) else math.nan
+    if model == NONE:
+        value = 1.0
+    elif model == LINEAR:
+        value = min(max(1.0 - t / ttl, 0.0), 1.0) if not math.isnan(t / ttl) else math.nan
+    elif model == EXPONENTIAL:
+        value = math.exp(-t / half_life) if not math.isnan(t / half_life) else math.nan
+    elif model == STEP:
+        value = math.nan if math.isnan(t) or math.isnan(ttl) else float(t < ttl)
+    else:
+        value = math.nan
+    if not math.isnan(value) and not valid_from <= as_of < valid_until:
+        value = 0.0
+    return value
+
+
+class FreshnessTable:
+    """Columnar freshness parameters of a set of concepts, parsed once."""
+
+    def __init__(self, paths: list[Path], rows: list[tuple]) -> None:
+        self.paths = paths
+        columns = list(zip(*rows)) if rows else [()] * 8
+        self.keys: list[str | None] = list(columns[7])
+        self.stored = self._array(columns[6])
+        self.model = self._array(columns[0], int)
+        self.anchor, self.half_life, self.ttl, self.valid_from, self.valid_until = (
+            self._array(column) for column in columns[1:6]
+        )
+
+    @staticmethod
+    def _array(values, dtype=float) -> Any:
+        return np.array(values, dtype=dtype) if np is not None else list(values)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @classmethod
+    def from_concepts(cls, concepts: list[mif_convert.Concept]) -> "FreshnessTable":
+        concepts = [concept for concept in concepts if not concept.error]
+        return cls([c.path for c in concepts], [_row(c.frontmatter) for c in concepts])
+
+    def strengths(self, as_of: datetime | float | None = None) -> Any:
+        """Strength of every concept at ``as_of`` (default: now), in ``paths`` order."""
+        if as_of is None:
+            as_of = datetime.now(timezone.utc)
+        if not isinstance(as_of, (int, float)):
+            as_of = parse_instant(as_of)
+        if np is None:
+            return [
+                _strength(*row, as_of)
+                for row in zip(
+                    self.model, self.anchor, self.half_life, self.ttl, self.valid_from, self.valid_until
+                )
+            ]
+        model = self.model
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.maximum(as_of - self.anchor, 0.0)
+            value = np.full(len(self), np.nan)
+            value[model == NONE] = 1.0
+            linear = model == LINEAR
+            value[linear] = np.clip(1.0 - t[linear] / self.ttl[linear], 0.0, 1.0)
+            exponential = model == EXPONENTIAL
+            value[exponential] = np.exp(-t[exponential] / self.half_life[exponential])
+            step = model == STEP
+            known = ~(np.isnan(t[step]) | np.isnan(self.ttl[step]))
+            value[step] = np.where(known, (t[step] < self.ttl[step]).astype(float), np.nan)
+            outside = (as_of < self.valid_from) | (as_of >= self.valid_until)
+            value[outside & ~np.isnan(value)] = 0.0
+        return value
+
+    def refreshed(self, strengths: Any) -> list[tuple[Path, str, float]]:
+        """(path, key, value) for concepts with a decay block whose stored value changes."""
+        changes = []
+        for path, key, stored, value in zip(self.paths, self.keys, self.stored, strengths):
+            if key is None or math.isnan(value):
+                continue
+            value = round(float(value), STRENGTH_DIGITS)
+            if value != stored:
+                changes.append((path, key, value))
+        return changes
+
+
+def _load_chunk(md_paths: list[Path]) -> list[tuple[Path, tuple | None]]:
+    """Worker: parse a chunk of frontmatters into freshness rows (None if unparseable)."""
+    rows = []
+    for md_path in md_paths:
+        concept = mif_convert.load_concept(md_path, with_body=False)
+        rows.append((md_path, None if concept.error else _row(concept.frontmatter)))
+    return rows
+
+
+def load_table(bundles: list[Path], jobs: int = 1) -> FreshnessTable:
+    """Parse every concept's temporal block (frontmatter only) into one table."""
+    md_paths = [md_path for bundle in bundles for md_path in mif_convert.iter_concepts(bundle)]
+    pairs = [
+        pair
+        for chunk in mif_convert.map_chunks(_load_chunk, md_paths, jobs)
+        for pair in chunk
+        if pair[1] is not None
+    ]
+    return FreshnessTable([path for path, _ in pairs], [row for _, row in pairs])
+
+
+def _write_chunk(changes: list[tuple[Path, str, float]]) -> list[Path]:
+    """Worker: store refreshed strengths (re-parsing each file with its body)."""
+    written = []
+    for md_path, key, value in changes:
+        with span("write-strength", concept=md_path):
+            frontmatter, body = mif_convert.parse_markdown(md_path.read_text())
+            frontmatter["temporal"]["decay"][key] = value
+            md_path.write_text(mif_convert.serialize_markdown(frontmatter, body))
+        written.append(md_path)
+    return written
+
+
+def write_strengths(changes: list[tuple[Path, str, float]], jobs: int = 1) -> int:
+    """Write a batch of :meth:`FreshnessTable.refreshed` changes. Returns files written."""
+    return sum(len(chunk) for chunk in mif_convert.map_chunks(_write_chunk, changes, jobs))
+
+
+class IntervalTree:
+    """Static centered interval tree over half-open ``[start, end)`` intervals.
+
+    Each node holds the intervals containing its center (the median start),
+    sorted by start ascending and by end descending; intervals entirely before
+    the center go left, entirely after it go right. Stabbing and overlap
+    queries are O(log n + k). Empty intervals (``start >= end``) are dropped.
+    """
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, intervals: list[tuple[float, float, str]]) -> None:
+        intervals = [iv for iv in intervals if iv[0] < iv[1]]
+        self.left = self.right = None
+        self.by_start: list[tuple[float, float, str]] = []
+        self.by_end: list[tuple[float, float, str]] = []
+        if not intervals:
+            self.center = 0.0
+            return
+        starts = sorted(iv[0] for iv in intervals)
+        self.center = center = starts[len(starts) // 2]
+        left, right = [], []
+        for iv in intervals:
+            if iv[1] <= center:
+                left.append(iv)
+            elif iv[0] > center:
+                right.append(iv)
+            else:
+                self.by_start.append(iv)
+        self.by_start.sort(key=lambda iv: iv[0])
+        self.by_end = sorted(self.by_start, key=lambda iv: iv[1], reverse=True)
+        self.left = IntervalTree(left) if left else None
+        self.right = IntervalTree(right) if right else None
+
+    def stab(self, x: float) -> list[str]:
+        """Items whose interval contains ``x``."""
+        found: list[str] = []
+        node = self
+        while node is not None:
+            if x < node.center:
+                # Every interval here ends after the center, hence after x.
+                for start, _, item in node.by_start:
+                    if start > x:
+                        break
+                    found.append(item)
+                node = node.left
+            else:
+                for _, end, item in node.by_end:
+                    if end <= x:
+                        break
+                    found.append(item)
+                node = node.right if x > node.center else None
+        return found
+
+    def overlap(self, lo: float, hi: float) -> list[str]:
+        """Items whose interval intersects ``[lo, hi)``."""
+        found: list[str] = []
+        stack = [self] if lo < hi else []
+        while stack:
+            node = stack.pop()
+            if hi <= node.center:
+                for start, _, item in node.by_start:
+                    if start >= hi:
+                        break
+                    found.append(item)
+            elif lo > node.center:
+                for _, end, item in node.by_end:
+                    if end <= lo:
+                        break
+                    found.append(item)
+            else:
+                found.extend(item for _, _, item in node.by_start)
+            if node.left is not None and lo < node.center:
+                stack.append(node.left)
+            if node.right is not None and hi > node.center:
+                stack.append(node.right)
+        return found
+
+
+class BitemporalIndex:
+    """Valid-time and transaction-time index over a bundle's concepts.
+
+    Built from the ``temporal`` fields a :class:`mif_index.BundleIndex` keeps
+    per entry, so no concept file is read. Valid time is the interval
+    ``[validFrom, validUntil)`` (open-ended when a bound is missing) held in an
+    :class:`IntervalTree`; transaction time is ``recordedAt`` (else
+    ``created``; -inf when neither parses), held sorted for bisection. Paths are
+    bundle-relative and results come back sorted.
+    """
+
+    def __init__(self, files: dict[str, dict] | None = None) -> None:
+        self.spans: dict[str, tuple[float, float, float]] = {}
+        self._recorded: list[tuple[float, str]] = []
+        self._tree: IntervalTree | None = None
+        files = files or {}
+        self.update(files, list(files), ())
+
+    @classmethod
+    def from_index(cls, index: mif_index.BundleIndex) -> "BitemporalIndex":
+        return cls(index.files)
+
+    def update(self, files: dict[str, dict], changed: Iterable[str], removed: Iterable[str]) -> None:
+        """Apply a :meth:`mif_index.BundleIndex.update` result (``files`` is its table).
+
+        The transaction axis is patched in place; the interval tree is rebuilt
+        from memory on the next valid-time query.
+        """
+        for rel_path in [*removed, *changed]:
+            old = self.spans.pop(rel_path, None)
+            if old is not None:
+                del self._recorded[bisect.bisect_left(self._recorded, (old[2], rel_path))]
+        for rel_path in changed:
+            fields = files[rel_path].get("temporal", {})
+            valid_from = parse_instant(fields.get("validFrom"))
+            valid_until = parse_instant(fields.get("validUntil"))
+            recorded = parse_instant(fields.get("recordedAt"))
+            axes = (
+                -math.inf if valid_from is None else valid_from,
+                math.inf if valid_until is None else valid_until,
+                -math.inf if recorded is None else recorded,
+            )
+            self.spans[rel_path] = axes
+            bisect.insort(self._recorded, (axes[2], rel_path))
+        self._tree = None
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    @property
+    def tree(self) -> IntervalTree:
+        if self._tree is None:
+            self._tree = IntervalTree([(s, e, rel_path) for rel_path, (s, e, _) in self.spans.items()])
+        return self._tree
+
+    def valid_at(self, instant: Any) -> list[str]:
+        """Concepts whose valid time contains ``instant``."""
+        return sorted(self.tree.stab(_instant(instant)))
+
+    def valid_during(self, start: Any, end: Any) -> list[str]:
+        """Concepts valid at some point of ``[start, end)``."""
+        return sorted(self.tree.overlap(_instant(start), _instant(end)))
+
+    def recorded_by(self, instant: Any) -> list[str]:
+        """Concepts recorded at or before ``instant``."""
+        cut = bisect.bisect_right(self._recorded, _instant(instant), key=_first)
+        return sorted(rel_path for _, rel_path in self._recorded[:cut])
+
+    def as_of(self, valid_at: Any, known_at: Any = None, valid_until: Any = None) -> list[str]:
+        """Concepts valid at ``valid_at`` (or during ``[valid_at, valid_until)``)
+        as recorded by ``known_at`` (default: no transaction-time cut-off).
+
+        Whichever axis selects fewer concepts is enumerated and the other is
+        checked per concept.
+        """
+        lo = _instant(valid_at)
+        hi = None if valid_until is None else _instant(valid_until)
+        if known_at is None:
+            return self.valid_at(lo) if hi is None else self.valid_during(lo, hi)
+        known = _instant(known_at)
+        cut = bisect.bisect_right(self._recorded, known, key=_first)
+        if cut < len(self.spans) // 2:
+            found = []
+            for _, rel_path in self._recorded[:cut]:
+                start, end, _ = self.spans[rel_path]
+                if (start <= lo < end) if hi is None else (start < hi and end > lo and lo < hi):
+                    found.append(rel_path)
+            return sorted(found)
+        valid = self.tree.stab(lo) if hi is None else self.tree.overlap(lo, hi)
+        return sorted(rel_path for rel_path in valid if self.spans[rel_path][2] <= known)
+
+
+def expires_at(fields: dict) -> float | None:
+    """Hard-expiry instant of an index entry's ``temporal`` fields, or None.
+
+    The earlier of ``validUntil`` and anchor + ``ttl``, the anchor being the
+    one the ``step`` model decays from (``lastReinforced``, else ``recordedAt``,
+    else ``created``). Concepts already marked ``expiredAt`` never expire again.
+    """
+    if fields.get("expiredAt") is not None:
+        return None
+    candidates = [parse_instant(fields.get("validUntil"))]
+    ttl = parse_duration(fields.get("ttl"))
+    anchor = next(
+        (
+            instant
+            for instant in map(parse_instant, (fields.get("lastReinforced"), fields.get("recordedAt")))
+            if instant is not None
+        ),
+        None,
+    )
+    if ttl and anchor is not None:
+        candidates.append(anchor + ttl)
+    candidates = [instant for instant in candidates if instant is not None]
+    return min(candidates) if candidates else None
+
+
+class ExpiryQueue:
+    """Min-heap of (expires_at, path) over a bundle's expiring concepts.
+
+    Built in O(n) from a :class:`mif_index.BundleIndex` table. ``pop_due``
+    removes what has expired in O(expired * log n); ``upcoming`` walks the heap
+    best-first for the next N without disturbing it. ``update`` pushes new
+    expiry times and leaves superseded heap entries to be skipped lazily
+    (compacting once they outnumber live ones).
+    """
+
+    def __init__(self, files: dict[str, dict] | None = None) -> None:
+        self.expiry: dict[str, float] = {}
+        self.heap: list[tuple[float, str]] = []
+        files = files or {}
+        self.update(files, list(files), ())
+
+    @classmethod
+    def from_index(cls, index: mif_index.BundleIndex) -> "ExpiryQueue":
+        return cls(index.files)
+
+    def __len__(self) -> int:
+        return len(self.expiry)
+
+    def _live(self, item: tuple[float, str]) -> bool:
+        return self.expiry.get(item[1]) == item[0]
+
+    def update(self, files: dict[str, dict], changed: Iterable[str], removed: Iterable[str]) -> None:
+        """Apply a :meth:`mif_index.BundleIndex.update` result (``files`` is its table)."""
+        for rel_path in removed:
+            self.expiry.pop(rel_path, None)
+        pushed = []
+        for rel_path in changed:
+            instant = expires_at(files[rel_path].get("temporal", {}))
+            if instant is None:
+                self.expiry.pop(rel_path, None)
+            elif self.expiry.get(rel_path) != instant:
+                self.expiry[rel_path] = instant
+                pushed.append((instant, rel_path))
+        if len(self.heap) + len(pushed) > 2 * len(self.expiry) + 64 or not self.heap:
+            self.heap = [item for item in self.heap if self._live(item)] + pushed
+            heapq.heapify(self.heap)
+        else:
+            for item in pushed:
+                heapq.heappush(self.heap, item)
+
+    def pop_due(self, as_of: Any = None) -> list[tuple[float, str]]:
+        """Remove and return every (expires_at, path) due at ``as_of`` (default: now)."""
+        cutoff = _instant(datetime.now(timezone.utc) if as_of is None else as_of)
+        due = []
+        while self.heap and self.heap[0][0] <= cutoff:
+            item = heapq.heappop(self.heap)
+            if self._live(item):
+                del self.expiry[item[1]]
+                due.append(item)
+        return due
+
+    def upcoming(self, count: int, after: Any = None) -> list[tuple[float, str]]:
+        """The next ``count`` expirations, strictly after ``after`` if given."""
+        floor = -math.inf if after is None else _instant(after)
+        found: list[tuple[float, str]] = []
+        frontier = [(self.heap[0], 0)] if self.heap else []
+        while frontier and len(found) < count:
+            item, position = heapq.heappop(frontier)
+            if item[0] > floor and self._live(item):
+                found.append(item)
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(self.heap):
+                    heapq.heappush(frontier, (self.heap[child], child))
+        return found
+
+
+def _mark_expired(md_path: Path, instant: float) -> None:
+    frontmatter, body = mif_convert.parse_markdown(md_path.read_text())
+    properties = frontmatter.get("properties")
+    if not isinstance(properties, dict):
+        properties = frontmatter["properties"] = {}
+    properties["expiredAt"] = _iso(instant)
+    md_path.write_text(mif_convert.serialize_markdown(frontmatter, body))
+
+
+def sweep(
+    bundle: Path, due: list[tuple[float, str]], archive: Path | None = None
+) -> list[Path]:
+    """Stamp ``properties.expiredAt`` on each due concept and, given an
+    ``archive`` directory, move it there under its bundle-relative path.
+
+    Returns the concepts' new locations.
+    """
+    swept = []
+    for instant, rel_path in due:
+        md_path = bundle / rel_path
+        with span("sweep", concept=md_path):
+            _mark_expired(md_path, instant)
+            if archive is not None:
+                target = archive / rel_path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(md_path, target)
+                md_path = target
+        swept.append(md_path)
+    return swept
+
+
+def _iso(instant: float) -> str:
+    return datetime.fromtimestamp(instant, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _first(pair: tuple) -> Any:
+    return pair[0]
+
+
+def _instant(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    instant = parse_instant(value)
+    if instant is None:
+        raise ValueError(f"not an ISO-8601 date/datetime: {value!r}")
+    return instant
+
+
+def _as_of_argument(value: str) -> datetime:
+    instant = parse_instant(value)
+    if instant is None:
+        raise argparse.ArgumentTypeError(f"not an ISO-8601 date/datetime: {value!r}")
+    return datetime.fromtimestamp(instant, timezone.utc)
+
+
+def cmd_freshness(args: argparse.Namespace) -> int:
+    table = load_table(args.bundles, jobs=args.jobs)
+    as_of = args.as_of or datetime.now(timezone.utc)
+    strengths = table.strengths(as_of)
+    ranked = [
+        (float(value), path)
+        for path, value in zip(table.paths, strengths)
+        if (args.below is None or value < args.below) and (args.above is None or value > args.above)
+    ]
+    # Freshest first (stalest first with --stalest); NaN always last.
+    ranked.sort(
+        key=lambda item: (
+            math.isnan(item[0]),
+            0.0 if math.isnan(item[0]) else item[0] if args.stalest else -item[0],
+            str(item[1]),
+        )
+    )
+    if args.top is not None:
+        ranked = ranked[: args.top]
+    if args.json:
+        print(
+            json.dumps(
+                [{"path": str(path), "strength": None if math.isnan(v) else v} for v, path in ranked],
+                indent=2,
+            )
+        )
+    else:
+        for value, path in ranked:
+            print(f"{'n/a' if math.isnan(value) else f'{value:.4f}':>7}  {path}")
+    if args.write:
+        written = write_strengths(table.refreshed(strengths), jobs=args.jobs)
+        print(f"Wrote currentStrength to {written} concept(s)", file=sys.stderr)
+    print(
+        f"Freshness: {len(table)} concept(s) as of {as_of.isoformat()}"
+        f"{'' if available() else ' (numpy not installed: scalar evaluation)'}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def cmd_as_of(args: argparse.Namespace) -> int:
+    bitemporal = BitemporalIndex.from_index(mif_index.open_index(args.bundle, args.index))
+    valid_at = args.valid_at or datetime.now(timezone.utc)
+    rel_paths = bitemporal.as_of(valid_at, args.known_at, args.valid_until)
+    if args.json:
+        print(json.dumps(rel_paths, indent=2))
+    else:
+        for rel_path in rel_paths:
+            print(rel_path)
+    window = (
+        f"at {valid_at.isoformat()}"
+        if args.valid_until is None
+        else f"during [{valid_at.isoformat()}, {args.valid_until.isoformat()})"
+    )
+    known = "" if args.known_at is None else f", as known at {args.known_at.isoformat()}"
+    print(f"As-of: {len(rel_paths)} of {len(bitemporal)} concept(s) valid {window}{known}", file=sys.stderr)
+    return 0
+
+
+def cmd_sweep(args: argparse.Namespace) -> int:
+    index_path = args.index or args.bundle / mif_index.INDEX_NAME
+    index = mif_index.open_index(args.bundle, index_path)
+    queue = ExpiryQueue.from_index(index)
+    as_of = args.as_of or datetime.now(timezone.utc)
+    due = queue.pop_due(as_of)
+    if args.mark or args.archive:
+        locations = sweep(args.bundle, due, args.archive)
+        index.update(args.bundle)
+        index.save(index_path)
+    else:
+        locations = [args.bundle / rel_path for _, rel_path in due]
+    if args.json:
+        print(
+            json.dumps(
+                [{"path": str(path), "expiresAt": _iso(t)} for (t, _), path in zip(due, locations)],
+                indent=2,
+            )
+        )
+    else:
+        for (instant, _), path in zip(due, locations):
+            print(f"{_iso(instant)}  {path}")
+    action = "archived" if args.archive else "marked" if args.mark else "due (dry run)"
+    print(
+        f"Sweep: {len(due)} concept(s) {action} as of {as_of.isoformat()}, {len(queue)} still expiring",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def cmd_expirations(args: argparse.Namespace) -> int:
+    queue = ExpiryQueue.from_index(mif_index.open_index(args.bundle, args.index))
+    after = args.after or datetime.now(timezone.utc)
+    upcoming = queue.upcoming(args.top, after)
+    if args.json:
+        print(json.dumps([{"path": rel_path, "expiresAt": _iso(t)} for t, rel_path in upcoming], indent=2))
+    else:
+        for instant, rel_path in upcoming:
+            print(f"{_iso(instant)}  {rel_path}")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Temporal model tools for MIF bundles")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("freshness", help="rank / filter concepts by current decay strength")
+    p.add_argument("bundles", type=Path, nargs="+", help="bundle directories")
+    p.add_argument("--as-of", type=_as_of_argument, help="evaluate at this instant (default: now)")
+    p.add_argument("--below", type=float, help="only concepts with strength below this")
+    p.add_argument("--above", type=float, help="only concepts with strength above this")
+    p.add_argument("--top", type=int, help="print at most N concepts")
+    p.add_argument("--stalest", action="store_true", help="rank stalest first")
+    p.add_argument("--json", action="store_true", help="print the ranking as JSON")
+    p.add_argument(
+        "--write", action="store_true", help="store refreshed currentStrength values in frontmatter"
+    )
+    mif_convert.add_jobs_argument(p)
+
+    p = sub.add_parser("as-of", help="list concepts valid at an instant, as known at another")
+    p.add_argument("bundle", type=Path, help="bundle directory")
+    p.add_argument("--valid-at", type=_as_of_argument, help="valid-time instant (default: now)")
+    p.add_argument(
+        "--valid-until", type=_as_of_argument, help="query the valid-time range [--valid-at, this)"
+    )
+    p.add_argument(
+        "--known-at", type=_as_of_argument, help="only concepts recorded at or before this instant"
+    )
+    p.add_argument("--json", action="store_true", help="print the paths as JSON")
+    p.add_argument(
+        "--index", type=Path, help=f"bundle index file (default: <bundle>/{mif_index.INDEX_NAME})"
+    )
+
+    p = sub.add_parser("sweep", help="mark or archive concepts whose ttl / validUntil has passed")
+    p.add_argument("bundle", type=Path, help="bundle directory")
+    p.add_argument("--as-of", type=_as_of_argument, help="sweep what is due at this instant (default: now)")
+    action = p.add_mutually_exclusive_group()
+    action.add_argument("--mark", action="store_true", help="stamp properties.expiredAt in place")
+    action.add_argument(
+        "--archive", type=Path, metavar="DIR", help="stamp and move under DIR (same relative path)"
+    )
+    p.add_argument("--json", action="store_true", help="print the swept concepts as JSON")
+    p.add_argument(
+        "--index", type=Path, help=f"bundle index file (default: <bundle>/{mif_index.INDEX_NAME})"
+    )
+
+    p = sub.add_parser("expirations", help="list the next concepts to expire")
+    p.add_argument("bundle", type=Path, help="bundle directory")
+    p.add_argument("--top", type=int, default=10, help="how many (default: 10)")
+    p.add_argument("--after", type=_as_of_argument, help="only expirations after this (default: now)")
+    p.add_argument("--json", action="store_true", help="print the expirations as JSON")
+    p.add_argument(
+        "--index", type=Path, help=f"bundle index file (default: <bundle>/{mif_index.INDEX_NAME})"
+    )
+
+    args = parser.parse_args()
+    bundles = args.bundles if args.command == "freshness" else [args.bundle]
+    missing = [bundle for bundle in bundles if not bundle.is_dir()]
+    if missing:
+        for bundle in missing:
+            print(f"Error: {bundle} is not a directory", file=sys.stderr)
+        sys.exit(1)
+    if args.command == "freshness":
+        sys.exit(cmd_freshness(args))
+    if args.command == "as-of":
+        sys.exit(cmd_as_of(args))
+    if args.command == "sweep":
+        sys.exit(cmd_sweep(args))
+    if args.command == "expirations":
+        sys.exit(cmd_expirations(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,84 +13,94 @@ concept the validator enforces:
 4. broken bundle-relative links are tolerated -- reported as warnings, never
    failures (OKF tolerates broken links);
 5. the ``markdown -> json-ld -> markdown`` projection round-trips losslessly
-   (delegated to ``mif_convert.roundtrip_file``);
+   (delegated to ``mif_convert.roundtrip_concept``);
 6. derivation edges are temporally consistent -- a ``derived-from`` / ``supersedes``
    / ``cites`` target must not be ``created`` after the concept that derives from
    it. Reported as a warning by default (non-blocking); ``--strict-temporal``
    promotes it to a hard error so a known-clean corpus can enforce it in CI.
+   It runs as one bundle-level pass over a table of parsed ``created`` values
+   (``temporal_pass``); ``check_temporal`` runs it alone and returns structured
+   ``TemporalFinding`` records.
+
+Each concept file is read and parsed exactly once per run; every check,
+including the cross-file temporal lookups, reads from that in-memory bundle
+model instead of from disk. The single-file checks (1), (3), (5) fan out to a
+process pool (``--jobs``, default one worker per core); findings are merged
+back in path order, so the report is byte-identical to a ``--jobs 1`` run.
+
+Relationship and link targets may be paths, ``urn:mif:<id>`` or a bare id /
+alias; the latter resolve through the bundle's id / alias index
+(``mif_index.py``), built from the same parsed model. Duplicate ids are errors
+and alias collisions warnings. The bundle tree is listed once per run; link
+existence in checks (4) and (6) is a lookup in that listing (``..``, a leading
+``/`` and ``#fragment`` normalized), not a ``stat`` per link.
+
+``--cache [db]`` keeps a persistent per-concept cache (default
+``.mif-cache/validate.db``) keyed by content hash, validator fingerprint and
+options; unchanged concepts are not re-parsed. The cross-file checks (4) and (6)
+are always re-derived against the current bundle, so a cached run reports
+exactly what an uncached one would (see ``mif_cache.py``).
+
+``--changed [PATH ...]`` re-validates only the given concepts, any concept
+whose size or mtime changed since the bundle's persisted index
+(``.mif-index.json``) was last updated, and every concept that references one
+of them (the index's backlinks). Those concepts get exactly the findings a full
+run would give them; deleted concepts surface as broken links in their
+dependents. ``--since <ref>`` / ``--staged`` do the same with git's change set
+(files changed since ``<ref>``, or staged) instead of the index's.
+
+``--profile <file>`` records a span per check per concept (plus read / parse;
+the structural check (2) and the temporal pass (6) run once per bundle) and
+writes them as Chrome trace-event JSON, with a per-phase summary table on
+stderr (see ``mif_profile.py``).
 
 Exit code 0 means every concept in every bundle conforms.
 
 Usage::
 
-    python okf_validate.py <bundle-dir> [bundle-dir ...] [--strict-temporal]
+    python okf_validate.py <bundle-dir> [bundle-dir ...] [--strict-temporal] [--jobs N]
+        [--cache [db]] [--changed [PATH ...] | --since REF | --staged]
+        [--profile trace.json]
     python okf_validate.py            # defaults to examples/ + profiles/*/examples/
 """
 
 from __future__ import annotations
 
-import re
+import argparse
+import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple
 
-import yaml  # PyYAML; parse_markdown's safe_load can raise yaml.YAMLError
-
+import mif_cache  # local module (same scripts/ directory)
 import mif_convert  # local module (same scripts/ directory)
+import mif_index  # local module (same scripts/ directory)
+import mif_links  # local module (same scripts/ directory)
+import mif_profile  # local module (same scripts/ directory)
+from mif_profile import span
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
 # Relationship types whose target is a *prior* concept the source is built on:
 # the target must not be created AFTER the source. (Q-a: derived-from + supersedes
-# + cites.) Stored kebab-normalized to match _kebab() output.
+# + cites.) Stored kebab-normalized to match mif_links.kebab() output.
 DERIVATION_TYPES = {"derived-from", "supersedes", "cites"}
 
-# A body relationship line: "- <kebab-type> [Text](/path/to/target.md)".
-REL_LINE_RE = re.compile(r"^-\s+([a-z0-9][a-z0-9-]*)\s+\[[^\]]+\]\(([^)]+)\)\s*$")
-# Any markdown link, for broken-link scanning.
-MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
-
-
-def _kebab(value: str) -> str:
-    """Normalize a relationship type token to kebab-case for comparison."""
-    value = re.sub(r"(?<!^)(?=[A-Z])", "-", value)
-    value = re.sub(r"[\s_]+", "-", value)
-    return value.lower()
-
-
-def _relationships_section(body: str) -> list[tuple[str, str]]:
-    """Extract (kebab-type, target) pairs from the body ## Relationships section."""
-    pairs: list[tuple[str, str]] = []
-    in_section = False
-    for line in body.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("## "):
-            in_section = stripped[3:].strip().lower() == "relationships"
-            continue
-        if in_section:
-            match = REL_LINE_RE.match(stripped)
-            if match:
-                pairs.append((_kebab(match.group(1)), match.group(2)))
-    return pairs
-
-
-def _frontmatter_relationships(frontmatter: dict) -> list[tuple[str, str]]:
-    """Extract (kebab-type, target) pairs from frontmatter relationships array."""
-    pairs: list[tuple[str, str]] = []
-    for rel in frontmatter.get("relationships", []) or []:
-        if not isinstance(rel, dict):
-            continue
-        rel_type = rel.get("type") or rel.get("relationshipType") or ""
-        target = rel.get("target", "")
-        if isinstance(target, dict):  # tolerate {"@id": ...}/{"path": ...}
-            target = target.get("path") or target.get("@id", "")
-        pairs.append((_kebab(str(rel_type)), str(target)))
-    return pairs
 
+def _resolve(
+    target: str, md_path: Path, bundle: Path, index: mif_index.BundleIndex | None = None
+) -> Path | None:
+    """Resolve a link target to a path.
 
-def _resolve(target: str, md_path: Path, bundle: Path) -> Path | None:
-    """Resolve a bundle-relative or document-relative link target to a path."""
+    With an ``index``, ``urn:mif:<id>`` targets and bare ids / aliases resolve
+    through it; otherwise targets are bundle-relative or document-relative paths.
+    """
     target = target.split("#", 1)[0]
+    if index is not None and target and not target.endswith(".md"):
+        rel_path = index.resolve(target)
+        if rel_path is not None:
+            return bundle / rel_path
     if not target or target.startswith(("http://", "https://", "urn:", "mailto:")):
         return None
     if target.startswith("/"):
@@ -114,94 +124,214 @@ def _is_date_only(value: object) -> bool:
     return isinstance(value, str) and "T" not in value and " " not in value.strip()
 
 
-def _temporal_findings(
-    frontmatter: dict, md_path: Path, bundle: Path, rel_name: object
-) -> list[str]:
-    """Findings where a derivation target is created AFTER the deriving concept.
+def _lookup_concept(
+    path: Path, concepts: dict[Path, mif_convert.Concept] | None
+) -> mif_convert.Concept | None:
+    """Return the parsed concept at resolved ``path``, or None if it is not a file.
+
+    Served from the bundle model when present; anything else (e.g. a reserved
+    ``index.md`` target) has its frontmatter (never its body) parsed on first
+    use and memoized into the model, so no file is parsed twice in one run.
+    """
+    if concepts is not None and path in concepts:
+        return concepts[path]
+    try:
+        concept = mif_convert.load_concept(path, with_body=False)
+    except OSError:
+        return None
+    if concepts is not None:
+        concepts[path] = concept
+    return concept
+
+
+class Created(NamedTuple):
+    """A concept's ``created``, parsed once for the temporal pass."""
+
+    raw: object
+    at: datetime
+    date_only: bool
+
+
+def _created(value: object) -> Created | None:
+    at = _parse_created(value)
+    return None if at is None else Created(value, at, _is_date_only(value))
+
+
+class TemporalFinding(NamedTuple):
+    """Check (6): a derivation edge whose target is created after its source."""
+
+    source: Path
+    rel_type: str
+    target: str  # as written in the source's frontmatter
+    target_path: str  # bundle-relative
+    source_created: object
+    target_created: object
+
+    def message(self, rel_name: object) -> str:
+        return (
+            f"{rel_name}: temporal inconsistency -> '{self.rel_type}' target "
+            f"{self.target} is created {self.target_created}, after concept "
+            f"created {self.source_created}"
+        )
+
+
+def temporal_pass(
+    sources: list[mif_convert.Concept],
+    bundle: Path,
+    index: mif_index.BundleIndex | None = None,
+    paths: set[str] | None = None,
+    concepts: dict[Path, mif_convert.Concept] | None = None,
+) -> list[TemporalFinding]:
+    """Check (6) over the derivation edges of ``sources``, in source order.
 
     A ``derived-from`` / ``supersedes`` / ``cites`` edge asserts the target predates
     the source; a target with a later ``created`` is a logical impossibility the
-    schema/round-trip checks cannot see. Targets that don't resolve to an existing
-    in-bundle concept, or where either ``created`` is missing/unparseable, are
-    skipped (no false positives).
+    schema/round-trip checks cannot see. Every ``created`` is parsed once into a
+    path -> :class:`Created` table and each edge is a table comparison. Targets
+    that don't resolve to an existing in-bundle concept (``paths``, the bundle
+    listing), or where either ``created`` is missing/unparseable, are skipped (no
+    false positives); ``{"@id": ...}`` and alias targets resolve through
+    ``index``. A target that is not a source (e.g. a reserved ``index.md``) is
+    looked up in the ``concepts`` model, else its frontmatter is read once.
+
+    If either side is date-only, a finer-grained other side would otherwise be
+    compared against a manufactured midnight; both are downgraded to date
+    granularity so a same-day derivation is not a false positive.
     """
-    findings: list[str] = []
-    source_raw = frontmatter.get("created")
-    source_created = _parse_created(source_raw)
-    if source_created is None:
-        return findings
-    for rel_type, target in _frontmatter_relationships(frontmatter):
-        if rel_type not in DERIVATION_TYPES:
-            continue
-        resolved = _resolve(target, md_path, bundle)
-        if resolved is None or resolved.suffix != ".md" or not resolved.exists():
+    if paths is None:
+        paths = mif_index.bundle_paths(bundle)
+    if index is None:
+        index = mif_index.BundleIndex.from_concepts(bundle, [(c, []) for c in sources])
+    bundle_root = bundle.resolve()
+    table: dict[str, Created | None] = {}
+    edges: list[tuple[mif_convert.Concept, str, str, str]] = []
+    for concept in sources:
+        if concept.error:
             continue
-        # Stay inside the bundle: a target that escapes (e.g. ``../other.md``)
-        # must not cause us to read an arbitrary file outside the bundle tree.
-        if not resolved.resolve().is_relative_to(bundle.resolve()):
-            continue
-        if resolved.resolve() == md_path.resolve():
-            continue
-        try:
-            tgt_fm, _ = mif_convert.parse_markdown(resolved.read_text())
-        except (ValueError, OSError, yaml.YAMLError):
+        source = concept.path.relative_to(bundle).as_posix()
+        table[source] = _created(concept.created)
+        for rel_type, target in mif_links.frontmatter_relationships(concept.frontmatter):
+            if rel_type not in DERIVATION_TYPES:
+                continue
+            # Escaping targets (e.g. ``../other.md``) never resolve, so no file
+            # outside the bundle tree is ever read.
+            rel_path = index.resolve_target(target, source)
+            if rel_path is None or not rel_path.endswith(".md") or rel_path not in paths:
+                continue
+            if rel_path != source:
+                edges.append((concept, rel_type, target, rel_path))
+
+    findings: list[TemporalFinding] = []
+    for concept, rel_type, target, rel_path in edges:
+        source_created = table[concept.path.relative_to(bundle).as_posix()]
+        if source_created is None:
             continue
-        target_raw = tgt_fm.get("created")
-        target_created = _parse_created(target_raw)
+        if rel_path not in table:
+            target_concept = _lookup_concept(bundle_root / rel_path, concepts)
+            ok = target_concept is not None and not target_concept.error
+            table[rel_path] = _created(target_concept.created) if ok else None
+        target_created = table[rel_path]
         if target_created is None:
             continue
-        # If either side is date-only, a finer-grained other side would otherwise
-        # be compared against a manufactured midnight; downgrade both to date
-        # granularity so a same-day derivation is not a false positive.
-        if _is_date_only(source_raw) or _is_date_only(target_raw):
-            if target_created.date() > source_created.date():
-                findings.append(
-                    f"{rel_name}: temporal inconsistency -> '{rel_type}' target "
-                    f"{target} is created {target_raw}, after concept "
-                    f"created {source_raw}"
-                )
-            continue
-        if target_created > source_created:
+        if source_created.date_only or target_created.date_only:
+            after = target_created.at.date() > source_created.at.date()
+        else:
+            after = target_created.at > source_created.at
+        if after:
             findings.append(
-                f"{rel_name}: temporal inconsistency -> '{rel_type}' target "
-                f"{target} is created {target_raw}, after concept "
-                f"created {source_raw}"
+                TemporalFinding(
+                    concept.path, rel_type, target, rel_path, source_created.raw, target_created.raw
+                )
             )
     return findings
 
 
-def validate_bundle(
-    bundle: Path, strict_temporal: bool = False
-) -> tuple[list[str], list[str], int]:
-    """Validate one bundle. Returns (errors, warnings, concept_count).
+def _temporal_findings(
+    frontmatter: dict,
+    md_path: Path,
+    bundle: Path,
+    rel_name: object,
+    concepts: dict[Path, mif_convert.Concept] | None = None,
+    index: mif_index.BundleIndex | None = None,
+    paths: set[str] | None = None,
+) -> list[str]:
+    """Check (6) messages for one concept (see :func:`temporal_pass`)."""
+    source = mif_convert.Concept(md_path, frontmatter, "", frontmatter.get("created"))
+    findings = temporal_pass([source], bundle, index, paths, concepts)
+    return [finding.message(rel_name) for finding in findings]
 
-    ``strict_temporal`` promotes temporal-inconsistency findings from warnings to
-    hard errors (exit 1). Default is WARN so the check never blocks real-world use
-    until a corpus is known clean.
+
+def check_temporal(bundle: Path, jobs: int = 1) -> list[TemporalFinding]:
+    """Check (6) alone over a whole bundle, as structured findings.
+
+    Reads only frontmatter (never bodies), fanned out over ``jobs`` processes,
+    then runs :func:`temporal_pass`; for very large bundles where the other
+    checks are not needed.
     """
-    errors: list[str] = []
-    warnings: list[str] = []
-    count = 0
+    paths = mif_index.bundle_paths(bundle)
+    md_paths = _concept_paths(bundle, paths)
+    concepts = [
+        concept for chunk in mif_convert.map_chunks(_frontmatter_chunk, md_paths, jobs) for concept in chunk
+    ]
+    return temporal_pass(concepts, bundle, paths=paths)
 
-    for md_path in mif_convert.iter_concepts(bundle):
-        count += 1
-        try:
-            rel_name = md_path.resolve().relative_to(REPO_ROOT)
-        except ValueError:
-            rel_name = md_path
-        try:
-            frontmatter, body = mif_convert.parse_markdown(md_path.read_text())
-        except ValueError as exc:
-            errors.append(f"{rel_name}: {exc}")
-            continue
 
-        # (1) frontmatter must carry a type field.
+def _frontmatter_chunk(md_paths: list[Path]) -> list[mif_convert.Concept]:
+    return [mif_convert.load_concept(md_path, with_body=False) for md_path in md_paths]
+
+
+def concept_label(md_path: Path) -> object:
+    """Repo-relative display name for a concept path (absolute if outside the repo)."""
+    try:
+        return md_path.resolve().relative_to(REPO_ROOT)
+    except ValueError:
+        return md_path
+
+
+class ConceptResult(NamedTuple):
+    """Single-file validation facts for one concept (what a worker ships back).
+
+    ``concept`` has its body dropped: the bundle-level passes need only the
+    frontmatter. ``errors`` holds parse failures and checks (1), (3) and (5);
+    ``links`` holds the raw body link targets that check (4) resolves.
+    """
+
+    concept: mif_convert.Concept
+    errors: list[str]
+    links: list[str]
+
+    def to_record(self) -> dict:
+        """Form stored (pickled, so losslessly) by the validation cache."""
+        return {
+            "frontmatter": self.concept.frontmatter,
+            "error": self.concept.error,
+            "errors": self.errors,
+            "links": self.links,
+        }
+
+    @classmethod
+    def from_record(cls, md_path: Path, record: dict) -> "ConceptResult":
+        frontmatter = record["frontmatter"]
+        concept = mif_convert.Concept(
+            md_path, frontmatter, "", frontmatter.get("created"), record["error"]
+        )
+        return cls(concept, record["errors"], record["links"])
+
+
+def _concept_findings(concept: mif_convert.Concept, rel_name: object) -> list[str]:
+    """Single-file checks (1), (3) and (5). Returns the errors."""
+    errors: list[str] = []
+    frontmatter, body, md_path = concept.frontmatter, concept.body, concept.path
+
+    # (1) frontmatter must carry a type field.
+    with span("(1) type", concept=rel_name):
         if not frontmatter.get("type"):
             errors.append(f"{rel_name}: missing required frontmatter 'type'")
 
-        # (3) relationship <-> body-link synchronization.
-        fm_rels = sorted(_frontmatter_relationships(frontmatter))
-        body_rels = sorted(_relationships_section(body))
+    # (3) relationship <-> body-link synchronization.
+    with span("(3) relationship-sync", concept=rel_name):
+        fm_rels = sorted(mif_links.frontmatter_relationships(frontmatter))
+        body_rels = sorted(mif_links.relationships_section(body))
         if fm_rels != body_rels:
             missing_body = [r for r in fm_rels if r not in body_rels]
             missing_fm = [r for r in body_rels if r not in fm_rels]
@@ -212,29 +342,256 @@ def validate_bundle(
                 detail.append(f"no frontmatter entry for {missing_fm}")
             errors.append(f"{rel_name}: relationships out of sync ({'; '.join(detail)})")
 
+    # (5) lossless round-trip, on the already-parsed concept.
+    with span("(5) round-trip", concept=rel_name):
+        rt_err = mif_convert.roundtrip_concept(frontmatter, body, md_path)
+    if rt_err:
+        errors.append(f"{rel_name}: {rt_err}")
+
+    return errors
+
+
+def _broken_links(
+    links: list[str],
+    md_path: Path,
+    bundle: Path,
+    rel_name: object,
+    index: mif_index.BundleIndex,
+    paths: set[str],
+) -> list[str]:
+    """Check (4): warnings for body links to ``.md`` targets that don't exist.
+
+    In-bundle targets are looked up in ``paths``, the bundle listing; only a
+    link escaping the bundle still asks the filesystem.
+    """
+    warnings: list[str] = []
+    source = md_path.relative_to(bundle).as_posix()
+    for target in links:
+        rel_path = index.resolve_target(target, source)
+        if rel_path is None:
+            resolved = _resolve(target, md_path, bundle)
+            missing = resolved is not None and resolved.suffix == ".md" and not resolved.exists()
+        else:
+            missing = rel_path.endswith(".md") and rel_path not in paths
+        if missing:
+            warnings.append(f"{rel_name}: broken link -> {target}")
+    return warnings
+
+
+def check_concept(concept: mif_convert.Concept) -> ConceptResult:
+    """Run the single-file checks on a parsed concept; the result drops the body."""
+    if concept.error:
+        return ConceptResult(concept, [f"{concept_label(concept.path)}: {concept.error}"], [])
+    errors = _concept_findings(concept, concept_label(concept.path))
+    links = mif_links.body_links(concept.body)
+    return ConceptResult(concept._replace(body=""), errors, links)
+
+
+def _check_chunk(md_paths: list[Path]) -> list[ConceptResult]:
+    """Worker: parse a chunk of concepts once and run the single-file checks."""
+    return [check_concept(mif_convert.load_concept(md_path)) for md_path in md_paths]
+
+
+def bundle_findings(
+    results: list[ConceptResult],
+    bundle: Path,
+    strict_temporal: bool = False,
+    index: mif_index.BundleIndex | None = None,
+    paths: set[str] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Merge single-file results and run the cross-file checks (4) and (6).
+
+    Returns (errors, warnings) in ``results`` order: per concept, its local
+    errors then temporal findings; broken links then temporal warnings. The
+    bundle's id / alias index is built from the same parsed model (no extra
+    reads) unless a whole-bundle ``index`` is supplied (``results`` may then
+    cover only part of the bundle); its duplicate ids close the errors, its
+    alias collisions (and ids shared across sibling bundles) the warnings. Link targets are checked against ``paths``,
+    one listing of the bundle tree (taken here if not supplied), instead of a
+    ``stat`` per link.
+    """
+    errors: list[str] = []
+    warnings: list[str] = []
+    if paths is None:
+        paths = mif_index.bundle_paths(bundle)
+    concepts = {result.concept.path.resolve(): result.concept for result in results}
+    if index is None:
+        index = mif_index.BundleIndex.from_concepts(
+            bundle, [(result.concept, result.links) for result in results]
+        )
+
+    # (6) temporal consistency of derivation edges, one pass over the bundle.
+    sources = [result.concept for result in results]
+    temporal: dict[Path, list[TemporalFinding]] = {}
+    with span("(6) temporal", bundle=bundle):
+        for finding in temporal_pass(sources, bundle, index, paths, concepts):
+            temporal.setdefault(finding.source, []).append(finding)
+
+    for concept, concept_errors, links in results:
+        errors.extend(concept_errors)
+        if concept.error:
+            continue
+        rel_name = concept_label(concept.path)
+
         # (4) broken links -> warnings only.
-        for match in MD_LINK_RE.finditer(body):
-            resolved = _resolve(match.group(1), md_path, bundle)
-            if resolved is not None and resolved.suffix == ".md" and not resolved.exists():
-                warnings.append(f"{rel_name}: broken link -> {match.group(1)}")
+        with span("(4) broken-links", concept=rel_name):
+            warnings.extend(_broken_links(links, concept.path, bundle, rel_name, index, paths))
 
-        # (5) lossless round-trip.
-        rt_err = mif_convert.roundtrip_file(md_path)
-        if rt_err:
-            errors.append(f"{rel_name}: {rt_err}")
+        # (6) findings are WARN unless --strict-temporal.
+        (errors if strict_temporal else warnings).extend(
+            finding.message(rel_name) for finding in temporal.get(concept.path, [])
+        )
+    label = concept_label(bundle)
+    duplicate_errors, duplicate_warnings = index.duplicate_id_findings(paths)
+    errors.extend(f"{label}: {message}" for message in duplicate_errors)
+    warnings.extend(f"{label}: {message}" for message in index.alias_collisions)
+    warnings.extend(f"{label}: {message}" for message in duplicate_warnings)
+    return errors, warnings
 
-        # (6) temporal consistency of derivation edges (WARN unless --strict-temporal).
-        temporal = _temporal_findings(frontmatter, md_path, bundle, rel_name)
-        (errors if strict_temporal else warnings).extend(temporal)
 
-    # (2) reserved-filename misuse is structural; rglob to catch any.
-    for reserved in mif_convert.RESERVED_FILENAMES:
-        for hit in bundle.rglob(reserved):
-            # Reserved files are allowed to EXIST (index/log); they just must not
-            # be treated as concepts. Presence alone is fine; nothing to flag.
-            _ = hit
+def validate_bundle(
+    bundle: Path,
+    strict_temporal: bool = False,
+    jobs: int = 1,
+    cache: mif_cache.ValidationCache | None = None,
+) -> tuple[list[str], list[str], int]:
+    """Validate one bundle. Returns (errors, warnings, concept_count).
+
+    ``strict_temporal`` promotes temporal-inconsistency findings from warnings to
+    hard errors (exit 1). Default is WARN so the check never blocks real-world use
+    until a corpus is known clean. ``jobs > 1`` runs the single-file checks in a
+    process pool; ``cache`` answers unchanged concepts from a
+    :class:`mif_cache.ValidationCache`. Either way the result is identical to a
+    serial, uncached run.
+    """
+    paths = mif_index.bundle_paths(bundle)
+    ordered = _single_file_results(_concept_paths(bundle, paths), jobs, cache)
+
+    # Bundle phase: the cross-file checks, always against the current bundle.
+    errors, warnings = bundle_findings(ordered, bundle, strict_temporal, paths=paths)
+    _check_reserved_filenames(bundle, paths)
+
+    if cache is not None:
+        cache.flush()
+    return errors, warnings, len(ordered)
+
+
+def _single_file_results(
+    md_paths: list[Path], jobs: int, cache: mif_cache.ValidationCache | None
+) -> list[ConceptResult]:
+    """Single-file phase, in ``md_paths`` order: every concept is parsed once (or
+    answered from the cache by content hash) and checks (1), (3), (5) run as it
+    is parsed."""
+    results: dict[Path, ConceptResult] = {}
+    digests: dict[Path, str] = {}
+    if cache is not None:
+        for md_path in md_paths:
+            digests[md_path] = mif_cache.file_sha256(md_path)
+            record = cache.get(md_path.resolve(), digests[md_path])
+            if record is not None:
+                results[md_path] = ConceptResult.from_record(md_path, record)
+    stale = [md_path for md_path in md_paths if md_path not in results]
+    for chunk in mif_convert.map_chunks(_check_chunk, stale, jobs):
+        for result in chunk:
+            results[result.concept.path] = result
+            if cache is not None:
+                path = result.concept.path
+                cache.put(path.resolve(), digests[path], result.to_record())
+    return [results[md_path] for md_path in md_paths]
+
+
+def _concept_paths(bundle: Path, paths: set[str]) -> list[Path]:
+    """The concepts in a bundle listing, in ``mif_convert.iter_concepts`` order."""
+    return sorted(
+        bundle / rel_path
+        for rel_path in paths
+        if rel_path.rsplit("/", 1)[-1] not in mif_convert.RESERVED_FILENAMES
+    )
+
+
+def _check_reserved_filenames(bundle: Path, paths: set[str]) -> None:
+    # (2) reserved-filename misuse is structural; scan the listing to catch any.
+    with span("(2) reserved-filenames", bundle=bundle):
+        for rel_path in paths:
+            if rel_path.rsplit("/", 1)[-1] in mif_convert.RESERVED_FILENAMES:
+                # Reserved files are allowed to EXIST (index/log); they just must not
+                # be treated as concepts. Presence alone is fine; nothing to flag.
+                pass
+
+
+def validate_changed(
+    bundle: Path,
+    changed: list[Path] | None = None,
+    strict_temporal: bool = False,
+    jobs: int = 1,
+    cache: mif_cache.ValidationCache | None = None,
+    index_path: Path | None = None,
+    detect: bool = True,
+) -> tuple[list[str], list[str], int]:
+    """Re-validate only changed concepts and their reverse dependents.
+
+    ``changed`` lists concept paths that were edited, added or deleted; with
+    ``detect``, files whose size or mtime differs from the persisted bundle
+    index (``mif_index.py``, default ``<bundle>/.mif-index.json``) are added to
+    it. Without ``detect`` (the change set is authoritative, e.g. from git) the
+    index is still brought up to date but only ``changed`` counts as changed.
+    The concepts re-checked are the changed ones that still exist plus every
+    concept referencing a changed path -- before or after the change, so an id
+    or alias that moved is followed too. Their findings are exactly those a
+    full :func:`validate_bundle` run reports for them; the index's duplicate-id
+    and alias-collision findings cover the whole bundle. Returns (errors,
+    warnings, concepts re-checked).
+    """
+    index_path = index_path or bundle / mif_index.INDEX_NAME
+    index = mif_index.BundleIndex.load(index_path)
+    targets = {
+        md_path.resolve().relative_to(bundle.resolve()).as_posix()
+        for md_path in changed or []
+        if md_path.resolve().is_relative_to(bundle.resolve())
+    }
+    previous = mif_index.BundleIndex(dict(index.files))
+    updated, removed = index.update(bundle)
+    index.save(index_path)
+    if detect:
+        targets.update(updated, removed)
+    dependents = previous.dependents(targets) | index.dependents(targets)
+
+    recheck = (targets | dependents) & index.files.keys()
+    paths = mif_index.bundle_paths(bundle)
+    results = _single_file_results(_concept_paths(bundle, recheck & paths), jobs, cache)
+    errors, warnings = bundle_findings(results, bundle, strict_temporal, index, paths)
+    _check_reserved_filenames(bundle, paths)
+
+    if cache is not None:
+        cache.flush()
+    return errors, warnings, len(results)
+
+
+def git_changed_paths(cwd: Path, since: str | None = None, staged: bool = False) -> list[Path]:
+    """Absolute paths of the ``.md`` files git reports as changed or deleted.
+
+    ``since``: files differing between ``<ref>`` and the working tree, plus
+    untracked files. ``staged``: files in the index differing from ``HEAD``
+    (their working-tree content is what gets validated). Renames count as a
+    deletion plus an addition. Raises ``ValueError`` if git fails.
+    """
 
-    return errors, warnings, count
+    def git(*args: str) -> list[str]:
+        try:
+            proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+        except OSError as exc:
+            raise ValueError(f"git not available: {exc}") from exc
+        if proc.returncode != 0:
+            raise ValueError(f"git {' '.join(args)}: {proc.stderr.strip()}")
+        return [line for line in proc.stdout.split("\0") if line]
+
+    top = Path(git("rev-parse", "--show-toplevel")[0].strip())
+    if staged:
+        names = git("diff", "--cached", "--name-only", "--no-renames", "-z")
+    else:
+        names = git("diff", "--name-only", "--no-renames", "-z", since, "--")
+        names += git("ls-files", "--others", "--exclude-standard", "-z", "--full-name", ":/")
+    return sorted({top / name for name in names if name.endswith(".md")})
 
 
 def default_bundles() -> list[Path]:
@@ -248,15 +605,57 @@ def default_bundles() -> list[Path]:
 
 
 def main() -> None:
-    args = sys.argv[1:]
-    strict_temporal = False
-    positional: list[str] = []
-    for arg in args:
-        if arg in ("--strict-temporal", "--temporal-strict"):
-            strict_temporal = True
-        else:
-            positional.append(arg)
-    bundles = [Path(a) for a in positional] if positional else default_bundles()
+    parser = argparse.ArgumentParser(description="OKF conformance validator for MIF bundles")
+    parser.add_argument(
+        "bundles", nargs="*", help="bundle directories (default: examples/ + profiles/*/examples/)"
+    )
+    parser.add_argument(
+        "--strict-temporal",
+        "--temporal-strict",
+        dest="strict_temporal",
+        action="store_true",
+        help="promote temporal-inconsistency findings from warnings to errors",
+    )
+    mif_convert.add_jobs_argument(parser)
+    mif_convert.add_profile_argument(parser)
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        nargs="?",
+        const=mif_cache.DEFAULT_PATH,
+        default=None,
+        metavar="DB",
+        help=f"reuse per-concept results for unchanged files (default DB: {mif_cache.DEFAULT_PATH})",
+    )
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument(
+        "--changed",
+        type=Path,
+        nargs="*",
+        default=None,
+        metavar="PATH",
+        help="re-check only changed concepts (these, plus files changed since the last "
+        f"--changed run per <bundle>/{mif_index.INDEX_NAME}) and the concepts linking to them",
+    )
+    scope.add_argument(
+        "--since",
+        metavar="REF",
+        help="re-check only concepts git reports changed since REF, and the concepts linking to them",
+    )
+    scope.add_argument(
+        "--staged",
+        action="store_true",
+        help="re-check only concepts staged in git, and the concepts linking to them",
+    )
+    args = parser.parse_args()
+    cache = (
+        mif_cache.ValidationCache(args.cache, {"yamlBackend": mif_convert.yaml_backend()})
+        if args.cache
+        else None
+    )
+    if args.profile:
+        mif_profile.enable()
+    bundles = [Path(a) for a in args.bundles] if args.bundles else default_bundles()
     if not bundles:
         print("No bundles found to validate.", file=sys.stderr)
         sys.exit(1)
@@ -269,7 +668,32 @@ def main() -> None:
         if not bundle.exists():
             all_errors.append(f"{bundle}: bundle directory not found")
             continue
-        errors, warnings, count = validate_bundle(bundle, strict_temporal=strict_temporal)
+        if args.since or args.staged:
+            try:
+                changed = git_changed_paths(bundle, since=args.since, staged=args.staged)
+            except ValueError as exc:
+                print(f"Error: {exc}", file=sys.stderr)
+                sys.exit(1)
+            errors, warnings, count = validate_changed(
+                bundle,
+                changed,
+                strict_temporal=args.strict_temporal,
+                jobs=args.jobs,
+                cache=cache,
+                detect=False,
+            )
+        elif args.changed is not None:
+            errors, warnings, count = validate_changed(
+                bundle,
+                args.changed,
+                strict_temporal=args.strict_temporal,
+                jobs=args.jobs,
+                cache=cache,
+            )
+        else:
+            errors, warnings, count = validate_bundle(
+                bundle, strict_temporal=args.strict_temporal, jobs=args.jobs, cache=cache
+            )
         total += count
         all_errors.extend(errors)
         all_warnings.extend(warnings)
@@ -279,6 +703,12 @@ def main() -> None:
             label = bundle
         print(f"  {label}: {count} concept(s)")
 
+    if cache is not None:
+        cache.close()
+        print(f"  cache: {cache.hits} hit(s), {cache.misses} miss(es) ({args.cache})")
+    if args.profile:
+        mif_profile.finish(args.profile)
+
     for warning in all_warnings:
         print(f"WARN  {warning}")
 
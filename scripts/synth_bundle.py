@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Reproducible synthetic MIF v1.0 bundles for benchmarking and scale testing.
+
+Every bundle is a pure function of its parameters: the same ``--seed`` always
+yields byte-identical files. Generated concepts conform (``okf_validate.py``
+passes): frontmatter relationships are mirrored in the body ``## Relationships``
+section, and derivation edges (``derived-from`` / ``supersedes`` / ``cites``)
+only ever point at an *earlier-created* concept, so the temporal check is clean.
+
+Shape of the graph:
+
+- each concept has ``0 .. 2 * fanout`` outgoing relationships (mean ``fanout``);
+- targets are drawn with a bias toward early concepts, so a few hubs collect
+  most inbound edges (the case that made per-edge target re-reads expensive);
+- ``derivation_ratio`` of edges are derivation edges, the rest are
+  ``relates-to`` / ``part-of`` / ``implements`` / ``uses``;
+- body length (characters) is log-normal around ``body_median``.
+
+``level`` selects the conformance level of the frontmatter: 1 (``id``/``type``/
+``created``), 2 (+ ``namespace``/``title``/``tags``/``aliases``/relationships)
+or 3 (+ ``temporal``, ``provenance``, ``citations``, ``entities``).
+
+Usage::
+
+    python synth_bundle.py <out-dir> --concepts 10000 [--seed 0] [--fanout 3]
+        [--derivation-ratio 0.3] [--body-median 1500] [--body-sigma 1.0] [--level 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import mif_convert  # local module (same scripts/ directory)
+
+BASE_TYPES = ["semantic", "episodic", "procedural"]
+NAMESPACES = {
+    "semantic": ["_semantic/knowledge", "_semantic/decisions", "_semantic/preferences"],
+    "episodic": ["_episodic/incidents", "_episodic/sessions"],
+    "procedural": ["_procedural/runbooks", "_procedural/patterns"],
+}
+DERIVATION_EDGES = ["derived-from", "supersedes", "cites"]
+ASSOCIATIVE_EDGES = ["relates-to", "part-of", "implements", "uses"]
+DECAY_MODELS = ["none", "linear", "exponential", "step"]
+SOURCE_TYPES = ["user_explicit", "user_implicit", "agent_inferred", "external_import"]
+TRUST_LEVELS = ["verified", "user_stated", "high_confidence", "moderate_confidence"]
+ENTITY_TYPES = ["Person", "Organization", "Technology", "Concept"]
+WORDS = (
+    "gateway latency budget quota throttle replica shard cache index schema "
+    "policy runbook incident rollback deploy release review owner client key "
+    "token session memory decay signal threshold window burst capacity queue "
+    "retry backoff region cluster node lease audit metric trace span alert"
+).split()
+# Concepts per sub-directory, so 100k-concept bundles don't put every file in one dir.
+BUCKET_SIZE = 1000
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def concept_path(index: int, base_type: str) -> str:
+    """Bundle-relative path (leading ``/``) of concept ``index``."""
+    return f"/{base_type}/{index // BUCKET_SIZE:04d}/concept-{index:07d}.md"
+
+
+def _body(rng: random.Random, title: str, length: int) -> str:
+    """Prose paragraphs of roughly ``length`` characters under a title heading."""
+    paragraphs: list[str] = []
+    size = 0
+    while size < length:
+        sentence_count = rng.randint(3, 6)
+        sentences = []
+        for _ in range(sentence_count):
+            words = rng.choices(WORDS, k=rng.randint(6, 14))
+            sentences.append(" ".join(words).capitalize() + ".")
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return f"# {title}\n\n" + "\n\n".join(paragraphs)
+
+
+def _relationships(
+    rng: random.Random, index: int, fanout: int, derivation_ratio: float, paths: list[str]
+) -> list[dict]:
+    """Outgoing edges of concept ``index``; every target is an earlier concept."""
+    if index == 0:
+        return []
+    edges: dict[tuple[str, str], dict] = {}
+    for _ in range(rng.randint(0, 2 * fanout)):
+        # rng.random() ** 2 skews toward 0: early concepts become hubs.
+        target = paths[int(index * rng.random() ** 2)]
+        if rng.random() < derivation_ratio:
+            rel_type = rng.choice(DERIVATION_EDGES)
+        else:
+            rel_type = rng.choice(ASSOCIATIVE_EDGES)
+        edges.setdefault((rel_type, target), {"type": rel_type, "target": target})
+    return list(edges.values())
+
+
+def _level3_fields(rng: random.Random, created: datetime, index: int) -> dict:
+    reinforced = created + timedelta(days=rng.randint(0, 120))
+    temporal = {
+        "@type": "TemporalMetadata",
+        "validFrom": _iso(created),
+        "validUntil": None,
+        "recordedAt": _iso(created),
+        "ttl": f"P{rng.choice([30, 90, 365, 730])}D",
+        "decay": {
+            "model": rng.choice(DECAY_MODELS),
+            "halfLife": f"P{rng.choice([7, 14, 30, 90])}D",
+            "currentStrength": round(rng.random(), 3),
+            "lastReinforced": _iso(reinforced),
+        },
+        "accessCount": rng.randint(0, 50),
+        "lastAccessed": _iso(reinforced),
+    }
+    provenance = {
+        "sourceType": rng.choice(SOURCE_TYPES),
+        "confidence": round(rng.uniform(0.5, 1.0), 2),
+        "trustLevel": rng.choice(TRUST_LEVELS),
+        "sourceRef": f"conversation:synth-{index:07d}",
+    }
+    citations = [
+        {
+            "@type": "Citation",
+            "citationType": rng.choice(["article", "documentation", "paper", "website"]),
+            "citationRole": rng.choice(["supports", "background", "source"]),
+            "title": f"Reference {index}-{n}",
+            "url": f"https://example.com/ref/{index}/{n}",
+            "relevance": round(rng.random(), 2),
+        }
+        for n in range(rng.randint(0, 2))
+    ]
+    entities = []
+    for _ in range(rng.randint(0, 3)):
+        entity_type = rng.choice(ENTITY_TYPES)
+        slug = f"{rng.choice(WORDS)}-{rng.randint(1, 500)}"
+        entities.append(
+            {
+                "@type": "EntityReference",
+                "entity": {"@id": f"urn:mif:entity:{entity_type.lower()}:{slug}"},
+                "entityType": entity_type,
+                "name": slug.replace("-", " ").title(),
+            }
+        )
+    fields: dict = {"temporal": temporal, "provenance": provenance}
+    if citations:
+        fields["citations"] = citations
+    if entities:
+        fields["entities"] = entities
+    return fields
+
+
+def generate_bundle(
+    out_dir: Path,
+    concepts: int,
+    seed: int = 0,
+    fanout: int = 3,
+    derivation_ratio: float = 0.3,
+    body_median: int = 1500,
+    body_sigma: float = 1.0,
+    level: int = 3,
+) -> list[Path]:
+    """Write a synthetic bundle of ``concepts`` concept files under ``out_dir``."""
+    rng = random.Random(seed)
+    types = [rng.choice(BASE_TYPES) for _ in range(concepts)]
+    paths = [concept_path(i, t) for i, t in enumerate(types)]
+    written: list[Path] = []
+    created = BASE_TIME
+    for index, base_type in enumerate(types):
+        # Strictly increasing created: derivation edges to earlier concepts hold.
+        created += timedelta(minutes=rng.randint(1, 30))
+        title = f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {index}"
+        frontmatter: dict = {
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "type": base_type,
+            "created": _iso(created),
+        }
+        relationships: list[dict] = []
+        if level >= 2:
+            relationships = _relationships(rng, index, fanout, derivation_ratio, paths)
+            frontmatter.update(
+                {
+                    "namespace": rng.choice(NAMESPACES[base_type]),
+                    "title": title,
+                    "tags": sorted(set(rng.choices(WORDS, k=rng.randint(1, 4)))),
+                    "aliases": [f"synth-{index:07d}"],
+                }
+            )
+            if relationships:
+                frontmatter["relationships"] = relationships
+        if level >= 3:
+            frontmatter.update(_level3_fields(rng, created, index))
+        length = int(rng.lognormvariate(math.log(body_median), body_sigma))
+        body = _body(rng, title, length)
+        if relationships:
+            lines = [
+                f"- {rel['type']} [Concept {rel['target']}]({rel['target']})"
+                for rel in relationships
+            ]
+            body += "\n\n## Relationships\n\n" + "\n".join(lines)
+        dest = out_dir / paths[index].lstrip("/")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(mif_convert.serialize_markdown(frontmatter, body))
+        written.append(dest)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic MIF bundle")
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--concepts", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fanout", type=int, default=3, help="mean outgoing relationships")
+    parser.add_argument(
+        "--derivation-ratio", type=float, default=0.3, help="share of derivation edges"
+    )
+    parser.add_argument("--body-median", type=int, default=1500, help="median body chars")
+    parser.add_argument("--body-sigma", type=float, default=1.0, help="log-normal sigma")
+    parser.add_argument("--level", type=int, choices=[1, 2, 3], default=3)
+    args = parser.parse_args()
+
+    if args.out_dir.exists() and any(args.out_dir.iterdir()):
+        print(f"Error: {args.out_dir} exists and is not empty", file=sys.stderr)
+        sys.exit(1)
+    written = generate_bundle(
+        args.out_dir,
+        args.concepts,
+        seed=args.seed,
+        fanout=args.fanout,
+        derivation_ratio=args.derivation_ratio,
+        body_median=args.body_median,
+        body_sigma=args.body_sigma,
+        level=args.level,
+    )
+    print(f"Generated {len(written)} concept(s) in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Tests for the single-pass ``mif_check`` pipeline and in-process schema
+validation (``mif_schema``).
+
+Run: ``python -m pytest scripts/test_mif_check.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_check  # noqa: E402
+import mif_convert  # noqa: E402
+import mif_schema  # noqa: E402
+import okf_validate  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+BUNDLES = [
+    ROOT / "examples",
+    ROOT / "profiles" / "ai-memory" / "examples",
+    ROOT / "test" / "temporal" / "bad",
+]
+
+
+def test_conformance_matches_okf_validate():
+    for bundle in BUNDLES:
+        for strict in (False, True):
+            errors, warnings, count = okf_validate.validate_bundle(bundle, strict_temporal=strict)
+            section = mif_check.check_bundle(bundle, strict_temporal=strict, jobs=2)
+            assert section["concepts"] == count
+            assert section["errors"]["conformance"] == errors
+            assert section["warnings"] == warnings
+
+
+def test_single_pass_parses_each_concept_once(monkeypatch):
+    calls = []
+    real_parse = mif_convert.parse_markdown
+
+    def counting_parse(md_text):
+        calls.append(md_text)
+        return real_parse(md_text)
+
+    monkeypatch.setattr(mif_convert, "parse_markdown", counting_parse)
+    section = mif_check.check_bundle(ROOT / "examples")
+    assert len(calls) == section["concepts"] == 3
+    assert not any(section["errors"].values())
+
+
+def test_emitted_projections_match_emit_jsonld(tmp_path, capsys):
+    for bundle in BUNDLES[:2]:
+        mif_check.check_bundle(bundle, out_dir=tmp_path / "check", jobs=2)
+    mif_convert.cmd_emit_jsonld(BUNDLES[:2], tmp_path / "emit")
+    emitted = {p.relative_to(tmp_path / "emit"): p.read_bytes() for p in (tmp_path / "emit").rglob("*.jsonld")}
+    checked = {p.relative_to(tmp_path / "check"): p.read_bytes() for p in (tmp_path / "check").rglob("*.jsonld")}
+    assert emitted and checked == emitted
+
+
+def test_schema_violation_is_reported(tmp_path):
+    # An invalid base type projects to a conceptType the schema rejects.
+    (tmp_path / "bad.md").write_text("---\nid: b\ntype: 42\ncreated: 2024-01-01T00:00:00Z\n---\nbody\n")
+    section = mif_check.check_bundle(tmp_path)
+    assert section["errors"]["schema"]
+    assert all("schema:" in finding for finding in section["errors"]["schema"])
+
+
+def test_bad_created_fails_the_schema_stage(tmp_path, monkeypatch):
+    (tmp_path / "bad.md").write_text(
+        "---\nid: b\ntype: semantic\ncreated: not a timestamp\n---\nbody\n"
+    )
+    section = mif_check.check_bundle(tmp_path)
+    assert section["errors"]["schema"]
+    if mif_schema.unusable_reason() is None:
+        assert any("is not a 'date-time'" in e for e in section["errors"]["schema"])
+
+    # Without format checkers the stage fails closed, per concept and at the CLI.
+    monkeypatch.setattr(mif_schema, "unchecked_formats", lambda path: frozenset({"date-time"}))
+    (finding,) = mif_check.check_bundle(tmp_path)["errors"]["schema"]
+    assert "cannot check format(s) date-time" in finding
+    monkeypatch.setattr(sys, "argv", ["mif_check.py", str(tmp_path)])
+    with pytest.raises(SystemExit) as exit_info:
+        mif_check.main()
+    assert exit_info.value.code == 1
+
+
+def test_schema_refs_resolve_offline():
+    # mif.schema.json's $ref to definitions/entity-reference.schema.json resolves
+    # from the local registry: a bad nested entity reference is caught.
+    frontmatter, body = mif_convert.parse_markdown(
+        (ROOT / "profiles" / "ai-memory" / "examples" / "level-3-full.md").read_text()
+    )
+    jsonld = mif_convert.md_to_jsonld(frontmatter, body)
+    assert mif_schema.schema_errors(jsonld, "x") == []
+    jsonld["entities"] = [{"@type": "EntityReference"}]
+    assert mif_schema.schema_errors(jsonld, "x")
+
+
+def test_validate_paths_covers_bundles_and_emitted_projections(tmp_path, capsys):
+    mif_convert.cmd_emit_jsonld(BUNDLES[:2], tmp_path)
+    serial = mif_schema.validate_paths(BUNDLES[:2] + [tmp_path], jobs=1)
+    assert serial == (14, [])
+    assert mif_schema.validate_paths(BUNDLES[:2] + [tmp_path], jobs=3) == serial
+
+
+def test_embedded_citations_checked_against_citation_schema():
+    frontmatter, body = mif_convert.parse_markdown(
+        (ROOT / "profiles" / "ai-memory" / "examples" / "level-3-citations.md").read_text()
+    )
+    jsonld = mif_convert.md_to_jsonld(frontmatter, body)
+    assert mif_schema.projection_errors(jsonld, "x") == []
+    del jsonld["citations"][1]["url"]
+    errors = mif_schema.projection_errors(jsonld, "x")
+    assert any(e.startswith("x citations[1]: schema: 'url' is a required property") for e in errors)
+
+
+def test_bad_date_time_fails_or_validation_fails_closed(monkeypatch):
+    frontmatter, body = mif_convert.parse_markdown(
+        (ROOT / "examples" / "semantic" / "rate-limit-policy.md").read_text()
+    )
+    jsonld = mif_convert.md_to_jsonld({**frontmatter, "created": "not a timestamp"}, body)
+    errors = mif_schema.projection_errors(jsonld, "x")
+    assert errors
+    if mif_schema.unusable_reason() is None:
+        assert any("'not a timestamp' is not a 'date-time'" in e for e in errors)
+
+    # Without the format extras, every projection fails with what to install.
+    monkeypatch.setattr(mif_schema, "unchecked_formats", lambda path: frozenset({"date-time"}))
+    assert mif_schema.projection_errors({}, "x") == [
+        "x: schema: jsonschema cannot check format(s) date-time "
+        "(install: pip install 'jsonschema[format]')"
+    ]
+    assert mif_schema.cmd_validate([ROOT / "examples"]) == 1
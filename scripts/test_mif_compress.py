@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Tests for the spec section 5.6 compression pass (``mif_compress``).
+
+Run: ``python -m pytest scripts/test_mif_compress.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_compress  # noqa: E402
+import mif_convert  # noqa: E402
+import okf_validate  # noqa: E402
+
+AS_OF = "2026-06-01T00:00:00Z"
+LONG = "\n".join(f"Line {i} of the original notes." for i in range(150))
+RELS = "## Relationships\n\n- relates-to [Other](/other.md)\n"
+
+
+def _concept(
+    path: Path, created: str, body: str, summary: str | None = "Short summary.", extra: str = ""
+) -> None:
+    lines = ["---", f"id: {path.stem}", "type: semantic", f"created: '{created}'"]
+    if summary is not None:
+        lines.append(f"summary: {summary}")
+    path.write_text("\n".join(lines) + f"\n{extra}---\n\n{body}\n")
+
+
+def _bundle(root: Path) -> None:
+    rel = "relationships:\n  - type: relates-to\n    target: /other.md\n"
+    _concept(root / "old.md", "2026-01-01T00:00:00Z", f"# Old\n\n{LONG}\n\n{RELS}", extra=rel)
+    _concept(root / "twin.md", "2026-01-01T00:00:00Z", f"# Old\n\n{LONG}\n\n{RELS}", extra=rel)
+    _concept(root / "young.md", "2026-05-20T00:00:00Z", LONG)
+    _concept(
+        root / "weak.md",
+        "2026-05-20T00:00:00Z",
+        LONG,
+        extra="temporal:\n  decay:\n    model: exponential\n    halfLife: P1D\n",
+    )
+    _concept(root / "short.md", "2025-01-01T00:00:00Z", "Just a few lines.")
+    _concept(root / "nosummary.md", "2025-01-01T00:00:00Z", LONG, summary=None)
+    _concept(root / "other.md", "2026-01-01T00:00:00Z", "Target.")
+
+
+def test_selects_by_spec_criteria(tmp_path):
+    _bundle(tmp_path)
+    outcomes = mif_compress.compress(tmp_path, as_of=AS_OF, dry_run=True)
+    assert [(o.path.name, o.status) for o in outcomes] == [
+        ("nosummary.md", "no-summary"),
+        ("old.md", "candidate"),  # > 30 days old
+        ("twin.md", "candidate"),
+        ("weak.md", "candidate"),  # strength e^-12 < 0.3
+    ]
+    assert not (tmp_path / mif_compress.ARCHIVE_NAME).exists()
+
+
+def test_compress_then_restore_round_trips(tmp_path):
+    _bundle(tmp_path)
+    canonical = {
+        p.name: mif_convert.serialize_markdown(*mif_convert.parse_markdown(p.read_text()))
+        for p in tmp_path.glob("*.md")
+    }
+    before = sum(p.stat().st_size for p in tmp_path.glob("*.md"))
+    outcomes = mif_compress.compress(tmp_path, as_of=AS_OF, codec="gzip", jobs=2)
+    compressed = [o for o in outcomes if o.status == "compressed"]
+    assert [o.path.name for o in compressed] == ["old.md", "twin.md", "weak.md"]
+    assert compressed[0].sha256 == compressed[1].sha256  # identical bodies share a blob
+    assert len(list((tmp_path / mif_compress.ARCHIVE_NAME).rglob("*.gz"))) == 2
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.md")) < before / 2
+
+    frontmatter, body = mif_convert.parse_markdown((tmp_path / "old.md").read_text())
+    assert frontmatter["compressedAt"] == AS_OF
+    assert frontmatter["extensions"] == {
+        "original_content": {"sha256": compressed[0].sha256, "codec": "gzip"}
+    }
+    assert body.strip() == f"Short summary.\n\n{RELS.strip()}"
+    errors, _, _ = okf_validate.validate_bundle(tmp_path)
+    assert errors == []
+    # Already compressed: a second pass leaves everything alone.
+    assert [o.status for o in mif_compress.compress(tmp_path, as_of=AS_OF)] == ["no-summary"]
+
+    restored = mif_compress.restore(tmp_path, paths=[tmp_path / "weak.md"])
+    assert [(o.path.name, o.status) for o in restored] == [("weak.md", "restored")]
+    assert [o.path.name for o in mif_compress.restore(tmp_path)] == ["old.md", "twin.md"]
+    for name in ("old.md", "twin.md", "weak.md"):
+        assert (tmp_path / name).read_text() == canonical[name]
+
+
+def test_restore_rejects_a_corrupt_blob(tmp_path):
+    _bundle(tmp_path)
+    outcomes = mif_compress.compress(tmp_path, as_of=AS_OF, codec="gzip")
+    (outcome,) = [o for o in outcomes if o.path.name == "weak.md"]
+    blob = mif_compress.blob_path(tmp_path / mif_compress.ARCHIVE_NAME, outcome.sha256, "gzip")
+    blob.write_bytes(mif_compress.gzip.compress(b"tampered"))
+    (result,) = mif_compress.restore(tmp_path, paths=[tmp_path / "weak.md"])
+    assert result.status.startswith("error") and "sha256" in result.status
+    assert mif_convert.parse_markdown((tmp_path / "weak.md").read_text())[0]["compressedAt"] == AS_OF
+
+
+def test_zstd_blobs_when_available(tmp_path):
+    pytest.importorskip("zstandard")
+    _bundle(tmp_path)
+    mif_compress.compress(tmp_path, as_of=AS_OF, codec="zstd")
+    assert list((tmp_path / mif_compress.ARCHIVE_NAME).rglob("*.zst"))
+    assert {o.status for o in mif_compress.restore(tmp_path)} == {"restored"}
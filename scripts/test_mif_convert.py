@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Tests for the ``mif_convert`` bundle commands: parallel and incremental
+``emit-jsonld``, streaming NDJSON / ``@graph`` export and import, YAML
+backend (libyaml vs pure Python) parity, and the frontmatter-only reader.
+
+Run: ``python -m pytest scripts/test_mif_convert.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_convert  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+BUNDLES = [ROOT / "examples", ROOT / "profiles" / "ai-memory" / "examples"]
+
+
+def _tree(root: Path, pattern: str = "*.jsonld") -> dict[Path, bytes]:
+    return {p.relative_to(root): p.read_bytes() for p in root.rglob(pattern)}
+
+
+def test_parallel_emit_jsonld_is_byte_identical(tmp_path, capsys):
+    assert mif_convert.cmd_emit_jsonld(BUNDLES, tmp_path / "serial", jobs=1) == 0
+    assert mif_convert.cmd_emit_jsonld(BUNDLES, tmp_path / "parallel", jobs=3) == 0
+    serial = _tree(tmp_path / "serial")
+    assert serial and _tree(tmp_path / "parallel") == serial
+
+
+def test_incremental_emit_reprojects_only_changed_concepts(tmp_path, capsys):
+    bundle = tmp_path / "bundle"
+    shutil.copytree(ROOT / "examples", bundle)
+    out = tmp_path / "out"
+    assert mif_convert.cmd_emit_jsonld([bundle], out, incremental=True) == 0
+    first = _tree(out)
+    assert len(first) == 3
+    assert "Emitted 3 " in capsys.readouterr().out
+
+    # No change -> nothing re-projected, outputs untouched.
+    mif_convert.cmd_emit_jsonld([bundle], out, incremental=True)
+    assert "Emitted 0 JSON-LD projection(s)" in capsys.readouterr().out
+    assert _tree(out) == first
+
+    # One source edited, one deleted -> one re-projection, one removal.
+    changed = bundle / "semantic" / "rate-limit-policy.md"
+    changed.write_text(changed.read_text().replace("600 requests", "900 requests"))
+    (bundle / "procedural" / "rotate-api-keys.md").unlink()
+    mif_convert.cmd_emit_jsonld([bundle], out, incremental=True)
+    assert "(1 unchanged, 1 removed)" in capsys.readouterr().out
+    assert not (out / "bundle" / "procedural" / "rotate-api-keys.jsonld").exists()
+    assert "900 requests" in (out / "bundle" / "semantic" / "rate-limit-policy.jsonld").read_text()
+
+    # Incremental output is identical to a full emit of the same tree.
+    mif_convert.cmd_emit_jsonld([bundle], tmp_path / "full")
+    assert _tree(out) == _tree(tmp_path / "full")
+
+
+def test_incremental_emit_of_bundles_in_turn_keeps_the_others(tmp_path, capsys):
+    first, second = tmp_path / "a" / "examples", tmp_path / "b" / "examples"
+    shutil.copytree(ROOT / "examples", first)
+    shutil.copytree(ROOT / "profiles" / "ai-memory" / "examples", second)
+    out = tmp_path / "out"
+    mif_convert.cmd_emit_jsonld([first], out, incremental=True)
+    mif_convert.cmd_emit_jsonld([second], out, incremental=True)
+    assert "(0 unchanged, 0 removed)" in capsys.readouterr().out.splitlines()[-1]
+    assert len(_tree(out)) == 7  # both bundles share out/examples/
+
+    # Re-running either bundle alone leaves the other's projections alone.
+    mif_convert.cmd_emit_jsonld([first], out, incremental=True)
+    assert "Emitted 0 JSON-LD projection(s)" in capsys.readouterr().out
+    assert len(_tree(out)) == 7
+    (second / "level-1-minimal.md").unlink()
+    mif_convert.cmd_emit_jsonld([second], out, incremental=True)
+    assert "(3 unchanged, 1 removed)" in capsys.readouterr().out
+    assert not (out / "examples" / "level-1-minimal.jsonld").exists()
+    assert (out / "examples" / "semantic" / "rate-limit-policy.jsonld").exists()
+
+    # Together, incremental output still matches a full emit of both bundles.
+    mif_convert.cmd_emit_jsonld([first, second], out, incremental=True)
+    assert "Emitted 0 JSON-LD projection(s)" in capsys.readouterr().out
+    mif_convert.cmd_emit_jsonld([first, second], tmp_path / "full")
+    assert _tree(out) == _tree(tmp_path / "full")
+
+
+def test_incremental_emit_reprojects_after_a_converter_change(tmp_path, capsys, monkeypatch):
+    out = tmp_path / "out"
+    mif_convert.cmd_emit_jsonld(BUNDLES[:1], out, incremental=True)
+    capsys.readouterr()
+    monkeypatch.setattr(mif_convert, "converter_sha256", lambda: "0" * 64)
+    mif_convert.cmd_emit_jsonld(BUNDLES[:1], out, incremental=True)
+    assert "Emitted 3 JSON-LD projection(s)" in capsys.readouterr().out
+
+
+def _export(tmp_path: Path, name: str, **kwargs) -> Path:
+    out = tmp_path / name
+    with out.open("w", encoding="utf-8") as stream:
+        assert mif_convert.export_bundles(BUNDLES, stream, **kwargs) == 7
+    return out
+
+
+def test_export_ndjson_is_one_projection_per_line(tmp_path):
+    lines = _export(tmp_path, "bundle.ndjson").read_text().splitlines()
+    assert len(lines) == 7
+    records = [json.loads(line) for line in lines]
+    assert all(r["@context"] == mif_convert.CONTEXT_URL for r in records)
+    assert records[0]["path"].startswith("examples/")
+
+
+def test_export_graph_is_a_single_jsonld_document(tmp_path):
+    document = json.loads(_export(tmp_path, "bundle.jsonld", graph=True).read_text())
+    assert document["@context"] == mif_convert.CONTEXT_URL
+    assert len(document["@graph"]) == 7
+    assert all("@context" not in node for node in document["@graph"])
+
+
+def test_parallel_export_is_byte_identical(tmp_path):
+    for graph in (False, True):
+        serial = _export(tmp_path, "serial", graph=graph).read_bytes()
+        assert _export(tmp_path, "parallel", graph=graph, jobs=3).read_bytes() == serial
+
+
+def test_export_import_round_trip_reproduces_canonical_bundle(tmp_path):
+    for graph in (False, True):
+        exported = _export(tmp_path, f"bundle-{graph}", graph=graph)
+        restored = tmp_path / f"restored-{graph}"
+        with exported.open(encoding="utf-8") as stream:
+            assert mif_convert.import_projections(stream, restored) == 7
+        for bundle in BUNDLES:
+            for md_path in mif_convert.iter_concepts(bundle):
+                rel = md_path.relative_to(bundle)
+                expected = mif_convert.normalize(md_path.read_text())
+                assert (restored / bundle.name / rel).read_text() == expected
+
+
+def test_import_refuses_paths_escaping_the_bundle(tmp_path):
+    record = {"@id": "urn:mif:x", "conceptType": "semantic", "path": "../evil.md"}
+    stream = io.StringIO(json.dumps(record) + "\n")
+    with pytest.raises(ValueError):
+        mif_convert.import_projections(stream, tmp_path / "out")
+    assert not (tmp_path / "evil.md").exists()
+
+
+requires_libyaml = pytest.mark.skipif(
+    "libyaml" not in mif_convert.YAML_BACKENDS, reason="PyYAML built without libyaml"
+)
+
+
+@requires_libyaml
+def test_yaml_backends_produce_identical_canonical_markdown():
+    # Invariant 4 must hold whichever backend is active: every example concept
+    # parses and re-serializes byte-identically under libyaml and pure Python.
+    bundles = BUNDLES + [ROOT / "docs" / "examples" / "memories", ROOT / "test"]
+    md_paths = [p for bundle in bundles for p in mif_convert.iter_concepts(bundle)]
+    assert md_paths
+    assert [mif_convert.yaml_parity_file(p) for p in md_paths] == [None] * len(md_paths)
+
+
+@requires_libyaml
+def test_roundtrip_yaml_parity_mode_passes_over_examples(capsys):
+    assert mif_convert.cmd_roundtrip(BUNDLES, yaml_parity=True) == 0
+    assert "compared python, libyaml" in capsys.readouterr().out
+
+
+def test_set_yaml_backend_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        mif_convert.set_yaml_backend("no-such-backend")
+    assert mif_convert.yaml_backend() in mif_convert.YAML_BACKENDS
+
+
+def test_unknown_yaml_backend_env_warns_and_keeps_the_default():
+    code = "import mif_convert; print(mif_convert.yaml_backend())"
+    env = {**os.environ, "MIF_YAML_BACKEND": "bogus"}
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT / "scripts", env=env, capture_output=True, text=True
+    )
+    assert proc.returncode == 0
+    default = "libyaml" if "libyaml" in mif_convert.YAML_BACKENDS else "python"
+    assert proc.stdout.strip() == default
+    assert "Warning: MIF_YAML_BACKEND: YAML backend 'bogus' unavailable" in proc.stderr
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "---\nid: a\ntype: semantic\n---\n\nBody text.\n",
+        "---\nid: a\n---\nno blank line\n",
+        "---\nid: a\n---",
+        "---\nid: a\n---trailing\nrest\n",
+        "---\n\n---\nempty frontmatter\n",
+        "---\n---\nid: a\n---\nfirst line is dashes\n",
+        "---\nid: a\n---\nbody\n---\nlater rule is body\n",
+    ],
+)
+def test_read_frontmatter_matches_full_file_split(tmp_path, text):
+    md_path = tmp_path / "c.md"
+    md_path.write_text(text)
+    match = mif_convert.FRONTMATTER_RE.match(text)
+    yaml_text, body = mif_convert.read_frontmatter(md_path)
+    assert yaml_text == match.group(1)
+    assert body.read() == match.group(2)
+
+
+@pytest.mark.parametrize("text", ["no frontmatter\n", "---\nid: a\n", "---\n---\n"])
+def test_read_frontmatter_rejects_what_the_regex_rejects(tmp_path, text):
+    md_path = tmp_path / "c.md"
+    md_path.write_text(text)
+    assert mif_convert.FRONTMATTER_RE.match(text) is None
+    with pytest.raises(ValueError):
+        mif_convert.read_frontmatter(md_path)
+
+
+def test_load_frontmatter_stops_at_closing_fence(tmp_path):
+    md_path = tmp_path / "big.md"
+    md_path.write_text("---\nid: a\ncreated: 2026-01-01\n---\n" + "x" * 1_000_000)
+    frontmatter, body = mif_convert.load_frontmatter(md_path)
+    assert frontmatter == {"id": "a", "created": "2026-01-01"}
+    assert body.offset < 100
+    assert len(body.read()) == 1_000_000
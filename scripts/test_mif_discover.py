@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Tests for the compiled discovery-pattern engine (``mif_discover``).
+
+Run: ``python -m pytest scripts/test_mif_discover.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_convert  # noqa: E402
+import mif_discover  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _ontology(patterns, threshold=0.5, enabled=True, **extra):
+    discovery = {"enabled": enabled, "confidence_threshold": threshold, "patterns": patterns}
+    discovery.update(extra)
+    return {"ontology": {"id": "t"}, "discovery": discovery}
+
+
+def _engine(data):
+    return mif_discover.DiscoveryEngine(mif_discover.ontology_patterns(data, "t"))
+
+
+def test_ai_memory_patterns_load_from_the_profile():
+    patterns = mif_discover.load_patterns([ROOT / "profiles" / "ai-memory" / "ontology.yaml"])
+    assert [p.entity for p in patterns] == ["session", "session", "observation", "skill"]
+    assert {p.threshold for p in patterns} == {0.8}
+
+
+def test_combined_matcher_counts_hits_per_pattern():
+    engine = _engine(
+        _ontology(
+            [
+                {"content_pattern": r"\bpostgres\b", "suggest_entity": "technology"},
+                {"content_pattern": r"\bredis\b", "suggest_entity": "technology"},
+                {"content_pattern": r"\bhow to\b", "suggest_entity": "skill",
+                 "suggest_namespace": "_procedural/skills"},
+            ]
+        )
+    )
+    found = engine.scan("a.md", "postgres and redis; how to run postgres")
+    by_entity = {s.entity: s for s in found}
+    # A content hit weighs the threshold (0.5); evidence combines: 3 hits -> 1 - 0.5**3.
+    assert by_entity["technology"].content_hits == 3
+    assert by_entity["technology"].confidence == pytest.approx(1 - 0.5**3, abs=1e-4)
+    assert by_entity["skill"].namespace == "_procedural/skills"
+    assert by_entity["skill"].confidence == pytest.approx(0.5)
+
+
+def test_weights_derive_from_the_threshold_unless_given():
+    rules = [
+        {"content_pattern": "deploy", "suggest_entity": "event"},
+        {"file_pattern": "ops/*.md", "suggest_entity": "event"},
+    ]
+    (hit,) = _engine(_ontology(rules, threshold=0.8)).scan("a.md", "deploy")
+    assert hit.confidence == pytest.approx(0.8)  # one content hit meets the default threshold
+    (both,) = _engine(_ontology(rules, threshold=0.8)).scan("ops/a.md", "deploy")
+    assert both.confidence == pytest.approx(1 - 0.2 * 0.1) and both.file_match
+    assert mif_discover.evidence_weights(0.8) == pytest.approx({"content": 0.8, "file": 0.9})
+
+    weak = mif_discover.DiscoveryEngine(
+        mif_discover.ontology_patterns(_ontology(rules, threshold=0.8), "t", content_weight=0.6)
+    )
+    assert weak.scan("a.md", "deploy") == []
+    assert len(weak.scan("a.md", "deploy deploy")) == 1  # 1 - 0.4**2 = 0.84
+    assert _engine(_ontology(rules, enabled=False)).scan("ops/a.md", "deploy") == []
+
+
+def test_file_globs_and_separate_pattern_arrays():
+    engine = _engine(
+        _ontology(
+            [{"file_pattern": "**/services/**/*.md", "suggest_entity": "component"}],
+            content_patterns=[{"pattern": "(?i)KAFKA", "namespaces": ["_semantic/a", "_semantic/b"]}],
+            file_patterns=[{"pattern": r"^runbooks/", "suggest_entity": "runbook"}],
+        )
+    )
+    assert [s.entity for s in engine.scan("x/services/api/y.md", "")] == ["component"]
+    assert [s.entity for s in engine.scan("services/y.md", "")] == ["component"]
+    assert engine.scan("services/api/sub/y.txt", "") == []
+    assert [s.entity for s in engine.scan("runbooks/r.md", "")] == ["runbook"]
+    # A global inline flag can't join the alternation; it is scanned on its own.
+    assert len(engine.separate) == 1
+    found = engine.scan("n.md", "kafka")
+    assert sorted(s.namespace for s in found) == ["_semantic/a", "_semantic/b"]
+
+
+def test_overlapping_patterns_from_two_ontologies_all_count():
+    patterns = []
+    for oid, rules in (
+        ("a", [{"content_pattern": r"\bdatabase\b", "suggest_entity": "technology"}]),
+        ("b", [{"content_pattern": r"\bdatabase\b", "suggest_entity": "store"},
+               {"content_pattern": r"\bdata", "suggest_entity": "dataset"}]),
+    ):
+        data = _ontology(rules, threshold=0.1)
+        data["ontology"]["id"] = oid
+        patterns.extend(mif_discover.ontology_patterns(data, oid))
+    engine = mif_discover.DiscoveryEngine(patterns)
+    found = engine.scan("a.md", "database, databases")
+    found = {(s.ontology, s.entity): s.content_hits for s in found}
+    assert found == {("a", "technology"): 1, ("b", "store"): 1, ("b", "dataset"): 2}
+    assert engine.scan("a.md", "nothing relevant") == []
+
+
+def test_named_groups_and_backreferences_are_scanned_alone():
+    engine = _engine(
+        _ontology(
+            [
+                {"content_pattern": r"(?P<w>\bship\b)", "suggest_entity": "a"},
+                {"content_pattern": r"(?P<w>\bdeploy\b)", "suggest_entity": "b"},
+                {"content_pattern": r"(\w+) again", "suggest_entity": "c"},
+                {"content_pattern": r"(\w+) \1", "suggest_entity": "d"},
+            ],
+            threshold=0.1,
+        )
+    )
+    assert len(engine.separate) == 3  # both named groups and the backreference
+    found = {s.entity: s.content_hits for s in engine.scan("a.md", "ship it, deploy deploy again")}
+    assert found == {"a": 1, "b": 2, "c": 1, "d": 1}
+
+
+def test_cli_reports_invalid_patterns(tmp_path, monkeypatch, capsys):
+    (tmp_path / "bundle").mkdir()
+    ontology = tmp_path / "bad.ontology.yaml"
+    ontology.write_text(yaml.safe_dump(_ontology([{"content_pattern": "(unclosed"}])))
+    monkeypatch.setattr(
+        sys, "argv", ["mif_discover.py", str(tmp_path / "bundle"), "--ontology", str(ontology)]
+    )
+    with pytest.raises(SystemExit) as exit_info:
+        mif_discover.main()
+    assert exit_info.value.code == 1
+    assert "invalid content pattern" in capsys.readouterr().err
+
+
+def test_invalid_pattern_is_reported():
+    with pytest.raises(ValueError, match="invalid content pattern"):
+        _engine(_ontology([{"content_pattern": "(unclosed"}]))
+
+
+def test_parallel_discovery_matches_serial(tmp_path):
+    bundle = tmp_path / "bundle"
+    for i in range(40):
+        body = "how to deploy. " * (i % 3) + "turns out " * (i % 2)
+        (bundle / f"d{i % 4}").mkdir(parents=True, exist_ok=True)
+        (bundle / f"d{i % 4}" / f"c{i:02d}.md").write_text(
+            mif_convert.serialize_markdown({"id": str(i), "type": "semantic"}, body)
+        )
+    ontology = tmp_path / "t.ontology.yaml"
+    ontology.write_text(yaml.safe_dump(_ontology(
+        [{"content_pattern": r"\bhow to\b", "suggest_entity": "skill"},
+         {"content_pattern": r"\bturns out\b", "suggest_entity": "observation"}]
+    )))
+    engine = mif_discover.DiscoveryEngine(mif_discover.load_patterns([tmp_path]))
+    serial = mif_discover.discover([bundle], engine, jobs=1)
+    assert serial and mif_discover.discover([bundle], engine, jobs=3) == serial
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Tests for the bundle id / alias / backlink index (``mif_index``) and its use
+by the OKF validator: relationship resolution and ``--changed`` / ``--since``
+revalidation.
+
+Run: ``python -m pytest scripts/test_mif_index.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_index  # noqa: E402
+import okf_validate  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _concept(path: Path, concept_id: str, aliases: list[str] = (), extra: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = ["---", f"id: {concept_id}", "type: semantic"]
+    if aliases:
+        lines.append("aliases:")
+        lines.extend(f"  - {alias}" for alias in aliases)
+    path.write_text("\n".join(lines) + f"\n{extra}---\nbody\n")
+
+
+def test_resolves_id_urn_and_alias(tmp_path):
+    _concept(tmp_path / "a.md", "id-a", ["Alpha"])
+    _concept(tmp_path / "sub" / "b.md", "id-b")
+    index = mif_index.open_index(tmp_path)
+    assert index.resolve("id-a") == "a.md"
+    assert index.resolve("urn:mif:id-b") == "sub/b.md"
+    assert index.resolve("Alpha") == "a.md"
+    assert index.resolve("missing") is None
+    assert index.duplicate_ids == index.alias_collisions == []
+
+
+def test_detects_duplicate_ids_and_alias_collisions(tmp_path):
+    _concept(tmp_path / "a.md", "same", ["shared"])
+    _concept(tmp_path / "b.md", "same")
+    _concept(tmp_path / "c.md", "id-c", ["shared", "same"])
+    index = mif_index.open_index(tmp_path)
+    assert index.duplicate_ids == ["duplicate id 'same': a.md, b.md"]
+    assert index.alias_collisions == [
+        "alias 'shared' of c.md collides with the alias of a.md",
+        "alias 'same' of c.md collides with the id of a.md",
+    ]
+    errors, warnings, _ = okf_validate.validate_bundle(tmp_path)
+    assert any("duplicate id 'same'" in e for e in errors)
+    assert sum("collides with" in w for w in warnings) == 2
+
+
+def test_ids_shared_by_sibling_bundles_are_warnings(tmp_path):
+    _concept(tmp_path / "good" / "a.md", "same")
+    _concept(tmp_path / "bad" / "a.md", "same")
+    errors, warnings, _ = okf_validate.validate_bundle(tmp_path)
+    assert not errors
+    assert any("id 'same' across sibling bundles: bad/a.md, good/a.md" in w for w in warnings)
+
+    # Once the root holds a file it is one bundle, and the same ids are errors.
+    (tmp_path / "index.md").write_text("# Bundle\n")
+    errors, _, _ = okf_validate.validate_bundle(tmp_path)
+    label = okf_validate.concept_label(tmp_path)
+    assert errors == [f"{label}: duplicate id 'same': bad/a.md, good/a.md"]
+
+    # The whole-tree fixture of sibling temporal bundles passes as it did before.
+    assert okf_validate.validate_bundle(ROOT / "test" / "temporal")[0] == []
+
+
+def test_alias_never_shadows_an_id(tmp_path):
+    _concept(tmp_path / "a.md", "id-a", ["id-z"])
+    _concept(tmp_path / "z.md", "id-z")
+    index = mif_index.open_index(tmp_path)
+    assert index.resolve("id-z") == "z.md"
+    assert index.alias_collisions == ["alias 'id-z' of a.md collides with the id of z.md"]
+
+
+def test_update_rereads_only_changed_files(tmp_path, monkeypatch):
+    _concept(tmp_path / "a.md", "id-a")
+    _concept(tmp_path / "b.md", "id-b")
+    index_path = tmp_path / "idx.json"
+    mif_index.open_index(tmp_path, index_path)
+
+    reads = []
+    real_load = mif_index.mif_convert.load_concept
+    monkeypatch.setattr(
+        mif_index.mif_convert,
+        "load_concept",
+        lambda path: reads.append(path.name) or real_load(path),
+    )
+    _concept(tmp_path / "a.md", "id-a2", ["renamed"])
+    stat = (tmp_path / "a.md").stat()
+    os.utime(tmp_path / "a.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (tmp_path / "b.md").unlink()
+
+    index = mif_index.BundleIndex.load(index_path)
+    assert index.update(tmp_path) == (["a.md"], ["b.md"])
+    assert reads == ["a.md"]
+    assert index.resolve("renamed") == "a.md"
+    assert index.resolve("id-a") is None and index.resolve("id-b") is None
+    assert index.update(tmp_path) == ([], [])
+
+
+def test_save_load_round_trip(tmp_path):
+    _concept(tmp_path / "a.md", "id-a", ["Alpha"])
+    index_path = tmp_path / mif_index.INDEX_NAME
+    index = mif_index.open_index(tmp_path)
+    assert index_path.exists()
+    loaded = mif_index.BundleIndex.load(index_path)
+    assert loaded.files == index.files and loaded.keys == index.keys
+    index_path.write_text("not json")
+    assert mif_index.BundleIndex.load(index_path).files == {}
+
+
+def test_temporal_check_resolves_urn_and_alias_targets(tmp_path):
+    _concept(tmp_path / "old.md", "id-old", ["Later"], "created: 2024-06-01T00:00:00Z\n")
+    for name, target in (("by-urn", "{'@id': 'urn:mif:id-old'}"), ("by-alias", "Later")):
+        (tmp_path / f"{name}.md").write_text(
+            f"---\nid: {name}\ntype: semantic\ncreated: 2024-01-01T00:00:00Z\n"
+            f"relationships:\n  - type: derived-from\n    target: {target}\n---\n"
+            f"## Relationships\n\n- derived-from [Old](/old.md)\n"
+        )
+    _, warnings, _ = okf_validate.validate_bundle(tmp_path)
+    temporal = sorted(w for w in warnings if "temporal inconsistency" in w)
+    assert len(temporal) == 2
+    assert "by-alias.md" in temporal[0] and "by-urn.md" in temporal[1]
+
+
+def _linked_bundle(root: Path) -> None:
+    """base <- derived (derived-from, by urn) <- note (body link); other is unrelated."""
+    _concept(root / "base.md", "id-base", [], "created: 2024-01-01T00:00:00Z\n")
+    (root / "derived.md").write_text(
+        "---\nid: id-derived\ntype: semantic\ncreated: 2024-03-01T00:00:00Z\n"
+        "relationships:\n  - type: derived-from\n    target: /base.md\n---\n"
+        "## Relationships\n\n- derived-from [Base](/base.md)\n"
+    )
+    (root / "notes").mkdir()
+    (root / "notes" / "note.md").write_text(
+        "---\nid: id-note\ntype: semantic\n---\nSee [derived](../derived.md).\n"
+    )
+    _concept(root / "other.md", "id-other")
+
+
+def test_backlinks_cover_relationships_and_body_links(tmp_path):
+    _linked_bundle(tmp_path)
+    index = mif_index.open_index(tmp_path)
+    backlinks = index.backlinks()
+    assert backlinks["base.md"] == [("derived.md", "derived-from"), ("derived.md", "link")]
+    assert backlinks["derived.md"] == [("notes/note.md", "link")]
+    assert index.dependents(["base.md"]) == {"derived.md"}
+    assert index.dependents(["other.md"]) == set()
+
+
+def _touch(path: Path, text: str) -> None:
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_changed_revalidates_dependents_like_a_full_run(tmp_path):
+    _linked_bundle(tmp_path)
+    _, _, count = okf_validate.validate_changed(tmp_path)  # first run indexes everything
+    assert count == 4
+    assert okf_validate.validate_changed(tmp_path) == ([], [], 0)
+
+    # base now post-dates the concept derived from it: derived must be re-checked.
+    _touch(tmp_path / "base.md", (tmp_path / "base.md").read_text().replace("2024-01", "2024-06"))
+    errors, warnings, count = okf_validate.validate_changed(tmp_path)
+    assert count == 2  # base + derived; note and other are untouched
+    full_errors, full_warnings, _ = okf_validate.validate_bundle(tmp_path)
+    assert errors == full_errors
+    assert warnings == [w for w in full_warnings if "derived.md" in w or "base.md" in w]
+    assert any("temporal inconsistency" in w for w in warnings)
+
+
+def test_changed_reports_deleted_targets_in_dependents(tmp_path):
+    _linked_bundle(tmp_path)
+    okf_validate.validate_changed(tmp_path)
+    (tmp_path / "derived.md").unlink()
+    errors, warnings, count = okf_validate.validate_changed(tmp_path, [tmp_path / "derived.md"])
+    assert count == 1 and errors == []
+    assert warnings == [f"{tmp_path / 'notes' / 'note.md'}: broken link -> ../derived.md"]
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_since_and_staged_take_the_change_set_from_git(tmp_path):
+    bundle = tmp_path / "bundle"
+    bundle.mkdir()
+    _linked_bundle(bundle)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+    assert okf_validate.git_changed_paths(bundle, since="HEAD") == []
+
+    # No persisted index yet: every file is indexed, but only git's change set
+    # (base, plus derived which links to it) is re-checked.
+    (bundle / "base.md").write_text((bundle / "base.md").read_text().replace("2024-01", "2024-06"))
+    _concept(bundle / "new.md", "id-new")
+    changed = okf_validate.git_changed_paths(bundle, since="HEAD")
+    assert [p.name for p in changed] == ["base.md", "new.md"]
+    errors, warnings, count = okf_validate.validate_changed(bundle, changed, detect=False)
+    assert count == 3 and errors == []
+    assert any("derived.md: temporal inconsistency" in w for w in warnings)
+
+    _git(tmp_path, "rm", "-q", "bundle/derived.md")
+    staged = okf_validate.git_changed_paths(bundle, staged=True)
+    assert [p.name for p in staged] == ["derived.md"]
+    errors, warnings, count = okf_validate.validate_changed(bundle, staged, detect=False)
+    assert count == 1 and errors == []
+    assert [w.endswith("note.md: broken link -> ../derived.md") for w in warnings] == [True]
+
+
+def test_git_failure_is_a_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        okf_validate.git_changed_paths(tmp_path, since="HEAD")
+
+
+def test_link_checks_use_one_listing_not_a_stat_per_link(tmp_path, monkeypatch):
+    _concept(tmp_path / "a" / "target.md", "id-t", [], "created: 2026-01-01T00:00:00Z\n")
+    (tmp_path / "index.md").write_text("# index\n")
+    (tmp_path / "a" / "src.md").write_text(
+        "---\nid: s\ntype: semantic\ncreated: 2025-01-01T00:00:00Z\n"
+        "relationships:\n  - type: derived-from\n    target: ../a/./target.md#top\n---\n"
+        "## Relationships\n\n- derived-from [T](../a/./target.md#top)\n\n"
+        "[ok](/a/target.md) [ok](target.md#x) [ok](../index.md) [gone](/a/gone.md) "
+        "[gone](../b/../a/missing.md#y) [web](https://example.com/x.md)\n"
+    )
+    assert mif_index.bundle_paths(tmp_path) == {"index.md", "a/target.md", "a/src.md"}
+
+    stats = []
+    real_exists = Path.exists
+    monkeypatch.setattr(Path, "exists", lambda self: stats.append(self) or real_exists(self))
+    errors, warnings, _ = okf_validate.validate_bundle(tmp_path)
+    monkeypatch.undo()
+    assert stats == []
+    assert errors == []
+    assert [w.split(": ", 1)[1] for w in warnings] == [
+        "broken link -> /a/gone.md",
+        "broken link -> ../b/../a/missing.md#y",
+        "temporal inconsistency -> 'derived-from' target ../a/./target.md#top is created "
+        "2026-01-01T00:00:00Z, after concept created 2025-01-01T00:00:00Z",
+    ]
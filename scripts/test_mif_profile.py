@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for per-phase profiling (``mif_profile``) of the validator and converter.
+
+Run: ``python -m pytest scripts/test_mif_profile.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_convert  # noqa: E402
+import mif_profile  # noqa: E402
+import okf_validate  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+TEMPORAL_BAD = ROOT / "test" / "temporal" / "bad"
+CHECKS = {
+    "(1) type",
+    "(2) reserved-filenames",
+    "(3) relationship-sync",
+    "(4) broken-links",
+    "(5) round-trip",
+    "(6) temporal",
+}
+
+
+@pytest.fixture
+def profiling(monkeypatch):
+    monkeypatch.setattr(mif_profile, "_enabled", True)
+    mif_profile.drain()
+    yield
+    mif_profile.drain()
+
+
+def test_disabled_profiler_records_nothing():
+    with mif_profile.span("anything"):
+        pass
+    assert mif_profile.drain() == []
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_records_a_span_per_check_per_concept(profiling, jobs):
+    okf_validate.validate_bundle(TEMPORAL_BAD, jobs=jobs)
+    events = mif_profile.drain()
+    names = {e["name"] for e in events}
+    assert CHECKS <= names
+    per_concept = [e for e in events if e["name"] == "(5) round-trip"]
+    assert len(per_concept) == 2
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+def test_roundtrip_phases_and_trace_file(profiling, tmp_path, capsys):
+    mif_convert.cmd_roundtrip([ROOT / "examples"])
+    mif_profile.finish(tmp_path / "trace.json")
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    rows = {row["name"]: row for row in mif_profile.summary(trace["traceEvents"])}
+    assert {"read", "parse", "round-trip"} <= set(rows)
+    assert rows["parse"]["calls"] == 3
+    assert "round-trip" in capsys.readouterr().err
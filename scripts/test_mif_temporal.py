@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Tests for the temporal-model tools (``mif_temporal``): freshness / decay, the
+bitemporal as-of index and the TTL expiry queue / sweep.
+
+Run: ``python -m pytest scripts/test_mif_temporal.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import math
+import os
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_convert  # noqa: E402
+import mif_index  # noqa: E402
+import mif_temporal  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+DAY = 86400.0
+
+
+def _write(path: Path, temporal: str, created: str = "2026-01-01T00:00:00Z") -> Path:
+    path.write_text(
+        f"---\nid: {path.stem}\ntype: semantic\ncreated: '{created}'\n"
+        f"temporal:\n{temporal}---\n\nbody\n"
+    )
+    return path
+
+
+def _decay_bundle(root: Path) -> None:
+    _write(root / "exp.md", "  decay:\n    model: exponential\n    halfLife: P10D\n    currentStrength: 1.0\n")
+    _write(root / "lin.md", "  ttl: P40D\n  decay:\n    model: linear\n    strength: 0.5\n")
+    _write(root / "step.md", "  ttl: P15D\n  decay:\n    model: step\n")
+    _write(
+        root / "window.md",
+        "  validFrom: '2026-01-05T00:00:00Z'\n  validUntil: '2026-01-20T00:00:00Z'\n"
+        "  decay:\n    model: none\n",
+    )
+    _write(root / "reinforced.md", "  recordedAt: '2025-06-01T00:00:00Z'\n  decay:\n"
+           "    model: exponential\n    halfLife: P10D\n    lastReinforced: '2026-01-11T00:00:00Z'\n")
+    _write(root / "broken.md", "  decay:\n    model: exponential\n")
+    (root / "plain.md").write_text("---\nid: plain\ntype: semantic\n---\n\nbody\n")
+
+
+def test_parse_duration_and_instant():
+    assert mif_temporal.parse_duration("P90D") == 90 * DAY
+    assert mif_temporal.parse_duration("PT36H") == 36 * 3600
+    assert mif_temporal.parse_duration("P1Y2M1W") == (365 + 60 + 7) * DAY
+    assert mif_temporal.parse_duration("PT1.5M") == 90
+    for bad in ("P", "PT", "P1DT", "90D", "P-1D", None, 7):
+        assert mif_temporal.parse_duration(bad) is None
+    assert mif_temporal.parse_instant("2026-01-01") == mif_temporal.parse_instant("2026-01-01T00:00:00Z")
+    assert mif_temporal.parse_instant("2026-01-01T01:00:00+01:00") == mif_temporal.parse_instant(
+        "2026-01-01T00:00:00"
+    )
+    assert mif_temporal.parse_instant("yesterday") is None
+
+
+def _strengths(bundle: Path, as_of: str) -> dict[str, float]:
+    table = mif_temporal.load_table([bundle])
+    return {p.name: float(v) for p, v in zip(table.paths, table.strengths(as_of))}
+
+
+def test_decay_models_at_an_instant(tmp_path, monkeypatch):
+    monkeypatch.setattr(mif_temporal, "np", None)
+    _decay_bundle(tmp_path)
+    s = _strengths(tmp_path, "2026-01-11T00:00:00Z")  # ten days after created
+    assert s["exp.md"] == pytest.approx(math.exp(-1))
+    assert s["lin.md"] == pytest.approx(0.75)
+    assert s["step.md"] == 1.0
+    assert s["window.md"] == 1.0
+    assert s["reinforced.md"] == 1.0  # t runs from lastReinforced, not recordedAt
+    assert s["plain.md"] == 1.0  # no decay block: permanent
+    assert math.isnan(s["broken.md"])  # exponential without halfLife
+
+    s = _strengths(tmp_path, "2026-01-21T00:00:00Z")
+    assert s["lin.md"] == pytest.approx(0.5)
+    assert s["step.md"] == 0.0
+    assert s["window.md"] == 0.0  # past validUntil
+    assert _strengths(tmp_path, "2026-01-03")["window.md"] == 0.0  # before validFrom
+    assert _strengths(tmp_path, "2025-12-01")["exp.md"] == 1.0  # t never negative
+
+
+def test_vectorized_matches_scalar(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    _decay_bundle(tmp_path)
+    for as_of in ("2025-12-01", "2026-01-11T00:00:00Z", "2026-03-01T12:00:00Z"):
+        vectorized = _strengths(tmp_path, as_of)
+        with monkeypatch.context() as m:
+            m.setattr(mif_temporal, "np", None)
+            scalar = _strengths(tmp_path, as_of)
+        assert vectorized.keys() == scalar.keys()
+        for name, value in scalar.items():
+            assert vectorized[name] == pytest.approx(value, nan_ok=True)
+
+
+def test_write_back_only_changed_values(tmp_path):
+    _decay_bundle(tmp_path)
+    as_of = "2026-01-21T00:00:00Z"
+    table = mif_temporal.load_table([tmp_path])
+    changes = table.refreshed(table.strengths(as_of))
+    # lin.md already stores 0.5 (under the `strength` alias); plain/broken are skipped.
+    assert sorted((p.name, key, v) for p, key, v in changes) == [
+        ("exp.md", "currentStrength", round(math.exp(-2), 3)),
+        ("reinforced.md", "currentStrength", 0.368),
+        ("step.md", "currentStrength", 0.0),
+        ("window.md", "currentStrength", 0.0),
+    ]
+    untouched = (tmp_path / "lin.md").read_text()
+    assert mif_temporal.write_strengths(changes, jobs=2) == 4
+    assert (tmp_path / "lin.md").read_text() == untouched
+    frontmatter, body = mif_convert.parse_markdown((tmp_path / "exp.md").read_text())
+    assert frontmatter["temporal"]["decay"]["currentStrength"] == round(math.exp(-2), 3)
+    assert (tmp_path / "exp.md").read_text() == mif_convert.serialize_markdown(frontmatter, body)
+
+    table = mif_temporal.load_table([tmp_path])
+    assert table.refreshed(table.strengths(as_of)) == []
+
+
+def test_example_strength_matches_spec_formula():
+    table = mif_temporal.load_table([ROOT / "profiles" / "ai-memory" / "examples"])
+    strengths = dict(zip((p.name for p in table.paths), table.strengths("2026-02-19T14:22:00Z")))
+    # level-3-full: exponential, halfLife P30D, lastReinforced 2026-01-20T14:22:00Z.
+    assert float(strengths["level-3-full.md"]) == pytest.approx(math.exp(-1))
+
+
+def test_interval_tree_matches_a_linear_scan():
+    rng = random.Random(7)
+    points = [-math.inf, *range(20), math.inf]
+    intervals = [(rng.choice(points), rng.choice(points), f"c{i}") for i in range(300)]
+    tree = mif_temporal.IntervalTree(intervals)
+    for x in [*range(-1, 21), 4.5]:
+        assert sorted(tree.stab(x)) == sorted(i for s, e, i in intervals if s <= x < e)
+    for lo, hi in [(3, 7), (7, 3), (-math.inf, 0), (19, math.inf), (5, 5.5), (-1, 21)]:
+        assert sorted(tree.overlap(lo, hi)) == sorted(
+            i for s, e, i in intervals if max(s, lo) < min(e, hi)
+        )
+
+
+def _bitemporal_bundle(root: Path) -> None:
+    _write(root / "old.md", "  validUntil: '2026-03-01T00:00:00Z'\n", created="2025-01-01T00:00:00Z")
+    _write(root / "new.md", "  validFrom: '2026-03-01T00:00:00Z'\n", created="2026-03-15T00:00:00Z")
+    _write(
+        root / "late.md",
+        "  validFrom: '2026-02-01'\n  validUntil: '2026-04-01'\n  recordedAt: '2026-05-01T00:00:00Z'\n",
+    )
+    (root / "always.md").write_text("---\nid: always\ntype: semantic\ncreated: 2024-06-01\n---\n\nbody\n")
+
+
+def test_bitemporal_point_and_range_queries(tmp_path):
+    _bitemporal_bundle(tmp_path)
+    bitemporal = mif_temporal.BitemporalIndex.from_index(mif_index.open_index(tmp_path))
+    assert bitemporal.valid_at("2026-02-15") == ["always.md", "late.md", "old.md"]
+    assert bitemporal.valid_at("2026-03-01") == ["always.md", "late.md", "new.md"]  # half-open
+    assert bitemporal.valid_during("2026-01-01", "2026-02-01") == ["always.md", "old.md"]
+    assert bitemporal.recorded_by("2026-03-15T00:00:00Z") == ["always.md", "new.md", "old.md"]
+    # Valid on 2026-03-10 as known on 2026-04-01: late.md was not yet recorded.
+    assert bitemporal.as_of("2026-03-10", "2026-04-01") == ["always.md", "new.md"]
+    assert bitemporal.as_of("2026-03-10", "2026-06-01") == ["always.md", "late.md", "new.md"]
+    assert bitemporal.as_of("2026-01-01", "2025-06-01", "2026-02-15") == ["always.md", "old.md"]
+    assert bitemporal.as_of("2026-02-15", "2024-12-31") == ["always.md"]  # via the recorded axis
+    with pytest.raises(ValueError):
+        bitemporal.valid_at("soon")
+
+
+def test_bitemporal_update_follows_the_bundle_index(tmp_path):
+    _bitemporal_bundle(tmp_path)
+    index_path = tmp_path / "idx.json"
+    index = mif_index.open_index(tmp_path, index_path)
+    bitemporal = mif_temporal.BitemporalIndex.from_index(index)
+    assert bitemporal.valid_at("2026-02-15") == ["always.md", "late.md", "old.md"]
+
+    _write(tmp_path / "old.md", "  validUntil: '2026-02-01T00:00:00Z'\n", created="2025-01-01T00:00:00Z")
+    stat = (tmp_path / "old.md").stat()
+    os.utime(tmp_path / "old.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (tmp_path / "always.md").unlink()
+    changed, removed = index.update(tmp_path)
+    bitemporal.update(index.files, changed, removed)
+    assert bitemporal.valid_at("2026-02-15") == ["late.md"]
+    assert bitemporal.recorded_by("2026-12-31") == ["late.md", "new.md", "old.md"]
+    rebuilt = mif_temporal.BitemporalIndex.from_index(index)
+    assert rebuilt.spans == bitemporal.spans
+
+
+def test_expiry_instants_follow_ttl_anchor_and_valid_until(tmp_path):
+    _decay_bundle(tmp_path)
+    queue = mif_temporal.ExpiryQueue.from_index(mif_index.open_index(tmp_path))
+    # step: created + 15d; window: validUntil; lin: created + 40d. Others never expire.
+    assert [(mif_temporal._iso(t), p) for t, p in queue.upcoming(10)] == [
+        ("2026-01-16T00:00:00Z", "step.md"),
+        ("2026-01-20T00:00:00Z", "window.md"),
+        ("2026-02-10T00:00:00Z", "lin.md"),
+    ]
+    assert [p for _, p in queue.upcoming(1, after="2026-01-16T00:00:00Z")] == ["window.md"]
+    assert mif_temporal.expires_at(
+        {"ttl": "P1D", "recordedAt": "2026-01-01", "lastReinforced": "2026-01-05"}
+    ) == mif_temporal.parse_instant("2026-01-06")
+    assert mif_temporal.expires_at({"ttl": "P1D", "recordedAt": "2026-01-01", "expiredAt": "x"}) is None
+
+
+def test_pop_due_takes_only_expired_concepts(tmp_path, monkeypatch):
+    _decay_bundle(tmp_path)
+    queue = mif_temporal.ExpiryQueue.from_index(mif_index.open_index(tmp_path))
+    assert queue.pop_due("2026-01-15") == []
+    pops = []
+    real_pop = mif_temporal.heapq.heappop
+    monkeypatch.setattr(mif_temporal.heapq, "heappop", lambda heap: pops.append(1) or real_pop(heap))
+    assert [p for _, p in queue.pop_due("2026-01-20T00:00:00Z")] == ["step.md", "window.md"]
+    assert len(pops) == 2 and len(queue) == 1
+
+
+def test_queue_update_supersedes_heap_entries_lazily():
+    files = {f"c{i}.md": {"temporal": {"validUntil": f"2026-02-{i + 1:02d}"}} for i in range(20)}
+    queue = mif_temporal.ExpiryQueue(files)
+    files["c0.md"] = {"temporal": {"validUntil": "2026-03-15"}}
+    del files["c1.md"]
+    queue.update(files, ["c0.md"], ["c1.md"])
+    assert [p for _, p in queue.upcoming(2)] == ["c2.md", "c3.md"]
+    due = queue.pop_due("2026-12-31")
+    assert [p for _, p in due] == [f"c{i}.md" for i in range(2, 20)] + ["c0.md"]
+    assert len(queue) == 0 and queue.upcoming(5) == []
+
+
+def test_sweep_marks_or_archives_due_concepts(tmp_path):
+    bundle = tmp_path / "bundle"
+    bundle.mkdir()
+    _decay_bundle(bundle)
+    index = mif_index.open_index(bundle)
+    queue = mif_temporal.ExpiryQueue.from_index(index)
+    marked = mif_temporal.sweep(bundle, queue.pop_due("2026-01-17"))
+    assert marked == [bundle / "step.md"]
+    frontmatter, _ = mif_convert.parse_markdown((bundle / "step.md").read_text())
+    assert frontmatter["properties"] == {"expiredAt": "2026-01-16T00:00:00Z"}
+
+    index.update(bundle)  # marked concepts leave the queue
+    queue = mif_temporal.ExpiryQueue.from_index(index)
+    assert [p for _, p in queue.upcoming(5)] == ["window.md", "lin.md"]
+    archive = tmp_path / "archive"
+    moved = mif_temporal.sweep(bundle, queue.pop_due("2026-03-01"), archive)
+    assert moved == [archive / "window.md", archive / "lin.md"]
+    assert not (bundle / "lin.md").exists()
+    frontmatter, body = mif_convert.parse_markdown((archive / "lin.md").read_text())
+    assert frontmatter["properties"]["expiredAt"] == "2026-02-10T00:00:00Z" and body.strip() == "body"
+
+
+def _run_main(monkeypatch, capsys, *argv: str) -> str:
+    monkeypatch.setattr(sys, "argv", ["mif_temporal.py", *argv])
+    with pytest.raises(SystemExit) as exit_info:
+        mif_temporal.main()
+    assert exit_info.value.code == 0
+    return capsys.readouterr().out
+
+
+def test_cli_subcommands(tmp_path, monkeypatch, capsys):
+    _decay_bundle(tmp_path)
+    out = _run_main(
+        monkeypatch, capsys, "freshness", str(tmp_path), "--as-of", "2026-01-11", "--top", "1"
+    )
+    assert out.split() == ["1.0000", str(tmp_path / "plain.md")]
+    out = _run_main(monkeypatch, capsys, "as-of", str(tmp_path), "--valid-at", "2026-01-25")
+    assert "window.md" not in out.split() and "exp.md" in out.split()
+    out = _run_main(
+        monkeypatch, capsys, "expirations", str(tmp_path), "--after", "2026-01-01", "--top", "1"
+    )
+    assert out.split() == ["2026-01-16T00:00:00Z", "step.md"]
+    out = _run_main(monkeypatch, capsys, "sweep", str(tmp_path), "--as-of", "2026-01-17", "--mark")
+    assert out.split() == ["2026-01-16T00:00:00Z", str(tmp_path / "step.md")]
+    assert "expiredAt" in (tmp_path / "step.md").read_text()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Tests for the synthetic bundle generator used by ``benchmark.py``.
+
+Run: ``python -m pytest scripts/test_synth_bundle.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_convert  # noqa: E402
+import okf_validate  # noqa: E402
+import synth_bundle  # noqa: E402
+
+
+def _files(root: Path) -> dict[Path, bytes]:
+    return {p.relative_to(root): p.read_bytes() for p in sorted(root.rglob("*.md"))}
+
+
+def test_same_seed_is_byte_identical(tmp_path):
+    synth_bundle.generate_bundle(tmp_path / "a", 60, seed=7)
+    synth_bundle.generate_bundle(tmp_path / "b", 60, seed=7)
+    synth_bundle.generate_bundle(tmp_path / "c", 60, seed=8)
+    assert _files(tmp_path / "a") == _files(tmp_path / "b")
+    assert _files(tmp_path / "a") != _files(tmp_path / "c")
+
+
+def test_generated_bundle_conforms_with_no_temporal_findings(tmp_path):
+    synth_bundle.generate_bundle(tmp_path, 120, seed=1, derivation_ratio=0.5)
+    errors, warnings, count = okf_validate.validate_bundle(tmp_path, strict_temporal=True)
+    assert count == 120
+    assert errors == []
+    assert warnings == []
+
+
+def test_level3_fields_and_derivation_edges_are_generated(tmp_path):
+    synth_bundle.generate_bundle(tmp_path, 80, seed=2, derivation_ratio=1.0)
+    concepts = mif_convert.load_bundle(tmp_path).values()
+    assert all({"temporal", "provenance"} <= set(c.frontmatter) for c in concepts)
+    edge_types = {
+        rel["type"] for c in concepts for rel in c.frontmatter.get("relationships", [])
+    }
+    assert edge_types and edge_types <= set(synth_bundle.DERIVATION_EDGES)
+
+
+def test_level1_is_minimal(tmp_path):
+    synth_bundle.generate_bundle(tmp_path, 10, level=1)
+    for concept in mif_convert.load_bundle(tmp_path).values():
+        assert set(concept.frontmatter) == {"id", "type", "created"}
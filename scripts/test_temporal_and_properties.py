@@ -18,6 +18,7 @@ import pytest
 # imports also work under importmode=importlib or direct execution.
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import mif_cache  # noqa: E402
 import mif_convert  # noqa: E402
 import okf_validate  # noqa: E402
 
@@ -184,6 +185,150 @@ def test_multiple_future_targets_all_reported(tmp_path):
     assert len(findings) == 2
 
 
+def test_validate_bundle_parses_each_concept_once(monkeypatch):
+    # The bundle model is loaded once per run: the derivation target (session.md)
+    # must not be re-parsed for the temporal check, nor the source for round-trip.
+    calls = []
+    real_parse = mif_convert.parse_markdown
+
+    def counting_parse(md_text):
+        calls.append(md_text)
+        return real_parse(md_text)
+
+    monkeypatch.setattr(mif_convert, "parse_markdown", counting_parse)
+    _, warnings, count = okf_validate.validate_bundle(TEMPORAL / "bad")
+    assert count == 2
+    assert len(calls) == 2
+    assert len([w for w in warnings if "temporal inconsistency" in w]) == 1
+
+
+def test_temporal_findings_read_targets_from_bundle_model(tmp_path):
+    # With a bundle model supplied, the target's `created` comes from the model,
+    # not from the file on disk.
+    (tmp_path / "target.md").write_text(
+        "---\nid: t\ntype: semantic\ncreated: 2024-01-01T00:00:00Z\n---\nbody\n"
+    )
+    concepts = mif_convert.load_bundle(tmp_path)
+    key = (tmp_path / "target.md").resolve()
+    concepts[key] = concepts[key]._replace(created="2026-01-01T00:00:00Z")
+    fm = {
+        "created": "2025-01-01T00:00:00Z",
+        "relationships": [{"type": "derived-from", "target": "/target.md"}],
+    }
+    findings = okf_validate._temporal_findings(
+        fm, tmp_path / "src.md", tmp_path, "x", concepts
+    )
+    assert len(findings) == 1
+
+
+def test_unparseable_frontmatter_is_an_error_not_a_crash(tmp_path):
+    (tmp_path / "broken.md").write_text("---\n bad: : : yaml\n :::\n---\nbody\n")
+    (tmp_path / "plain.md").write_text("no frontmatter at all\n")
+    errors, _, count = okf_validate.validate_bundle(tmp_path)
+    assert count == 2
+    assert len(errors) == 2
+
+
+def test_parallel_validation_matches_serial():
+    # A process-pool run must merge findings back in path order: identical output.
+    for bundle in (TEMPORAL / "bad", ROOT / "examples", ROOT / "profiles" / "ai-memory" / "examples"):
+        for strict in (False, True):
+            serial = okf_validate.validate_bundle(bundle, strict_temporal=strict, jobs=1)
+            parallel = okf_validate.validate_bundle(bundle, strict_temporal=strict, jobs=3)
+            assert parallel == serial
+
+
+def test_cached_validation_matches_uncached(tmp_path):
+    # A warm cache answers every concept without parsing, with identical findings.
+    for bundle in (TEMPORAL / "bad", ROOT / "examples"):
+        db = tmp_path / f"{bundle.name}.db"
+        for strict in (False, True):
+            expected = okf_validate.validate_bundle(bundle, strict_temporal=strict)
+            cold = mif_cache.ValidationCache(db)
+            assert okf_validate.validate_bundle(bundle, strict_temporal=strict, cache=cold) == expected
+            cold.close()
+            warm = mif_cache.ValidationCache(db)
+            assert okf_validate.validate_bundle(bundle, strict_temporal=strict, cache=warm) == expected
+            assert warm.misses == 0 and warm.hits == expected[2]
+            warm.close()
+
+
+def test_cached_frontmatter_keeps_dates_and_integer_keys(tmp_path):
+    # json.dumps(default=str) would turn the int key and the date into strings.
+    (tmp_path / "c.md").write_text(
+        "---\nid: c\ntype: semantic\ncreated: 2025-01-01T00:00:00Z\n"
+        "properties:\n  1: one\n  reviewed: 2025-02-03\n---\n# C\n"
+    )
+    db = tmp_path.parent / "typed.db"
+    expected = okf_validate.validate_bundle(tmp_path)
+    cold = mif_cache.ValidationCache(db)
+    okf_validate.validate_bundle(tmp_path, cache=cold)
+    cold.close()
+    warm = mif_cache.ValidationCache(db)
+    assert okf_validate.validate_bundle(tmp_path, cache=warm) == expected
+    record = warm.get((tmp_path / "c.md").resolve(), mif_cache.file_sha256(tmp_path / "c.md"))
+    fresh = mif_convert.load_concept(tmp_path / "c.md").frontmatter
+    assert record["frontmatter"] == fresh and 1 in record["frontmatter"]["properties"]
+    warm.close()
+
+
+def test_cache_rederives_cross_file_checks_when_a_target_changes(tmp_path):
+    # The source is unchanged (a cache hit), but its target's `created` and
+    # existence change: temporal and broken-link findings must follow the target.
+    _bundle_with_target(tmp_path, "2024-01-01T00:00:00Z")
+    (tmp_path / "src.md").write_text(
+        "---\nid: s\ntype: semantic\ncreated: 2025-01-01T00:00:00Z\n"
+        "relationships:\n- type: derived-from\n  target: /target.md\n---\n"
+        "# S\n\n## Relationships\n\n- derived-from [T](/target.md)\n"
+    )
+    db = tmp_path.parent / "cache.db"
+    cache = mif_cache.ValidationCache(db)
+    _, warnings, _ = okf_validate.validate_bundle(tmp_path, cache=cache)
+    assert warnings == []
+
+    _bundle_with_target(tmp_path, "2026-01-01T00:00:00Z")
+    cache = mif_cache.ValidationCache(db)
+    _, warnings, _ = okf_validate.validate_bundle(tmp_path, cache=cache)
+    assert cache.hits == 1  # src.md answered from the cache
+    assert len([w for w in warnings if "temporal inconsistency" in w]) == 1
+
+    (tmp_path / "target.md").unlink()
+    cache = mif_cache.ValidationCache(db)
+    _, warnings, _ = okf_validate.validate_bundle(tmp_path, cache=cache)
+    assert cache.hits == 1
+    assert len(warnings) == 1 and warnings[0].endswith("src.md: broken link -> /target.md")
+
+
+def test_check_temporal_returns_structured_findings_matching_validate(monkeypatch):
+    parsed = []
+    real_parse = okf_validate._parse_created
+    monkeypatch.setattr(
+        okf_validate, "_parse_created", lambda value: parsed.append(value) or real_parse(value)
+    )
+    findings = okf_validate.check_temporal(TEMPORAL / "bad", jobs=2)
+    assert len(parsed) == 2  # each concept's `created` parsed once, not per edge
+    assert [(f.source.name, f.rel_type, f.target, f.target_path) for f in findings] == [
+        ("observation.md", "derived-from", "/session.md", "session.md")
+    ]
+    assert findings[0].target_created == "2026-01-15T10:30:00Z"
+    _, warnings, _ = okf_validate.validate_bundle(TEMPORAL / "bad")
+    label = okf_validate.concept_label(findings[0].source)
+    assert [w for w in warnings if "temporal" in w] == [findings[0].message(label)]
+    assert okf_validate.check_temporal(TEMPORAL / "good") == []
+
+
+def test_temporal_pass_table_handles_many_edges_to_one_target(tmp_path):
+    _bundle_with_target(tmp_path, "2024-06-01")  # date-only target
+    for i, created in enumerate(["2024-06-01T23:59:00Z", "2024-05-31T23:59:00Z", "2024-06-02"]):
+        (tmp_path / f"s{i}.md").write_text(
+            f"---\nid: s{i}\ntype: semantic\ncreated: {created}\n"
+            "relationships:\n- type: cites\n  target: target.md\n---\nbody\n"
+        )
+    findings = okf_validate.check_temporal(tmp_path)
+    # Same-day is downgraded to date granularity (no finding); the day before is flagged.
+    assert [f.source.name for f in findings] == ["s1.md"]
+
+
 # --------------------------------------------------------------------------- #
 # First-class scalar ``properties``.                                           #
 # --------------------------------------------------------------------------- #
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Tests for batch ontology schema validation in ``validate-ontologies.py``.
+
+Run: ``python -m pytest scripts/test_validate_ontologies.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import mif_schema  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "test" / "subtype_of"
+SCHEMA = ROOT / "schema" / "ontology" / "ontology.schema.json"
+_spec = importlib.util.spec_from_file_location(
+    "validate_ontologies", ROOT / "scripts" / "validate-ontologies.py"
+)
+assert _spec is not None and _spec.loader is not None
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+
+def _docs() -> dict[Path, object]:
+    docs = {f: yaml.safe_load(f.read_text()) for f in sorted(FIXTURES.glob("*.ontology.yaml"))}
+    docs[Path("broken.ontology.yaml")] = {"ontology": {"id": 7}}
+    return docs
+
+
+def test_in_process_batch_reports_errors_per_file():
+    if not mif_schema.available() or mif_schema.unchecked_formats(SCHEMA):
+        pytest.skip("needs jsonschema with its format checkers")
+    results = _mod.schema_validate_batch(_docs(), SCHEMA, "jsonschema")
+    assert set(results) == set(_docs())
+    assert results[Path("broken.ontology.yaml")]
+    assert all(errs == [] for path, errs in results.items() if path.parent == FIXTURES)
+
+
+def test_missing_ajv_fails_every_file_closed(monkeypatch, tmp_path):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    results = _mod.schema_validate_batch(_docs(), SCHEMA, "ajv")
+    assert all(errs == [_mod.AJV_MISSING] for errs in results.values())
+
+
+def test_missing_jsonschema_fails_closed(monkeypatch):
+    monkeypatch.setattr(mif_schema, "jsonschema", None)
+    results = _mod.schema_validate_batch(_docs(), SCHEMA, "jsonschema")
+    assert all(len(errs) == 1 and "jsonschema not installed" in errs[0] for errs in results.values())
+
+
+# `ajv validate --errors=json` output of ajv-cli 5.0.0 (package.json) for two of
+# three documents: the valid one on stdout, the invalid one plus its error array
+# (JSON.stringify(errors, null, "  ")) on stderr.
+AJV_STDOUT = "/tmp/ajv/00000.json valid\n"
+AJV_STDERR = """/tmp/ajv/00001.json invalid
+[
+  {
+    "instancePath": "/ontology/schema_url",
+    "schemaPath": "#/properties/ontology/properties/schema_url/format",
+    "keyword": "format",
+    "params": {
+      "format": "uri"
+    },
+    "message": "must match format \\"uri\\""
+  },
+  {
+    "instancePath": "/ontology",
+    "schemaPath": "#/properties/ontology/required",
+    "keyword": "required",
+    "params": {
+      "missingProperty": "version"
+    },
+    "message": "must have required property 'version'"
+  }
+]
+"""
+
+
+def test_ajv_output_is_parsed_per_file():
+    by_file = {f"/tmp/ajv/0000{i}.json": Path(f"{i}.ontology.yaml") for i in range(3)}
+    results = _mod._parse_ajv_output(AJV_STDOUT, AJV_STDERR, 1, by_file)
+    assert results[Path("0.ontology.yaml")] == []
+    assert results[Path("1.ontology.yaml")] == [
+        '  - schema: /ontology/schema_url must match format "uri"',
+        "  - schema: /ontology must have required property 'version'",
+    ]
+    # No verdict for the third file: fail closed with ajv's output.
+    assert results[Path("2.ontology.yaml")][0] == "  - schema: /tmp/ajv/00001.json invalid"
+
+
+def test_invalid_uri_format_is_rejected():
+    bad = {"ontology": {"id": "bad-url", "version": "0.1.0", "schema_url": "not a uri"}}
+    docs = {Path("bad.ontology.yaml"): bad}
+    # auto never silently passes: format-checking jsonschema, ajv, or a fail-closed error.
+    assert _mod.schema_validate_batch(docs, SCHEMA)[Path("bad.ontology.yaml")]
+    if mif_schema.available() and not mif_schema.unchecked_formats(SCHEMA):
+        (error,) = _mod.schema_validate_batch(docs, SCHEMA, "jsonschema")[Path("bad.ontology.yaml")]
+        assert "schema_url" in error and "uri" in error
+
+
+def test_jsonschema_without_format_checkers_fails_closed(monkeypatch, tmp_path):
+    monkeypatch.setattr(mif_schema, "unchecked_formats", lambda schema_path: frozenset({"uri"}))
+    results = _mod.schema_validate_batch(_docs(), SCHEMA, "jsonschema")
+    assert all(len(errs) == 1 and "cannot check format(s) uri" in errs[0] for errs in results.values())
+    monkeypatch.setenv("PATH", str(tmp_path))  # auto falls back to ajv, here missing
+    results = _mod.schema_validate_batch(_docs(), SCHEMA, "auto")
+    assert all(errs == [_mod.AJV_MISSING] for errs in results.values())
+
+
+def _info(*required: str, subtype_of: tuple[str, ...] = ()) -> dict:
+    return {"required": set(required), "subtype_of": list(subtype_of)}
+
+
+def _corpus(edges: dict[str, list[str]]) -> dict[str, dict]:
+    # Every ontology defines its own type plus a "shared" type that descendants override.
+    return {
+        oid: {"extends": parents, "types": {oid: _info(), "shared": _info(oid)}}
+        for oid, parents in edges.items()
+    }
+
+
+def _visible_recursive(oid, corpus, seen=None):
+    # The original per-call recursive merge: the reference semantics.
+    seen = seen if seen is not None else set()
+    if oid in seen or oid not in corpus:
+        return {}
+    seen.add(oid)
+    merged = {}
+    for parent in corpus[oid]["extends"]:
+        merged.update(_visible_recursive(parent, corpus, seen))
+    merged.update(corpus[oid]["types"])
+    return merged
+
+
+def test_precomputed_lineage_matches_recursive_merge():
+    # Diamonds and shared ancestors (mif-base / shared-traits style).
+    corpus = _corpus(
+        {
+            "base": [],
+            "traits": ["base"],
+            "left": ["base", "traits"],
+            "right": ["traits"],
+            "leaf": ["right", "left", "missing"],
+        }
+    )
+    _mod.compile_lineage(corpus)
+    assert corpus["leaf"]["lineage"] == ["base", "traits", "right", "left", "leaf"]
+    for oid in corpus:
+        assert _mod.visible_types(oid, corpus) == _visible_recursive(oid, corpus)
+        assert corpus[oid]["extends_cycles"] == []
+
+
+def test_extends_cycles_are_reported_and_the_rest_resolves():
+    corpus = _corpus({"a": ["b"], "b": ["a"], "self": ["self"], "ok": ["base"], "base": []})
+    _mod.compile_lineage(corpus)
+    assert corpus["a"]["extends_cycles"] == corpus["b"]["extends_cycles"]
+    assert len(corpus["a"]["extends_cycles"]) == 1
+    assert corpus["self"]["extends_cycles"] == [["self", "self"]]
+    assert corpus["ok"]["extends_cycles"] == []
+    assert set(_mod.visible_types("ok", corpus)) == {"ok", "base", "shared"}
+    # The cycle is broken at one edge: both members still resolve their own types.
+    assert {"a", "shared"} <= set(_mod.visible_types("a", corpus))
+    assert {"b", "shared"} <= set(_mod.visible_types("b", corpus))
+
+
+def test_subsumption_index_answers_cross_ontology_queries():
+    corpus = {
+        "base": {"extends": [], "types": {"thing": _info(), "agent": _info(subtype_of=("thing",))}},
+        "org": {"extends": ["base"], "types": {"person": _info(subtype_of=("agent",))}},
+        "eng": {
+            "extends": ["org"],
+            "types": {"engineer": _info(subtype_of=("person",)), "tool": _info(subtype_of=("thing",))},
+        },
+    }
+    index = _mod.SubsumptionIndex(corpus)
+    engineer = index.resolve("eng", "engineer", corpus)
+    thing = index.resolve("eng", "thing", corpus)
+    assert thing == ("base", "thing")
+    assert index.is_subtype(engineer, thing)
+    assert index.is_subtype(engineer, engineer)
+    assert not index.is_subtype(thing, engineer)
+    assert not index.is_subtype(("eng", "tool"), ("base", "agent"))
+    assert index.ancestors(engineer) == [("base", "thing"), ("base", "agent"), ("org", "person")]
+    assert set(index.descendants(thing)) == {
+        ("base", "agent"), ("org", "person"), ("eng", "engineer"), ("eng", "tool")
+    }
+    assert index.cycles == []
+
+
+def test_subsumption_index_finds_every_cycle_in_one_pass():
+    corpus = {
+        "one": {"extends": [], "types": {"a": _info(subtype_of=("b",)), "b": _info(subtype_of=("a",))}},
+        "two": {"extends": [], "types": {"x": _info(subtype_of=("y",)), "y": _info(subtype_of=("x",))}},
+        "ok": {"extends": ["one"], "types": {"c": _info(subtype_of=("a",))}},
+    }
+    index = _mod.SubsumptionIndex(corpus)
+    assert len(index.cycles) == 2
+    assert len(index.cycle_errors("one")) == 1 and len(index.cycle_errors("two")) == 1
+    assert index.cycle_errors("ok") == []
+    assert index.is_subtype(("ok", "c"), ("one", "a"))
+
+
+def test_main_parses_each_ontology_once(monkeypatch, capsys):
+    calls = []
+    real_load = _mod.load_yaml
+
+    def counting_load(path):
+        calls.append(path)
+        return real_load(path)
+
+    monkeypatch.setattr(_mod, "load_yaml", counting_load)
+    monkeypatch.setattr(sys, "argv", ["validate-ontologies.py", "--path", str(FIXTURES)])
+    with pytest.raises(SystemExit):
+        _mod.main()
+    assert sorted(calls) == sorted(FIXTURES.glob("*.ontology.yaml"))
+    assert "subtype_of cannot reference itself" in capsys.readouterr().out
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Tests for ``yaml2jsonld.py --all``: parallel, incremental, atomic conversion.
+
+Run: ``python -m pytest scripts/test_yaml2jsonld.py -q`` from the repo root.
+"""
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import yaml2jsonld  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "test" / "subtype_of"
+
+
+def _corpus(tmp_path: Path) -> Path:
+    corpus = tmp_path / "ontologies"
+    shutil.copytree(FIXTURES, corpus)
+    return corpus
+
+
+def _outputs(corpus: Path) -> dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in sorted(corpus.glob("*.jsonld"))}
+
+
+def test_parallel_all_matches_per_file_conversion(tmp_path, capsys):
+    corpus = _corpus(tmp_path)
+    converted = yaml2jsonld.convert_all_ontologies(corpus, jobs=3)
+    assert len(converted) == 6
+    for path in converted:
+        single = yaml2jsonld.convert_file(path.with_suffix(".yaml"), tmp_path / "single.jsonld")
+        assert path.read_bytes() == single.read_bytes()
+    assert not list(corpus.glob(".*.tmp"))
+
+
+def test_all_skips_unchanged_and_rebuilds_changed(tmp_path, capsys, monkeypatch):
+    corpus = _corpus(tmp_path)
+    yaml2jsonld.convert_all_ontologies(corpus)
+    before = _outputs(corpus)
+    assert yaml2jsonld.convert_all_ontologies(corpus) == []
+
+    (corpus / "valid.ontology.yaml").write_text(
+        (corpus / "valid.ontology.yaml").read_text() + "\n# touched\n"
+    )
+    (corpus / "self.ontology.jsonld").write_text("{}")  # tampered output is rebuilt
+    rebuilt = yaml2jsonld.convert_all_ontologies(corpus)
+    assert sorted(p.name for p in rebuilt) == ["self.ontology.jsonld", "valid.ontology.jsonld"]
+    assert _outputs(corpus) == before
+
+    # A changed context invalidates every output.
+    context = tmp_path / "context.jsonld"
+    context.write_text(json.dumps({"@context": {"mif": "https://example.com/"}}))
+    monkeypatch.setattr(yaml2jsonld, "get_context_path", lambda: context)
+    assert len(yaml2jsonld.convert_all_ontologies(corpus)) == 6
+    assert len(yaml2jsonld.convert_all_ontologies(corpus, force=True)) == 6
+
+
+def test_changed_converter_rebuilds_everything(tmp_path, monkeypatch):
+    corpus = _corpus(tmp_path)
+    yaml2jsonld.convert_all_ontologies(corpus)
+    assert yaml2jsonld.convert_all_ontologies(corpus) == []
+
+    monkeypatch.setattr(yaml2jsonld, "converter_sha256", lambda: "0" * 64)
+    assert len(yaml2jsonld.convert_all_ontologies(corpus)) == 6
+    manifest = json.loads((corpus / yaml2jsonld.MANIFEST_NAME).read_text())
+    assert manifest["converterSha256"] == "0" * 64
+    assert yaml2jsonld.convert_all_ontologies(corpus) == []
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1"])
+def test_jobs_must_be_positive(monkeypatch, capsys, jobs):
+    monkeypatch.setattr(sys, "argv", ["yaml2jsonld.py", "--all", "--jobs", jobs])
+    with pytest.raises(SystemExit) as exit_info:
+        yaml2jsonld.main()
+    assert exit_info.value.code == 2
+    assert f"must be >= 1, got {jobs}" in capsys.readouterr().err
@@ -2,14 +2,12 @@
 """Validate that memory namespaces exist in their declared ontologies."""
 
 import argparse
-import re
 import sys
 from pathlib import Path
 
 import yaml
 
-
-FRONTMATTER_PATTERN = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+import mif_convert  # local module (same scripts/ directory)
 
 
 def load_yaml(yaml_path: Path) -> dict:
@@ -19,15 +17,12 @@ def load_yaml(yaml_path: Path) -> dict:
 
 
 def extract_frontmatter(memory_path: Path) -> dict | None:
-    """Extract YAML frontmatter from a memory file."""
-    content = memory_path.read_text()
-    match = FRONTMATTER_PATTERN.match(content)
-    if not match:
-        return None
+    """Extract YAML frontmatter from a memory file (the body is never read)."""
     try:
-        return yaml.safe_load(match.group(1))
-    except yaml.YAMLError:
+        frontmatter, _ = mif_convert.load_frontmatter(memory_path)
+    except (ValueError, yaml.YAMLError):
         return None
+    return frontmatter
 
 
 def get_ontology_namespaces(ontology: dict) -> set[str]:
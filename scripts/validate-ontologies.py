@@ -2,7 +2,13 @@
 """Validate ontology YAML files: schema conformance via ajv (the repo's JSON Schema
 tool, matching the JSON-LD validation job), plus entity-type subsumption integrity
 (cross-ontology `subtype_of` resolution, acyclicity, substitutability) — graph checks
-no JSON Schema validator can express."""
+no JSON Schema validator can express.
+
+Schema validation runs as one batch: the schema is compiled once, either in-process
+(jsonschema, when installed together with a checker for every ``format`` the schema
+uses) or by a single ajv process over every file, and errors are reported per file.
+Each file is parsed once: the corpus, the schema batch and the per-file checks all
+work from the same documents."""
 
 import argparse
 import json
@@ -22,29 +28,121 @@ def load_yaml(yaml_path: Path) -> dict:
         return yaml.safe_load(f)
 
 
+SCHEMA_VALIDATORS = ["auto", "jsonschema", "ajv"]
+AJV_MISSING = "  - schema: ajv not found on PATH (install: npm i -g ajv-cli ajv-formats)"
+
+
+def _ajv_validate_batch(docs: dict[Path, object], schema_path: Path) -> dict[Path, list[str]]:
+    """Validate every document in ONE ajv process (draft2020, formats): the schema is
+    compiled once, each document is a separate ``-d``. Fail-closed: a missing ajv, or a
+    document ajv gives no verdict for, is reported as an error, never a silent pass."""
+    if not docs:
+        return {}
+    with tempfile.TemporaryDirectory() as tmp:
+        by_file: dict[str, Path] = {}
+        cmd = ["ajv", "validate", "--spec=draft2020", "--strict=false",
+               "-c", "ajv-formats", "--errors=json", "-s", str(schema_path)]
+        for i, (path, data) in enumerate(docs.items()):
+            tmp_file = os.path.join(tmp, f"{i:05d}.json")
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            by_file[tmp_file] = path
+            cmd += ["-d", tmp_file]
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+        except FileNotFoundError:
+            return {path: [AJV_MISSING] for path in docs}
+    return _parse_ajv_output(proc.stdout, proc.stderr, proc.returncode, by_file)
+
+
+def _parse_ajv_output(
+    stdout: str, stderr: str, returncode: int, by_file: dict[str, Path]
+) -> dict[Path, list[str]]:
+    """Findings per document from ajv-cli's ``validate --errors=json`` output.
+
+    ajv prints ``<file> valid`` on stdout, or ``<file> invalid`` on stderr followed by
+    that file's error array as indented JSON (one object per error)."""
+    results: dict[Path, list[str]] = {path: [] for path in by_file.values()}
+    verdicts: dict[Path, bool] = {}
+    blocks: dict[Path, list[str]] = {}
+    current = None
+    for ln in (stdout + "\n" + stderr).splitlines():
+        name, _, verdict = ln.strip().rpartition(" ")
+        if name in by_file and verdict in ("valid", "invalid"):
+            current = by_file[name]
+            verdicts[current] = verdict == "valid"
+            blocks[current] = []
+        elif current is not None and not verdicts[current]:
+            blocks[current].append(ln)
+    for path, lines in blocks.items():
+        text = "\n".join(lines).strip()
+        if verdicts[path] or not text:
+            continue
+        try:
+            errs = json.loads(text)
+        except ValueError:
+            results[path] = [f"  - schema: {ln.strip()}" for ln in lines if ln.strip()]
+            continue
+        for err in errs if isinstance(errs, list) else [errs]:
+            where = (err.get("instancePath") or "/") if isinstance(err, dict) else ""
+            msg = err.get("message", err) if isinstance(err, dict) else err
+            results[path].append(f"  - schema: {where} {msg}")
+    out = (stderr or stdout or "").strip()
+    for path in results:
+        if path not in verdicts:
+            # No per-file verdict (e.g. the schema itself failed to compile).
+            results[path] = [f"  - schema: {ln}" for ln in out.splitlines() if ln.strip()][:20] or [
+                f"  - schema: ajv exited {returncode} without a verdict for this file"
+            ]
+        elif not verdicts[path] and not results[path]:
+            results[path] = ["  - schema: ajv reported the file invalid without errors"]
+        results[path] = results[path][:20]
+    return results
+
+
+def _jsonschema_validate_batch(docs: dict[Path, object], schema_path: Path) -> dict[Path, list[str]]:
+    """Validate every document in-process against ``schema_path``, compiled once."""
+    import mif_schema  # local module (same scripts/ directory)
+
+    validator = mif_schema.validator(schema_path)
+    results: dict[Path, list[str]] = {}
+    for path, data in docs.items():
+        errs = sorted(validator.iter_errors(data), key=lambda e: e.json_path)
+        results[path] = [f"  - schema: {e.json_path} {e.message}" for e in errs][:20]
+    return results
+
+
+def _jsonschema_unusable(schema_path: Path) -> str | None:
+    """Why in-process jsonschema cannot enforce ``schema_path`` fully, or None."""
+    try:
+        import mif_schema  # local module (same scripts/ directory)
+    except ImportError:
+        return "jsonschema not installed (install: pip install 'jsonschema[format]')"
+    return mif_schema.unusable_reason((schema_path,))
+
+
+def schema_validate_batch(
+    docs: dict[Path, object], schema_path: Path, validator: str = "auto"
+) -> dict[Path, list[str]]:
+    """Schema errors per document, compiling the schema once for the whole batch.
+
+    ``validator`` is ``jsonschema`` (in-process), ``ajv`` (one ajv process) or ``auto``
+    (jsonschema when it is installed with a checker for every format the schema uses,
+    else ajv). Fail-closed: a validator that is missing, or jsonschema without the
+    format checkers (it would pass any value for those formats), reports every
+    document as an error."""
+    unusable = _jsonschema_unusable(schema_path) if validator != "ajv" else None
+    if validator == "jsonschema" or (validator == "auto" and unusable is None):
+        if unusable is not None:
+            return {path: [f"  - schema: {unusable}"] for path in docs}
+        return _jsonschema_validate_batch(docs, schema_path)
+    return _ajv_validate_batch(docs, schema_path)
+
+
 def _ajv_validate(data: dict, schema_path: Path) -> list[str]:
     """Validate `data` against `schema_path` with ajv (draft2020, formats). Fail-closed:
     a missing ajv is reported as an error, never a silent pass."""
-    fd, tmp = tempfile.mkstemp(suffix=".json")
-    try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f)
-        proc = subprocess.run(
-            ["ajv", "validate", "--spec=draft2020", "--strict=false",
-             "-c", "ajv-formats", "-s", str(schema_path), "-d", tmp],
-            capture_output=True, text=True,
-        )
-        if proc.returncode == 0:
-            return []
-        out = (proc.stderr or proc.stdout or "").strip()
-        return [f"  - schema: {ln}" for ln in out.splitlines() if ln.strip()][:20]
-    except FileNotFoundError:
-        return ["  - schema: ajv not found on PATH (install: npm i -g ajv-cli ajv-formats)"]
-    finally:
-        try:
-            os.unlink(tmp)
-        except OSError:
-            pass
+    return _ajv_validate_batch({Path("<data>"): data}, schema_path)[Path("<data>")]
 
 
 def _entity_types(ontology: dict) -> list[dict]:
@@ -84,45 +182,97 @@ def _type_info(ontology: dict) -> dict[str, dict]:
 
 
 def load_ontology_corpus(ontology_dirs: list[Path]) -> dict[str, dict]:
-    """Load every ontology YAML keyed by its id: {id: {'extends': [...], 'types': {name: info}}}."""
-    corpus: dict[str, dict] = {}
+    """Load every ontology YAML under ``ontology_dirs`` into a corpus (``corpus_from_docs``)."""
+    docs = {}
     for d in ontology_dirs:
         if not d.exists():
             continue
         for f in d.glob("*.ontology.yaml"):
             try:
-                data = load_yaml(f)
+                docs[f] = load_yaml(f)
             except Exception:
                 continue
-            if not isinstance(data, dict):
-                continue
-            ob = data.get("ontology")
-            if not isinstance(ob, dict):
-                continue
-            oid = ob.get("id")
-            if not isinstance(oid, str) or not oid:
-                continue
-            ext = ob.get("extends") or []
-            ext = ext if isinstance(ext, list) else [ext]
-            corpus[oid] = {
-                "extends": [e for e in ext if isinstance(e, str)],
-                "types": _type_info(data),
-            }
+    return corpus_from_docs(docs)
+
+
+def corpus_from_docs(docs: dict[Path, object]) -> dict[str, dict]:
+    """Key already-parsed ontology documents by id: {id: {'extends': [...], 'types': {name: info}}},
+    with lineage, visible types and `extends` cycles precomputed (`compile_lineage`)."""
+    corpus: dict[str, dict] = {}
+    for data in docs.values():
+        if not isinstance(data, dict):
+            continue
+        ob = data.get("ontology")
+        if not isinstance(ob, dict):
+            continue
+        oid = ob.get("id")
+        if not isinstance(oid, str) or not oid:
+            continue
+        ext = ob.get("extends") or []
+        ext = ext if isinstance(ext, list) else [ext]
+        corpus[oid] = {
+            "extends": [e for e in ext if isinstance(e, str)],
+            "types": _type_info(data),
+        }
+    compile_lineage(corpus)
     return corpus
 
 
-def visible_types(oid: str, corpus: dict[str, dict], _seen: set | None = None) -> dict[str, dict]:
+def _extends_order(corpus: dict[str, dict]) -> tuple[list[str], list[list[str]]]:
+    """Ontology ids ordered so every ancestor precedes its descendants, plus each
+    `extends` cycle found. A cycle is broken at its closing edge and the sort retried,
+    so one bad ontology can't stop the rest of the corpus from resolving."""
+    graph = {oid: [p for p in entry["extends"] if p in corpus] for oid, entry in corpus.items()}
+    cycles: list[list[str]] = []
+    while True:
+        try:
+            return list(TopologicalSorter(graph).static_order()), cycles
+        except CycleError as e:
+            # Each node of the reported cycle is a parent (predecessor) of the next.
+            cycle = e.args[1]
+            cycles.append(list(reversed(cycle)))
+            graph[cycle[-1]] = [p for p in graph[cycle[-1]] if p != cycle[-2]]
+
+
+def compile_lineage(corpus: dict[str, dict]) -> None:
+    """Precompute, in place and in one topological pass, each ontology's lineage (its
+    transitive `extends` closure, ancestors first, itself last), its visible-type table
+    (plus the ontology each visible name resolves to, `owners`) and any `extends` cycles
+    it is on, so `visible_types` is a dict lookup."""
+    order, cycles = _extends_order(corpus)
+    for entry in corpus.values():
+        entry["extends_cycles"] = []
+        entry.pop("lineage", None)
+    for cycle in cycles:
+        for oid in set(cycle):
+            corpus[oid]["extends_cycles"].append(cycle)
+    for oid in order:
+        entry = corpus[oid]
+        lineage: dict[str, None] = {}
+        for parent in entry["extends"]:
+            if parent in corpus and parent != oid and "lineage" in corpus[parent]:
+                lineage.update(dict.fromkeys(corpus[parent]["lineage"]))
+        lineage.pop(oid, None)
+        lineage[oid] = None
+        entry["lineage"] = list(lineage)
+        visible: dict[str, dict] = {}
+        owners: dict[str, str] = {}
+        for ancestor in entry["lineage"]:
+            visible.update(corpus[ancestor]["types"])
+            owners.update(dict.fromkeys(corpus[ancestor]["types"], ancestor))
+        entry["visible"] = visible
+        entry["owners"] = owners
+
+
+def visible_types(oid: str, corpus: dict[str, dict]) -> dict[str, dict]:
     """Type infos visible to ontology `oid`: its own ∪ those of every ontology it
-    transitively `extends`. Own definitions win on a name collision."""
-    _seen = _seen if _seen is not None else set()
-    if oid in _seen or oid not in corpus:
+    transitively `extends`. Own definitions win on a name collision, and among ancestors
+    the later one in the lineage. Precomputed by `compile_lineage`."""
+    if oid not in corpus:
         return {}
-    _seen.add(oid)
-    merged: dict[str, dict] = {}
-    for parent in corpus[oid]["extends"]:
-        merged.update(visible_types(parent, corpus, _seen))
-    merged.update(corpus[oid]["types"])
-    return merged
+    if "visible" not in corpus[oid]:
+        compile_lineage(corpus)
+    return corpus[oid]["visible"]
 
 
 def _subtype_cycles(graph: dict[str, dict]) -> list[str]:
@@ -141,11 +291,95 @@ def _subtype_cycles(graph: dict[str, dict]) -> list[str]:
     return []
 
 
-def check_subtype_of(ontology: dict, visible: dict[str, dict]) -> list[str]:
+def _bits(mask: int):
+    """Indices of the set bits of `mask`, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class SubsumptionIndex:
+    """Compiled corpus-wide `subtype_of` index.
+
+    Every entity type is keyed `(ontology id, type name)` and given a dense integer id;
+    a `subtype_of` parent resolves through the declaring ontology's visible types (its own
+    or an ancestor's). Each type carries an ancestor and a descendant bitset, so
+    `is_subtype` is O(1) and `ancestors` / `descendants` are O(k) in the result size.
+    Cycle detection runs once over the whole graph (`cycles`); a cycle is broken at its
+    closing edge so the closure of every other type is still exact.
+    """
+
+    def __init__(self, corpus: dict[str, dict]) -> None:
+        if any("owners" not in entry for entry in corpus.values()):
+            compile_lineage(corpus)
+        self.keys: list[tuple[str, str]] = [
+            (oid, name) for oid in sorted(corpus) for name in corpus[oid]["types"]
+        ]
+        self.ids = {key: i for i, key in enumerate(self.keys)}
+        graph: dict[int, list[int]] = {}
+        for i, (oid, name) in enumerate(self.keys):
+            owners = corpus[oid]["owners"]
+            parents = corpus[oid]["types"][name]["subtype_of"]
+            # Self-references are reported by check_subtype_of, not as cycles.
+            graph[i] = [
+                self.ids[(owners[p], p)] for p in parents if p in owners and p != name
+            ]
+        self.cycles: list[list[tuple[str, str]]] = []
+        while True:
+            try:
+                order = list(TopologicalSorter(graph).static_order())
+                break
+            except CycleError as e:
+                cycle = e.args[1]
+                self.cycles.append([self.keys[i] for i in cycle])
+                graph[cycle[-1]] = [p for p in graph[cycle[-1]] if p != cycle[-2]]
+        self._ancestors = [0] * len(self.keys)
+        for i in order:
+            for p in graph[i]:
+                self._ancestors[i] |= self._ancestors[p] | (1 << p)
+        self._descendants = [0] * len(self.keys)
+        for i in reversed(order):
+            for p in graph[i]:
+                self._descendants[p] |= self._descendants[i] | (1 << i)
+
+    def resolve(self, oid: str, name: str, corpus: dict[str, dict]) -> tuple[str, str] | None:
+        """The key of type `name` as seen from ontology `oid` (own or inherited)."""
+        owner = corpus.get(oid, {}).get("owners", {}).get(name)
+        return None if owner is None else (owner, name)
+
+    def is_subtype(self, sub: tuple[str, str], sup: tuple[str, str]) -> bool:
+        """True if `sub` is `sup` or transitively `subtype_of` it (substitutable for it)."""
+        i, j = self.ids.get(sub), self.ids.get(sup)
+        if i is None or j is None:
+            return False
+        return i == j or bool(self._ancestors[i] >> j & 1)
+
+    def ancestors(self, key: tuple[str, str]) -> list[tuple[str, str]]:
+        i = self.ids.get(key)
+        return [] if i is None else [self.keys[a] for a in _bits(self._ancestors[i])]
+
+    def descendants(self, key: tuple[str, str]) -> list[tuple[str, str]]:
+        i = self.ids.get(key)
+        return [] if i is None else [self.keys[d] for d in _bits(self._descendants[i])]
+
+    def cycle_errors(self, oid: str) -> list[str]:
+        """Findings for every `subtype_of` cycle through a type declared by `oid`."""
+        return [
+            f"  - subtype_of cycle: {' -> '.join(name for _, name in cycle)}"
+            for cycle in self.cycles
+            if any(owner == oid for owner, _ in cycle)
+        ]
+
+
+def check_subtype_of(
+    ontology: dict, visible: dict[str, dict], detect_cycles: bool = True
+) -> list[str]:
     """Entity-type subsumption integrity for one ontology, resolved against `visible`
     (its own types ∪ those of every ontology it extends): every `subtype_of` parent must
     resolve to a visible type, no type may be its own subtype, a subtype's `required` set
     must include each parent's (substitutability), and the graph must be acyclic.
+    ``detect_cycles=False`` leaves acyclicity to a corpus-wide ``SubsumptionIndex``.
     """
     errors: list[str] = []
     local = _type_info(ontology)
@@ -171,22 +405,53 @@ def check_subtype_of(ontology: dict, visible: dict[str, dict]) -> list[str]:
     # declares it, not re-reported by every descendant. (extends is one-way, so a cycle
     # cannot span the ancestor boundary; an ancestor-internal cycle fails when the
     # ancestor is itself validated.)
-    errors.extend(_subtype_cycles(local))
+    if detect_cycles:
+        errors.extend(_subtype_cycles(local))
     return errors
 
 
-def validate_ontology(ontology_path: Path, schema_path: Path, corpus: dict[str, dict]) -> list[str]:
-    """Validate a single ontology file against the schema (ajv) and subsumption integrity."""
-    errors = []
+def validate_ontology(
+    ontology_path: Path,
+    schema_path: Path,
+    corpus: dict[str, dict],
+    schema_errors: list[str] | None = None,
+    index: SubsumptionIndex | None = None,
+) -> list[str]:
+    """Validate a single ontology file against the schema and subsumption integrity.
+    ``schema_errors`` are the file's findings from a ``schema_validate_batch`` run; when
+    omitted the file is schema-checked on its own with ajv. With ``index``, subtype_of
+    cycles come from its single corpus-wide pass instead of a per-file one."""
     try:
         ontology = load_yaml(ontology_path)
-        errors.extend(_ajv_validate(ontology, schema_path))
+    except yaml.YAMLError as e:
+        return [f"  - YAML parse error: {e}"]
+    except Exception as e:
+        return [f"  - Unexpected error: {e}"]
+    if schema_errors is None:
+        schema_errors = _ajv_validate(ontology, schema_path)
+    return check_ontology(ontology, corpus, schema_errors, index)
+
+
+def check_ontology(
+    ontology: object,
+    corpus: dict[str, dict],
+    schema_errors: list[str],
+    index: SubsumptionIndex | None = None,
+) -> list[str]:
+    """``validate_ontology`` for an already-parsed document and its schema findings."""
+    errors = list(schema_errors)
+    try:
         ob = ontology.get("ontology") if isinstance(ontology, dict) else None
         oid = ob.get("id") if isinstance(ob, dict) else None
-        visible = visible_types(oid, corpus) if isinstance(oid, str) and oid else _type_info(ontology)
-        errors.extend(check_subtype_of(ontology, visible))
-    except yaml.YAMLError as e:
-        errors.append(f"  - YAML parse error: {e}")
+        known = isinstance(oid, str) and oid in corpus
+        visible = visible_types(oid, corpus) if known else _type_info(ontology)
+        if known:
+            for cycle in corpus[oid].get("extends_cycles", []):
+                errors.append(f"  - extends cycle: {' -> '.join(cycle)}")
+        corpus_cycles = index is not None and known
+        errors.extend(check_subtype_of(ontology, visible, detect_cycles=not corpus_cycles))
+        if corpus_cycles:
+            errors.extend(index.cycle_errors(oid))
     except Exception as e:
         errors.append(f"  - Unexpected error: {e}")
     return errors
@@ -210,6 +475,16 @@ def main():
             "of relying on the default."
         ),
     )
+    parser.add_argument(
+        "--validator",
+        choices=SCHEMA_VALIDATORS,
+        default="auto",
+        help=(
+            "schema validator for the whole batch: in-process jsonschema, one ajv process, "
+            "or auto (jsonschema when installed with its format checkers, else ajv). "
+            "Either way the schema is compiled once; with neither usable every file fails."
+        ),
+    )
     args = parser.parse_args()
 
     repo_root = Path(__file__).parent.parent
@@ -226,22 +501,40 @@ def main():
         print(f"ERROR: Schema not found: {schema_path}")
         sys.exit(1)
 
-    corpus = load_ontology_corpus(ontology_dirs)
     all_errors = {}
-    total_files = 0
 
-    for ontology_dir in ontology_dirs:
-        if not ontology_dir.exists():
-            continue
-        for ontology_file in ontology_dir.glob("*.ontology.yaml"):
-            total_files += 1
-            errors = validate_ontology(ontology_file, schema_path, corpus)
-            if errors:
-                try:
-                    rel_path = ontology_file.relative_to(repo_root)
-                except ValueError:
-                    rel_path = ontology_file
-                all_errors[str(rel_path)] = errors
+    ontology_files = [
+        f for d in ontology_dirs if d.exists() for f in d.glob("*.ontology.yaml")
+    ]
+    total_files = len(ontology_files)
+    # Each file is parsed once; the corpus, the schema batch and the per-file
+    # checks all work from these documents.
+    docs = {}
+    parse_errors = {}
+    for ontology_file in ontology_files:
+        try:
+            docs[ontology_file] = load_yaml(ontology_file)
+        except yaml.YAMLError as e:
+            parse_errors[ontology_file] = [f"  - YAML parse error: {e}"]
+        except Exception as e:
+            parse_errors[ontology_file] = [f"  - Unexpected error: {e}"]
+    corpus = corpus_from_docs(docs)
+    batch = schema_validate_batch(docs, schema_path, args.validator)
+    index = SubsumptionIndex(corpus)
+
+    for ontology_file in ontology_files:
+        if ontology_file in parse_errors:
+            errors = parse_errors[ontology_file]
+        else:
+            errors = check_ontology(
+                docs[ontology_file], corpus, batch.get(ontology_file, []), index
+            )
+        if errors:
+            try:
+                rel_path = ontology_file.relative_to(repo_root)
+            except ValueError:
+                rel_path = ontology_file
+            all_errors[str(rel_path)] = errors
 
     if total_files == 0:
         # Fail closed: a silent "0 files, 0 errors" pass is indistinguishable
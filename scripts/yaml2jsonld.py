@@ -5,16 +5,28 @@ YAML to JSON-LD Converter for MIF Ontologies
 Converts ontology YAML files to JSON-LD format using the MIF context.
 Generates semantic web compatible output for interoperability.
 
+`--all` loads the context once, converts files in parallel (`--jobs`) and skips
+every ontology whose YAML and context are unchanged since the last build, as
+recorded in a manifest (`.yaml2jsonld-manifest.json`) in the scanned directory.
+The manifest is keyed to a hash of this script, so editing the converter
+rebuilds everything, as does `--force`. Outputs are written atomically (temp file +
+rename), so an interrupted run never leaves a half-written `.jsonld`.
+
 Usage:
     python yaml2jsonld.py <input.yaml> [output.jsonld]
     python yaml2jsonld.py --all  # Convert all ontologies in ontologies/
+    python yaml2jsonld.py --all --path <dir> [--jobs N] [--force]
 """
 
 import argparse
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import yaml
@@ -22,6 +34,11 @@ except ImportError:
     print("Error: PyYAML required. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+import mif_convert  # local module (same scripts/ directory)
+
+
+MANIFEST_NAME = ".yaml2jsonld-manifest.json"
+
 
 def get_context_path() -> Path:
     """Get path to the JSON-LD context file."""
@@ -156,9 +173,13 @@ def transform_discovery_pattern(pattern: Dict[str, Any], index: int) -> Dict[str
     return result
 
 
-def yaml_to_jsonld(yaml_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert YAML ontology data to JSON-LD format."""
-    context = load_context()
+def yaml_to_jsonld(yaml_data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Convert YAML ontology data to JSON-LD format.
+
+    Pass a preloaded `context` to avoid re-reading the context file per call.
+    """
+    if context is None:
+        context = load_context()
 
     # Build the JSON-LD document
     jsonld = {
@@ -225,36 +246,100 @@ def yaml_to_jsonld(yaml_data: Dict[str, Any]) -> Dict[str, Any]:
     return jsonld
 
 
-def convert_file(input_path: Path, output_path: Optional[Path] = None) -> Path:
-    """Convert a single YAML file to JSON-LD."""
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write `data` to `path` via a temp file in the same directory and a rename."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
-    # Default output path
-    if output_path is None:
-        output_path = input_path.with_suffix(".jsonld")
 
-    # Load YAML
+def _render(input_path: Path, context: Optional[Dict[str, Any]] = None) -> bytes:
+    """The JSON-LD bytes for one YAML ontology file."""
     with open(input_path) as f:
         yaml_data = yaml.safe_load(f)
 
     if not yaml_data:
         raise ValueError(f"Empty or invalid YAML file: {input_path}")
 
-    # Convert to JSON-LD
-    jsonld_data = yaml_to_jsonld(yaml_data)
+    jsonld_data = yaml_to_jsonld(yaml_data, context)
+    return json.dumps(jsonld_data, indent=2).encode("utf-8")
+
 
-    # Write output
-    with open(output_path, "w") as f:
-        json.dump(jsonld_data, f, indent=2)
+def convert_file(
+    input_path: Path, output_path: Optional[Path] = None, context: Optional[Dict[str, Any]] = None
+) -> Path:
+    """Convert a single YAML file to JSON-LD (written atomically)."""
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
 
+    # Default output path
+    if output_path is None:
+        output_path = input_path.with_suffix(".jsonld")
+
+    write_atomic(output_path, _render(input_path, context))
     return output_path
 
 
-def convert_all_ontologies(ontologies_dir: Path | None = None) -> list:
+def _convert_one(yaml_file: Path, context: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Worker: convert one file. Returns (output sha256, None) or (None, error)."""
+    try:
+        data = _render(yaml_file, context)
+        write_atomic(yaml_file.with_suffix(".jsonld"), data)
+        return _sha256(data), None
+    except Exception as e:
+        return None, str(e)
+
+
+def converter_sha256() -> str:
+    """Hash of this script; a manifest written by any other converter is discarded."""
+    return _sha256(Path(__file__).read_bytes())
+
+
+def load_manifest(ontologies_dir: Path) -> Dict[str, Dict[str, str]]:
+    path = ontologies_dir / MANIFEST_NAME
+    try:
+        data = json.loads(path.read_text())
+        if data.get("converterSha256") != converter_sha256():
+            return {}
+        return data.get("outputs", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def write_manifest(ontologies_dir: Path, outputs: Dict[str, Dict[str, str]]) -> None:
+    manifest = {"converterSha256": converter_sha256(), "outputs": dict(sorted(outputs.items()))}
+    data = json.dumps(manifest, indent=2) + "\n"
+    write_atomic(ontologies_dir / MANIFEST_NAME, data.encode("utf-8"))
+
+
+def _is_current(entry: Optional[Dict[str, str]], yaml_sha: str, context_sha: str, output: Path) -> bool:
+    if not entry or entry.get("yamlSha256") != yaml_sha or entry.get("contextSha256") != context_sha:
+        return False
+    try:
+        return _sha256(output.read_bytes()) == entry.get("outputSha256")
+    except OSError:
+        return False
+
+
+def convert_all_ontologies(
+    ontologies_dir: Path | None = None, jobs: int = 1, force: bool = False
+) -> list:
     """Convert all ontology YAML files under `ontologies_dir` (default: this repo's
     own ontologies/, which no longer exists since ontology content moved to the
-    ontologies repo -- ADR-018)."""
+    ontologies repo -- ADR-018).
+
+    The context is loaded once; files whose YAML and context are unchanged since
+    the last run of this same converter (per the manifest) are skipped unless
+    `force`. Returns the
+    outputs written by this run."""
     if ontologies_dir is None:
         script_dir = Path(__file__).parent
         ontologies_dir = script_dir.parent / "ontologies"
@@ -263,17 +348,49 @@ def convert_all_ontologies(ontologies_dir: Path | None = None) -> list:
         print(f"Ontologies directory not found: {ontologies_dir}", file=sys.stderr)
         return []
 
-    converted = []
+    context_bytes = get_context_path().read_bytes()
+    context = json.loads(context_bytes)
+    context_sha = _sha256(context_bytes)
+    previous = {} if force else load_manifest(ontologies_dir)
+    manifest: Dict[str, Dict[str, str]] = {}
 
     # Find all .ontology.yaml files
-    for yaml_file in ontologies_dir.rglob("*.ontology.yaml"):
-        try:
-            output_path = convert_file(yaml_file)
-            print(f"Converted: {yaml_file.name} -> {output_path.name}")
-            converted.append(output_path)
-        except Exception as e:
-            print(f"Error converting {yaml_file}: {e}", file=sys.stderr)
+    stale: List[Path] = []
+    yaml_shas: Dict[Path, str] = {}
+    for yaml_file in sorted(ontologies_dir.rglob("*.ontology.yaml")):
+        key = yaml_file.relative_to(ontologies_dir).as_posix()
+        yaml_shas[yaml_file] = _sha256(yaml_file.read_bytes())
+        entry = previous.get(key)
+        if _is_current(entry, yaml_shas[yaml_file], context_sha, yaml_file.with_suffix(".jsonld")):
+            manifest[key] = entry
+        else:
+            stale.append(yaml_file)
+
+    worker = partial(_convert_one, context=context)
+    if jobs > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(worker, stale, chunksize=max(1, len(stale) // (jobs * 4))))
+    else:
+        results = [worker(yaml_file) for yaml_file in stale]
 
+    converted = []
+    for yaml_file, (output_sha, error) in zip(stale, results):
+        output_path = yaml_file.with_suffix(".jsonld")
+        if error is not None:
+            print(f"Error converting {yaml_file}: {error}", file=sys.stderr)
+            continue
+        print(f"Converted: {yaml_file.name} -> {output_path.name}")
+        converted.append(output_path)
+        manifest[yaml_file.relative_to(ontologies_dir).as_posix()] = {
+            "yamlSha256": yaml_shas[yaml_file],
+            "contextSha256": context_sha,
+            "outputSha256": output_sha,
+        }
+
+    unchanged = len(yaml_shas) - len(stale)
+    if unchanged:
+        print(f"Unchanged: {unchanged} file(s) skipped")
+    write_manifest(ontologies_dir, manifest)
     return converted
 
 
@@ -302,11 +419,17 @@ def main():
         default=None,
         help="Directory to convert all *.ontology.yaml files from, used with --all"
     )
+    mif_convert.add_jobs_argument(parser)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --all, reconvert every file even if unchanged since the last build"
+    )
 
     args = parser.parse_args()
 
     if args.all:
-        converted = convert_all_ontologies(args.path)
+        converted = convert_all_ontologies(args.path, jobs=args.jobs, force=args.force)
         print(f"\nConverted {len(converted)} files")
         sys.exit(0)
 